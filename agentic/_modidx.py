@@ -9,6 +9,8 @@ d = { 'settings': { 'branch': 'main',
                                                                               'agentic/agent/debater.py'),
                                        'agentic.agent.debater.DebateAgent.__init__': ( 'buddy/backend/agents/debater.html#debateagent.__init__',
                                                                                        'agentic/agent/debater.py'),
+                                       'agentic.agent.debater.DebateAgent._generate': ( 'buddy/backend/agents/debater.html#debateagent._generate',
+                                                                                        'agentic/agent/debater.py'),
                                        'agentic.agent.debater.DebateAgent.final_verdict': ( 'buddy/backend/agents/debater.html#debateagent.final_verdict',
                                                                                             'agentic/agent/debater.py'),
                                        'agentic.agent.debater.DebateAgent.opening_statement': ( 'buddy/backend/agents/debater.html#debateagent.opening_statement',
@@ -19,34 +21,100 @@ d = { 'settings': { 'branch': 'main',
                                                                                'agentic/agent/debater.py'),
                                        'agentic.agent.debater.DebateRole': ( 'buddy/backend/agents/debater.html#debaterole',
                                                                              'agentic/agent/debater.py'),
+                                       'agentic.agent.debater.DebateTranscript': ( 'buddy/backend/agents/debater.html#debatetranscript',
+                                                                                   'agentic/agent/debater.py'),
+                                       'agentic.agent.debater.DebateTranscript.__init__': ( 'buddy/backend/agents/debater.html#debatetranscript.__init__',
+                                                                                            'agentic/agent/debater.py'),
+                                       'agentic.agent.debater.DebateTranscript.add': ( 'buddy/backend/agents/debater.html#debatetranscript.add',
+                                                                                       'agentic/agent/debater.py'),
+                                       'agentic.agent.debater.DebateTranscript.digest': ( 'buddy/backend/agents/debater.html#debatetranscript.digest',
+                                                                                          'agentic/agent/debater.py'),
+                                       'agentic.agent.debater.DebateTranscript.render': ( 'buddy/backend/agents/debater.html#debatetranscript.render',
+                                                                                          'agentic/agent/debater.py'),
+                                       'agentic.agent.debater.DebateTranscript.summary': ( 'buddy/backend/agents/debater.html#debatetranscript.summary',
+                                                                                           'agentic/agent/debater.py'),
+                                       'agentic.agent.debater.StatementDigest': ( 'buddy/backend/agents/debater.html#statementdigest',
+                                                                                  'agentic/agent/debater.py'),
+                                       'agentic.agent.debater.StatementDigest.render': ( 'buddy/backend/agents/debater.html#statementdigest.render',
+                                                                                         'agentic/agent/debater.py'),
+                                       'agentic.agent.debater._run_turns': ( 'buddy/backend/agents/debater.html#_run_turns',
+                                                                             'agentic/agent/debater.py'),
                                        'agentic.agent.debater.create_debate': ( 'buddy/backend/agents/debater.html#create_debate',
                                                                                 'agentic/agent/debater.py')},
+            'agentic.agent.decisions': { 'agentic.agent.decisions.CachedDecision': ( 'buddy/backend/agents/decisions.html#cacheddecision',
+                                                                                     'agentic/agent/decisions.py'),
+                                         'agentic.agent.decisions.DecisionCache': ( 'buddy/backend/agents/decisions.html#decisioncache',
+                                                                                    'agentic/agent/decisions.py'),
+                                         'agentic.agent.decisions.DecisionCache.__init__': ( 'buddy/backend/agents/decisions.html#decisioncache.__init__',
+                                                                                             'agentic/agent/decisions.py'),
+                                         'agentic.agent.decisions.DecisionCache._connect': ( 'buddy/backend/agents/decisions.html#decisioncache._connect',
+                                                                                             'agentic/agent/decisions.py'),
+                                         'agentic.agent.decisions.DecisionCache.invalidate': ( 'buddy/backend/agents/decisions.html#decisioncache.invalidate',
+                                                                                               'agentic/agent/decisions.py'),
+                                         'agentic.agent.decisions.DecisionCache.lookup': ( 'buddy/backend/agents/decisions.html#decisioncache.lookup',
+                                                                                           'agentic/agent/decisions.py'),
+                                         'agentic.agent.decisions.DecisionCache.purge_expired': ( 'buddy/backend/agents/decisions.html#decisioncache.purge_expired',
+                                                                                                  'agentic/agent/decisions.py'),
+                                         'agentic.agent.decisions.DecisionCache.stats': ( 'buddy/backend/agents/decisions.html#decisioncache.stats',
+                                                                                          'agentic/agent/decisions.py'),
+                                         'agentic.agent.decisions.DecisionCache.store': ( 'buddy/backend/agents/decisions.html#decisioncache.store',
+                                                                                          'agentic/agent/decisions.py'),
+                                         'agentic.agent.decisions.MinHasher': ( 'buddy/backend/agents/decisions.html#minhasher',
+                                                                                'agentic/agent/decisions.py'),
+                                         'agentic.agent.decisions.MinHasher.__init__': ( 'buddy/backend/agents/decisions.html#minhasher.__init__',
+                                                                                         'agentic/agent/decisions.py'),
+                                         'agentic.agent.decisions.MinHasher.shingles': ( 'buddy/backend/agents/decisions.html#minhasher.shingles',
+                                                                                         'agentic/agent/decisions.py'),
+                                         'agentic.agent.decisions.MinHasher.signature': ( 'buddy/backend/agents/decisions.html#minhasher.signature',
+                                                                                          'agentic/agent/decisions.py'),
+                                         'agentic.agent.decisions.MinHasher.similarity': ( 'buddy/backend/agents/decisions.html#minhasher.similarity',
+                                                                                           'agentic/agent/decisions.py'),
+                                         'agentic.agent.decisions.normalize_topic': ( 'buddy/backend/agents/decisions.html#normalize_topic',
+                                                                                      'agentic/agent/decisions.py')},
             'agentic.agent.introspector': { 'agentic.agent.introspector.IntrospectAgent': ( 'buddy/backend/agents/introspector.html#introspectagent',
                                                                                             'agentic/agent/introspector.py'),
                                             'agentic.agent.introspector.IntrospectAgent.__init__': ( 'buddy/backend/agents/introspector.html#introspectagent.__init__',
                                                                                                      'agentic/agent/introspector.py'),
+                                            'agentic.agent.introspector.IntrospectAgent._clip': ( 'buddy/backend/agents/introspector.html#introspectagent._clip',
+                                                                                                  'agentic/agent/introspector.py'),
                                             'agentic.agent.introspector.IntrospectAgent.evaluate_execution': ( 'buddy/backend/agents/introspector.html#introspectagent.evaluate_execution',
                                                                                                                'agentic/agent/introspector.py'),
+                                            'agentic.agent.introspector.IntrospectAgent.evaluate_steps': ( 'buddy/backend/agents/introspector.html#introspectagent.evaluate_steps',
+                                                                                                           'agentic/agent/introspector.py'),
                                             'agentic.agent.introspector.create_introspection': ( 'buddy/backend/agents/introspector.html#create_introspection',
                                                                                                  'agentic/agent/introspector.py')},
             'agentic.agent.planner.analyzier': { 'agentic.agent.planner.analyzier.AgentTaskAnalyzer': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer',
                                                                                                         'agentic/agent/planner/analyzier.py'),
                                                  'agentic.agent.planner.analyzier.AgentTaskAnalyzer.__init__': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer.__init__',
                                                                                                                  'agentic/agent/planner/analyzier.py'),
+                                                 'agentic.agent.planner.analyzier.AgentTaskAnalyzer._analyze_concurrently': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._analyze_concurrently',
+                                                                                                                              'agentic/agent/planner/analyzier.py'),
                                                  'agentic.agent.planner.analyzier.AgentTaskAnalyzer._assess_complexity': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._assess_complexity',
                                                                                                                            'agentic/agent/planner/analyzier.py'),
+                                                 'agentic.agent.planner.analyzier.AgentTaskAnalyzer._build_execution_plan': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._build_execution_plan',
+                                                                                                                              'agentic/agent/planner/analyzier.py'),
                                                  'agentic.agent.planner.analyzier.AgentTaskAnalyzer._call_llm': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._call_llm',
                                                                                                                   'agentic/agent/planner/analyzier.py'),
-                                                 'agentic.agent.planner.analyzier.AgentTaskAnalyzer._clean_json': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._clean_json',
-                                                                                                                    'agentic/agent/planner/analyzier.py'),
+                                                 'agentic.agent.planner.analyzier.AgentTaskAnalyzer._call_llm_json': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._call_llm_json',
+                                                                                                                       'agentic/agent/planner/analyzier.py'),
+                                                 'agentic.agent.planner.analyzier.AgentTaskAnalyzer._cancelled': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._cancelled',
+                                                                                                                   'agentic/agent/planner/analyzier.py'),
                                                  'agentic.agent.planner.analyzier.AgentTaskAnalyzer._create_fallback_result': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._create_fallback_result',
                                                                                                                                 'agentic/agent/planner/analyzier.py'),
                                                  'agentic.agent.planner.analyzier.AgentTaskAnalyzer._create_simple_task': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._create_simple_task',
                                                                                                                             'agentic/agent/planner/analyzier.py'),
+                                                 'agentic.agent.planner.analyzier.AgentTaskAnalyzer._current_agent': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._current_agent',
+                                                                                                                       'agentic/agent/planner/analyzier.py'),
                                                  'agentic.agent.planner.analyzier.AgentTaskAnalyzer._decompose_tasks': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._decompose_tasks',
                                                                                                                          'agentic/agent/planner/analyzier.py'),
                                                  'agentic.agent.planner.analyzier.AgentTaskAnalyzer._define_success_criteria': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._define_success_criteria',
                                                                                                                                  'agentic/agent/planner/analyzier.py'),
+                                                 'agentic.agent.planner.analyzier.AgentTaskAnalyzer._estimate_complexity': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._estimate_complexity',
+                                                                                                                             'agentic/agent/planner/analyzier.py'),
+                                                 'agentic.agent.planner.analyzier.AgentTaskAnalyzer._heuristic_complexity': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._heuristic_complexity',
+                                                                                                                              'agentic/agent/planner/analyzier.py'),
+                                                 'agentic.agent.planner.analyzier.AgentTaskAnalyzer._on_own_client': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._on_own_client',
+                                                                                                                       'agentic/agent/planner/analyzier.py'),
                                                  'agentic.agent.planner.analyzier.AgentTaskAnalyzer._select_frameworks': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer._select_frameworks',
                                                                                                                            'agentic/agent/planner/analyzier.py'),
                                                  'agentic.agent.planner.analyzier.AgentTaskAnalyzer.analyze': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer.analyze',
@@ -57,6 +125,24 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                        'agentic/agent/planner/analyzier.py'),
                                                  'agentic.agent.planner.analyzier.AgentTaskAnalyzer.to_json': ( 'buddy/backend/agents/planner/analyzier.html#agenttaskanalyzer.to_json',
                                                                                                                 'agentic/agent/planner/analyzier.py')},
+            'agentic.agent.planner.artifacts': { 'agentic.agent.planner.artifacts.ArtifactChanges': ( 'buddy/backend/agents/planner/artifacts.html#artifactchanges',
+                                                                                                      'agentic/agent/planner/artifacts.py'),
+                                                 'agentic.agent.planner.artifacts.ArtifactChanges.__bool__': ( 'buddy/backend/agents/planner/artifacts.html#artifactchanges.__bool__',
+                                                                                                               'agentic/agent/planner/artifacts.py'),
+                                                 'agentic.agent.planner.artifacts.ArtifactTracker': ( 'buddy/backend/agents/planner/artifacts.html#artifacttracker',
+                                                                                                      'agentic/agent/planner/artifacts.py'),
+                                                 'agentic.agent.planner.artifacts.ArtifactTracker.__init__': ( 'buddy/backend/agents/planner/artifacts.html#artifacttracker.__init__',
+                                                                                                               'agentic/agent/planner/artifacts.py'),
+                                                 'agentic.agent.planner.artifacts.ArtifactTracker.attributed': ( 'buddy/backend/agents/planner/artifacts.html#artifacttracker.attributed',
+                                                                                                                 'agentic/agent/planner/artifacts.py'),
+                                                 'agentic.agent.planner.artifacts.ArtifactTracker.begin': ( 'buddy/backend/agents/planner/artifacts.html#artifacttracker.begin',
+                                                                                                            'agentic/agent/planner/artifacts.py'),
+                                                 'agentic.agent.planner.artifacts.ArtifactTracker.changes_since': ( 'buddy/backend/agents/planner/artifacts.html#artifacttracker.changes_since',
+                                                                                                                    'agentic/agent/planner/artifacts.py'),
+                                                 'agentic.agent.planner.artifacts.ArtifactTracker.diff': ( 'buddy/backend/agents/planner/artifacts.html#artifacttracker.diff',
+                                                                                                           'agentic/agent/planner/artifacts.py'),
+                                                 'agentic.agent.planner.artifacts.ArtifactTracker.snapshot': ( 'buddy/backend/agents/planner/artifacts.html#artifacttracker.snapshot',
+                                                                                                               'agentic/agent/planner/artifacts.py')},
             'agentic.agent.planner.breakdown': { 'agentic.agent.planner.breakdown.ProjectBreakdownGenerator': ( 'buddy/backend/agents/planner/breakdown.html#projectbreakdowngenerator',
                                                                                                                 'agentic/agent/planner/breakdown.py'),
                                                  'agentic.agent.planner.breakdown.ProjectBreakdownGenerator.__init__': ( 'buddy/backend/agents/planner/breakdown.html#projectbreakdowngenerator.__init__',
@@ -71,6 +157,16 @@ d = { 'settings': { 'branch': 'main',
                                                                                            'agentic/agent/planner/cache.py'),
                                              'agentic.agent.planner.cache.CacheManager.__init__': ( 'buddy/backend/agents/planner/cache.html#cachemanager.__init__',
                                                                                                     'agentic/agent/planner/cache.py'),
+                                             'agentic.agent.planner.cache.CacheManager._append': ( 'buddy/backend/agents/planner/cache.html#cachemanager._append',
+                                                                                                   'agentic/agent/planner/cache.py'),
+                                             'agentic.agent.planner.cache.CacheManager._compact': ( 'buddy/backend/agents/planner/cache.html#cachemanager._compact',
+                                                                                                    'agentic/agent/planner/cache.py'),
+                                             'agentic.agent.planner.cache.CacheManager._project_dir': ( 'buddy/backend/agents/planner/cache.html#cachemanager._project_dir',
+                                                                                                        'agentic/agent/planner/cache.py'),
+                                             'agentic.agent.planner.cache.CacheManager._project_key': ( 'buddy/backend/agents/planner/cache.html#cachemanager._project_key',
+                                                                                                        'agentic/agent/planner/cache.py'),
+                                             'agentic.agent.planner.cache.CacheManager._write_atomic': ( 'buddy/backend/agents/planner/cache.html#cachemanager._write_atomic',
+                                                                                                         'agentic/agent/planner/cache.py'),
                                              'agentic.agent.planner.cache.CacheManager.clear_cache': ( 'buddy/backend/agents/planner/cache.html#cachemanager.clear_cache',
                                                                                                        'agentic/agent/planner/cache.py'),
                                              'agentic.agent.planner.cache.CacheManager.restore_from_cache': ( 'buddy/backend/agents/planner/cache.html#cachemanager.restore_from_cache',
@@ -83,16 +179,78 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                  'agentic/agent/planner/executor.py'),
                                                 'agentic.agent.planner.executor.DynamicTaskExecutor._create_project_folder': ( 'buddy/backend/agents/planner/executor.html#dynamictaskexecutor._create_project_folder',
                                                                                                                                'agentic/agent/planner/executor.py'),
+                                                'agentic.agent.planner.executor.DynamicTaskExecutor._create_task_executor': ( 'buddy/backend/agents/planner/executor.html#dynamictaskexecutor._create_task_executor',
+                                                                                                                              'agentic/agent/planner/executor.py'),
+                                                'agentic.agent.planner.executor.DynamicTaskExecutor._create_worker_executors': ( 'buddy/backend/agents/planner/executor.html#dynamictaskexecutor._create_worker_executors',
+                                                                                                                                 'agentic/agent/planner/executor.py'),
+                                                'agentic.agent.planner.executor.DynamicTaskExecutor._generate_task': ( 'buddy/backend/agents/planner/executor.html#dynamictaskexecutor._generate_task',
+                                                                                                                       'agentic/agent/planner/executor.py'),
                                                 'agentic.agent.planner.executor.DynamicTaskExecutor._is_project_complete': ( 'buddy/backend/agents/planner/executor.html#dynamictaskexecutor._is_project_complete',
                                                                                                                              'agentic/agent/planner/executor.py'),
+                                                'agentic.agent.planner.executor.DynamicTaskExecutor._prevalidate_task': ( 'buddy/backend/agents/planner/executor.html#dynamictaskexecutor._prevalidate_task',
+                                                                                                                          'agentic/agent/planner/executor.py'),
+                                                'agentic.agent.planner.executor.DynamicTaskExecutor._record_task_result': ( 'buddy/backend/agents/planner/executor.html#dynamictaskexecutor._record_task_result',
+                                                                                                                            'agentic/agent/planner/executor.py'),
+                                                'agentic.agent.planner.executor.DynamicTaskExecutor._start_speculation': ( 'buddy/backend/agents/planner/executor.html#dynamictaskexecutor._start_speculation',
+                                                                                                                           'agentic/agent/planner/executor.py'),
+                                                'agentic.agent.planner.executor.DynamicTaskExecutor._take_speculative_task': ( 'buddy/backend/agents/planner/executor.html#dynamictaskexecutor._take_speculative_task',
+                                                                                                                               'agentic/agent/planner/executor.py'),
                                                 'agentic.agent.planner.executor.DynamicTaskExecutor.execute': ( 'buddy/backend/agents/planner/executor.html#dynamictaskexecutor.execute',
                                                                                                                 'agentic/agent/planner/executor.py'),
                                                 'agentic.agent.planner.executor.DynamicTaskExecutor.execute_project': ( 'buddy/backend/agents/planner/executor.html#dynamictaskexecutor.execute_project',
                                                                                                                         'agentic/agent/planner/executor.py'),
                                                 'agentic.agent.planner.executor.DynamicTaskExecutor.save_execution_report': ( 'buddy/backend/agents/planner/executor.html#dynamictaskexecutor.save_execution_report',
                                                                                                                               'agentic/agent/planner/executor.py')},
+            'agentic.agent.planner.introspection': { 'agentic.agent.planner.introspection.CheckResult': ( 'buddy/backend/agents/planner/introspection.html#checkresult',
+                                                                                                          'agentic/agent/planner/introspection.py'),
+                                                     'agentic.agent.planner.introspection.CheckStatus': ( 'buddy/backend/agents/planner/introspection.html#checkstatus',
+                                                                                                          'agentic/agent/planner/introspection.py'),
+                                                     'agentic.agent.planner.introspection.CheckVerdict': ( 'buddy/backend/agents/planner/introspection.html#checkverdict',
+                                                                                                           'agentic/agent/planner/introspection.py'),
+                                                     'agentic.agent.planner.introspection.CheckVerdict.feedback': ( 'buddy/backend/agents/planner/introspection.html#checkverdict.feedback',
+                                                                                                                    'agentic/agent/planner/introspection.py'),
+                                                     'agentic.agent.planner.introspection.CheckVerdict.to_introspection_result': ( 'buddy/backend/agents/planner/introspection.html#checkverdict.to_introspection_result',
+                                                                                                                                   'agentic/agent/planner/introspection.py'),
+                                                     'agentic.agent.planner.introspection.IntrospectionScheduler': ( 'buddy/backend/agents/planner/introspection.html#introspectionscheduler',
+                                                                                                                     'agentic/agent/planner/introspection.py'),
+                                                     'agentic.agent.planner.introspection.IntrospectionScheduler.__init__': ( 'buddy/backend/agents/planner/introspection.html#introspectionscheduler.__init__',
+                                                                                                                              'agentic/agent/planner/introspection.py'),
+                                                     'agentic.agent.planner.introspection.IntrospectionScheduler._check_expected_outputs': ( 'buddy/backend/agents/planner/introspection.html#introspectionscheduler._check_expected_outputs',
+                                                                                                                                             'agentic/agent/planner/introspection.py'),
+                                                     'agentic.agent.planner.introspection.IntrospectionScheduler._check_tests': ( 'buddy/backend/agents/planner/introspection.html#introspectionscheduler._check_tests',
+                                                                                                                                  'agentic/agent/planner/introspection.py'),
+                                                     'agentic.agent.planner.introspection.IntrospectionScheduler._check_tool_exit_status': ( 'buddy/backend/agents/planner/introspection.html#introspectionscheduler._check_tool_exit_status',
+                                                                                                                                             'agentic/agent/planner/introspection.py'),
+                                                     'agentic.agent.planner.introspection.IntrospectionScheduler._is_path': ( 'buddy/backend/agents/planner/introspection.html#introspectionscheduler._is_path',
+                                                                                                                              'agentic/agent/planner/introspection.py'),
+                                                     'agentic.agent.planner.introspection.IntrospectionScheduler._timed': ( 'buddy/backend/agents/planner/introspection.html#introspectionscheduler._timed',
+                                                                                                                            'agentic/agent/planner/introspection.py'),
+                                                     'agentic.agent.planner.introspection.IntrospectionScheduler.evaluate_batch': ( 'buddy/backend/agents/planner/introspection.html#introspectionscheduler.evaluate_batch',
+                                                                                                                                    'agentic/agent/planner/introspection.py'),
+                                                     'agentic.agent.planner.introspection.IntrospectionScheduler.run_checks': ( 'buddy/backend/agents/planner/introspection.html#introspectionscheduler.run_checks',
+                                                                                                                                'agentic/agent/planner/introspection.py')},
             'agentic.agent.planner.main': { 'agentic.agent.planner.main.main': ( 'buddy/backend/agents/planner/main.html#main',
                                                                                  'agentic/agent/planner/main.py')},
+            'agentic.agent.planner.memory': { 'agentic.agent.planner.memory.ProjectMemory': ( 'buddy/backend/agents/planner/memory.html#projectmemory',
+                                                                                              'agentic/agent/planner/memory.py'),
+                                              'agentic.agent.planner.memory.ProjectMemory.__init__': ( 'buddy/backend/agents/planner/memory.html#projectmemory.__init__',
+                                                                                                       'agentic/agent/planner/memory.py'),
+                                              'agentic.agent.planner.memory.ProjectMemory._status': ( 'buddy/backend/agents/planner/memory.html#projectmemory._status',
+                                                                                                      'agentic/agent/planner/memory.py'),
+                                              'agentic.agent.planner.memory.ProjectMemory._summarize': ( 'buddy/backend/agents/planner/memory.html#projectmemory._summarize',
+                                                                                                         'agentic/agent/planner/memory.py'),
+                                              'agentic.agent.planner.memory.ProjectMemory.render': ( 'buddy/backend/agents/planner/memory.html#projectmemory.render',
+                                                                                                     'agentic/agent/planner/memory.py'),
+                                              'agentic.agent.planner.memory.ProjectMemory.render_artifacts': ( 'buddy/backend/agents/planner/memory.html#projectmemory.render_artifacts',
+                                                                                                               'agentic/agent/planner/memory.py'),
+                                              'agentic.agent.planner.memory.ProjectMemory.render_tasks': ( 'buddy/backend/agents/planner/memory.html#projectmemory.render_tasks',
+                                                                                                           'agentic/agent/planner/memory.py'),
+                                              'agentic.agent.planner.memory.ProjectMemory.reset': ( 'buddy/backend/agents/planner/memory.html#projectmemory.reset',
+                                                                                                    'agentic/agent/planner/memory.py'),
+                                              'agentic.agent.planner.memory.ProjectMemory.sync': ( 'buddy/backend/agents/planner/memory.html#projectmemory.sync',
+                                                                                                   'agentic/agent/planner/memory.py'),
+                                              'agentic.agent.planner.memory.ProjectMemory.task_names': ( 'buddy/backend/agents/planner/memory.html#projectmemory.task_names',
+                                                                                                         'agentic/agent/planner/memory.py')},
             'agentic.agent.planner.models': { 'agentic.agent.planner.models.ActionResult': ( 'buddy/backend/agents/planner/models.html#actionresult',
                                                                                              'agentic/agent/planner/models.py'),
                                               'agentic.agent.planner.models.ActionStep': ( 'buddy/backend/agents/planner/models.html#actionstep',
@@ -113,18 +271,46 @@ d = { 'settings': { 'branch': 'main',
                                                                                      'agentic/agent/planner/models.py'),
                                               'agentic.agent.planner.models.TaskExecutionResult': ( 'buddy/backend/agents/planner/models.html#taskexecutionresult',
                                                                                                     'agentic/agent/planner/models.py')},
+            'agentic.agent.planner.scheduler': { 'agentic.agent.planner.scheduler.TaskScheduler': ( 'buddy/backend/agents/planner/scheduler.html#taskscheduler',
+                                                                                                    'agentic/agent/planner/scheduler.py'),
+                                                 'agentic.agent.planner.scheduler.TaskScheduler.__init__': ( 'buddy/backend/agents/planner/scheduler.html#taskscheduler.__init__',
+                                                                                                             'agentic/agent/planner/scheduler.py'),
+                                                 'agentic.agent.planner.scheduler.TaskScheduler._is_ready': ( 'buddy/backend/agents/planner/scheduler.html#taskscheduler._is_ready',
+                                                                                                              'agentic/agent/planner/scheduler.py'),
+                                                 'agentic.agent.planner.scheduler.TaskScheduler._run': ( 'buddy/backend/agents/planner/scheduler.html#taskscheduler._run',
+                                                                                                         'agentic/agent/planner/scheduler.py'),
+                                                 'agentic.agent.planner.scheduler.TaskScheduler.add': ( 'buddy/backend/agents/planner/scheduler.html#taskscheduler.add',
+                                                                                                        'agentic/agent/planner/scheduler.py'),
+                                                 'agentic.agent.planner.scheduler.TaskScheduler.has_capacity': ( 'buddy/backend/agents/planner/scheduler.html#taskscheduler.has_capacity',
+                                                                                                                 'agentic/agent/planner/scheduler.py'),
+                                                 'agentic.agent.planner.scheduler.TaskScheduler.in_flight': ( 'buddy/backend/agents/planner/scheduler.html#taskscheduler.in_flight',
+                                                                                                              'agentic/agent/planner/scheduler.py'),
+                                                 'agentic.agent.planner.scheduler.TaskScheduler.launch_ready': ( 'buddy/backend/agents/planner/scheduler.html#taskscheduler.launch_ready',
+                                                                                                                 'agentic/agent/planner/scheduler.py'),
+                                                 'agentic.agent.planner.scheduler.TaskScheduler.wait_next': ( 'buddy/backend/agents/planner/scheduler.html#taskscheduler.wait_next',
+                                                                                                              'agentic/agent/planner/scheduler.py')},
             'agentic.agent.planner.task_executor': { 'agentic.agent.planner.task_executor.TaskExecutor': ( 'buddy/backend/agents/planner/task_executor.html#taskexecutor',
                                                                                                            'agentic/agent/planner/task_executor.py'),
                                                      'agentic.agent.planner.task_executor.TaskExecutor.__init__': ( 'buddy/backend/agents/planner/task_executor.html#taskexecutor.__init__',
                                                                                                                     'agentic/agent/planner/task_executor.py'),
-                                                     'agentic.agent.planner.task_executor.TaskExecutor._detect_new_artifacts': ( 'buddy/backend/agents/planner/task_executor.html#taskexecutor._detect_new_artifacts',
-                                                                                                                                 'agentic/agent/planner/task_executor.py'),
+                                                     'agentic.agent.planner.task_executor.TaskExecutor._evaluate_action': ( 'buddy/backend/agents/planner/task_executor.html#taskexecutor._evaluate_action',
+                                                                                                                            'agentic/agent/planner/task_executor.py'),
                                                      'agentic.agent.planner.task_executor.TaskExecutor._execute_action_with_retries': ( 'buddy/backend/agents/planner/task_executor.html#taskexecutor._execute_action_with_retries',
                                                                                                                                         'agentic/agent/planner/task_executor.py'),
+                                                     'agentic.agent.planner.task_executor.TaskExecutor._execute_parallel_actions': ( 'buddy/backend/agents/planner/task_executor.html#taskexecutor._execute_parallel_actions',
+                                                                                                                                     'agentic/agent/planner/task_executor.py'),
                                                      'agentic.agent.planner.task_executor.TaskExecutor._execute_single_action': ( 'buddy/backend/agents/planner/task_executor.html#taskexecutor._execute_single_action',
                                                                                                                                   'agentic/agent/planner/task_executor.py'),
+                                                     'agentic.agent.planner.task_executor.TaskExecutor._flush_introspection': ( 'buddy/backend/agents/planner/task_executor.html#taskexecutor._flush_introspection',
+                                                                                                                                'agentic/agent/planner/task_executor.py'),
+                                                     'agentic.agent.planner.task_executor.TaskExecutor._group_actions': ( 'buddy/backend/agents/planner/task_executor.html#taskexecutor._group_actions',
+                                                                                                                          'agentic/agent/planner/task_executor.py'),
                                                      'agentic.agent.planner.task_executor.TaskExecutor._introspect_action': ( 'buddy/backend/agents/planner/task_executor.html#taskexecutor._introspect_action',
                                                                                                                               'agentic/agent/planner/task_executor.py'),
+                                                     'agentic.agent.planner.task_executor.TaskExecutor._merge_artifacts': ( 'buddy/backend/agents/planner/task_executor.html#taskexecutor._merge_artifacts',
+                                                                                                                            'agentic/agent/planner/task_executor.py'),
+                                                     'agentic.agent.planner.task_executor.TaskExecutor._run_action': ( 'buddy/backend/agents/planner/task_executor.html#taskexecutor._run_action',
+                                                                                                                       'agentic/agent/planner/task_executor.py'),
                                                      'agentic.agent.planner.task_executor.TaskExecutor.execute_task': ( 'buddy/backend/agents/planner/task_executor.html#taskexecutor.execute_task',
                                                                                                                         'agentic/agent/planner/task_executor.py')},
             'agentic.agent.planner.task_generator': { 'agentic.agent.planner.task_generator.TaskGenerator': ( 'buddy/backend/agents/planner/task_generator.html#taskgenerator',
@@ -133,6 +319,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                        'agentic/agent/planner/task_generator.py'),
                                                       'agentic.agent.planner.task_generator.TaskGenerator._build_context_prompt': ( 'buddy/backend/agents/planner/task_generator.html#taskgenerator._build_context_prompt',
                                                                                                                                     'agentic/agent/planner/task_generator.py'),
+                                                      'agentic.agent.planner.task_generator.TaskGenerator._build_in_flight_prompt': ( 'buddy/backend/agents/planner/task_generator.html#taskgenerator._build_in_flight_prompt',
+                                                                                                                                      'agentic/agent/planner/task_generator.py'),
                                                       'agentic.agent.planner.task_generator.TaskGenerator._determine_project_phase': ( 'buddy/backend/agents/planner/task_generator.html#taskgenerator._determine_project_phase',
                                                                                                                                        'agentic/agent/planner/task_generator.py'),
                                                       'agentic.agent.planner.task_generator.TaskGenerator._extract_task_from_text': ( 'buddy/backend/agents/planner/task_generator.html#taskgenerator._extract_task_from_text',
@@ -143,6 +331,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                      'agentic/agent/planner/task_generator.py'),
                                                       'agentic.agent.planner.task_generator.TaskGenerator._get_phase_guidance': ( 'buddy/backend/agents/planner/task_generator.html#taskgenerator._get_phase_guidance',
                                                                                                                                   'agentic/agent/planner/task_generator.py'),
+                                                      'agentic.agent.planner.task_generator.TaskGenerator._next_task_id': ( 'buddy/backend/agents/planner/task_generator.html#taskgenerator._next_task_id',
+                                                                                                                            'agentic/agent/planner/task_generator.py'),
                                                       'agentic.agent.planner.task_generator.TaskGenerator.generate_next_task': ( 'buddy/backend/agents/planner/task_generator.html#taskgenerator.generate_next_task',
                                                                                                                                  'agentic/agent/planner/task_generator.py'),
                                                       'agentic.agent.planner.task_generator.TaskGenerator.regenerate_task_with_feedback': ( 'buddy/backend/agents/planner/task_generator.html#taskgenerator.regenerate_task_with_feedback',
@@ -155,10 +345,34 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                                'agentic/agent/planner/validation.py'),
                                                   'agentic.agent.planner.validation.TaskValidator.validate_task_consistency': ( 'buddy/backend/agents/planner/validation.html#taskvalidator.validate_task_consistency',
                                                                                                                                 'agentic/agent/planner/validation.py')},
+            'agentic.benchmark': { 'agentic.benchmark.BenchmarkRunner': ( 'buddy/frontend/benchmark.html#benchmarkrunner',
+                                                                          'agentic/benchmark.py'),
+                                   'agentic.benchmark.BenchmarkRunner.__init__': ( 'buddy/frontend/benchmark.html#benchmarkrunner.__init__',
+                                                                                   'agentic/benchmark.py'),
+                                   'agentic.benchmark.BenchmarkRunner._command': ( 'buddy/frontend/benchmark.html#benchmarkrunner._command',
+                                                                                   'agentic/benchmark.py'),
+                                   'agentic.benchmark.BenchmarkRunner.run': ( 'buddy/frontend/benchmark.html#benchmarkrunner.run',
+                                                                              'agentic/benchmark.py'),
+                                   'agentic.benchmark.BenchmarkRunner.run_one': ( 'buddy/frontend/benchmark.html#benchmarkrunner.run_one',
+                                                                                  'agentic/benchmark.py'),
+                                   'agentic.benchmark.BenchmarkTask': ( 'buddy/frontend/benchmark.html#benchmarktask',
+                                                                        'agentic/benchmark.py'),
+                                   'agentic.benchmark.BenchmarkTask.prompt': ( 'buddy/frontend/benchmark.html#benchmarktask.prompt',
+                                                                               'agentic/benchmark.py'),
+                                   'agentic.benchmark._worker': ('buddy/frontend/benchmark.html#_worker', 'agentic/benchmark.py'),
+                                   'agentic.benchmark.compare': ('buddy/frontend/benchmark.html#compare', 'agentic/benchmark.py'),
+                                   'agentic.benchmark.load_task': ('buddy/frontend/benchmark.html#load_task', 'agentic/benchmark.py'),
+                                   'agentic.benchmark.load_tasks': ('buddy/frontend/benchmark.html#load_tasks', 'agentic/benchmark.py'),
+                                   'agentic.benchmark.main': ('buddy/frontend/benchmark.html#main', 'agentic/benchmark.py'),
+                                   'agentic.benchmark.print_results': ( 'buddy/frontend/benchmark.html#print_results',
+                                                                        'agentic/benchmark.py'),
+                                   'agentic.benchmark.run_task': ('buddy/frontend/benchmark.html#run_task', 'agentic/benchmark.py')},
             'agentic.client': { 'agentic.client.AnalysisResult': ('buddy/frontend/client.html#analysisresult', 'agentic/client.py'),
                                 'agentic.client.BuddyClient': ('buddy/frontend/client.html#buddyclient', 'agentic/client.py'),
                                 'agentic.client.BuddyClient.__init__': ( 'buddy/frontend/client.html#buddyclient.__init__',
                                                                          'agentic/client.py'),
+                                'agentic.client.BuddyClient._dispatch_route': ( 'buddy/frontend/client.html#buddyclient._dispatch_route',
+                                                                                'agentic/client.py'),
                                 'agentic.client.BuddyClient._execute_debate_phase': ( 'buddy/frontend/client.html#buddyclient._execute_debate_phase',
                                                                                       'agentic/client.py'),
                                 'agentic.client.BuddyClient._execute_planning_phase': ( 'buddy/frontend/client.html#buddyclient._execute_planning_phase',
@@ -169,14 +383,34 @@ d = { 'settings': { 'branch': 'main',
                                                                                        'agentic/client.py'),
                                 'agentic.client.BuddyClient.interactive_session': ( 'buddy/frontend/client.html#buddyclient.interactive_session',
                                                                                     'agentic/client.py'),
+                                'agentic.client.BuddyClient.manage_decisions': ( 'buddy/frontend/client.html#buddyclient.manage_decisions',
+                                                                                 'agentic/client.py'),
+                                'agentic.client.BuddyClient.manage_response_cache': ( 'buddy/frontend/client.html#buddyclient.manage_response_cache',
+                                                                                      'agentic/client.py'),
                                 'agentic.client.BuddyClient.process_request': ( 'buddy/frontend/client.html#buddyclient.process_request',
                                                                                 'agentic/client.py'),
+                                'agentic.client.BuddyClient.show_plugin_report': ( 'buddy/frontend/client.html#buddyclient.show_plugin_report',
+                                                                                   'agentic/client.py'),
                                 'agentic.client.RequestComplexity': ('buddy/frontend/client.html#requestcomplexity', 'agentic/client.py'),
                                 'agentic.client.main': ('buddy/frontend/client.html#main', 'agentic/client.py')},
-            'agentic.configs.loader': { 'agentic.configs.loader.get_model_config': ( 'buddy/configs/loader.html#get_model_config',
+            'agentic.configs.loader': { 'agentic.configs.loader.get_decision_cache_config': ( 'buddy/configs/loader.html#get_decision_cache_config',
+                                                                                              'agentic/configs/loader.py'),
+                                        'agentic.configs.loader.get_endpoints_config': ( 'buddy/configs/loader.html#get_endpoints_config',
+                                                                                         'agentic/configs/loader.py'),
+                                        'agentic.configs.loader.get_model_config': ( 'buddy/configs/loader.html#get_model_config',
                                                                                      'agentic/configs/loader.py'),
+                                        'agentic.configs.loader.get_planner_config': ( 'buddy/configs/loader.html#get_planner_config',
+                                                                                       'agentic/configs/loader.py'),
+                                        'agentic.configs.loader.get_rate_limits_config': ( 'buddy/configs/loader.html#get_rate_limits_config',
+                                                                                           'agentic/configs/loader.py'),
                                         'agentic.configs.loader.get_reasoning_config': ( 'buddy/configs/loader.html#get_reasoning_config',
                                                                                          'agentic/configs/loader.py'),
+                                        'agentic.configs.loader.get_resilience_config': ( 'buddy/configs/loader.html#get_resilience_config',
+                                                                                          'agentic/configs/loader.py'),
+                                        'agentic.configs.loader.get_response_cache_config': ( 'buddy/configs/loader.html#get_response_cache_config',
+                                                                                              'agentic/configs/loader.py'),
+                                        'agentic.configs.loader.get_router_config': ( 'buddy/configs/loader.html#get_router_config',
+                                                                                      'agentic/configs/loader.py'),
                                         'agentic.configs.loader.get_settings_config': ( 'buddy/configs/loader.html#get_settings_config',
                                                                                         'agentic/configs/loader.py'),
                                         'agentic.configs.loader.get_system_prompt': ( 'buddy/configs/loader.html#get_system_prompt',
@@ -195,10 +429,24 @@ d = { 'settings': { 'branch': 'main',
                                                                                                  'agentic/configs/manager.py'),
                                          'agentic.configs.manager.ConfigManager._save_config': ( 'buddy/configs/manager.html#configmanager._save_config',
                                                                                                  'agentic/configs/manager.py'),
+                                         'agentic.configs.manager.ConfigManager.get_decision_cache_config': ( 'buddy/configs/manager.html#configmanager.get_decision_cache_config',
+                                                                                                              'agentic/configs/manager.py'),
+                                         'agentic.configs.manager.ConfigManager.get_endpoints_config': ( 'buddy/configs/manager.html#configmanager.get_endpoints_config',
+                                                                                                         'agentic/configs/manager.py'),
                                          'agentic.configs.manager.ConfigManager.get_model_config': ( 'buddy/configs/manager.html#configmanager.get_model_config',
                                                                                                      'agentic/configs/manager.py'),
+                                         'agentic.configs.manager.ConfigManager.get_planner_config': ( 'buddy/configs/manager.html#configmanager.get_planner_config',
+                                                                                                       'agentic/configs/manager.py'),
+                                         'agentic.configs.manager.ConfigManager.get_rate_limits_config': ( 'buddy/configs/manager.html#configmanager.get_rate_limits_config',
+                                                                                                           'agentic/configs/manager.py'),
                                          'agentic.configs.manager.ConfigManager.get_reasoning_config': ( 'buddy/configs/manager.html#configmanager.get_reasoning_config',
                                                                                                          'agentic/configs/manager.py'),
+                                         'agentic.configs.manager.ConfigManager.get_resilience_config': ( 'buddy/configs/manager.html#configmanager.get_resilience_config',
+                                                                                                          'agentic/configs/manager.py'),
+                                         'agentic.configs.manager.ConfigManager.get_response_cache_config': ( 'buddy/configs/manager.html#configmanager.get_response_cache_config',
+                                                                                                              'agentic/configs/manager.py'),
+                                         'agentic.configs.manager.ConfigManager.get_router_config': ( 'buddy/configs/manager.html#configmanager.get_router_config',
+                                                                                                      'agentic/configs/manager.py'),
                                          'agentic.configs.manager.ConfigManager.get_settings_config': ( 'buddy/configs/manager.html#configmanager.get_settings_config',
                                                                                                         'agentic/configs/manager.py'),
                                          'agentic.configs.manager.ConfigManager.get_tools_config': ( 'buddy/configs/manager.html#configmanager.get_tools_config',
@@ -207,10 +455,24 @@ d = { 'settings': { 'branch': 'main',
                                                                                                       'agentic/configs/manager.py'),
                                          'agentic.configs.manager.ConfigManager.update_config': ( 'buddy/configs/manager.html#configmanager.update_config',
                                                                                                   'agentic/configs/manager.py'),
+                                         'agentic.configs.manager.DecisionCacheConfig': ( 'buddy/configs/manager.html#decisioncacheconfig',
+                                                                                          'agentic/configs/manager.py'),
+                                         'agentic.configs.manager.EndpointsConfig': ( 'buddy/configs/manager.html#endpointsconfig',
+                                                                                      'agentic/configs/manager.py'),
                                          'agentic.configs.manager.ModelConfig': ( 'buddy/configs/manager.html#modelconfig',
                                                                                   'agentic/configs/manager.py'),
+                                         'agentic.configs.manager.PlannerConfig': ( 'buddy/configs/manager.html#plannerconfig',
+                                                                                    'agentic/configs/manager.py'),
+                                         'agentic.configs.manager.RateLimitsConfig': ( 'buddy/configs/manager.html#ratelimitsconfig',
+                                                                                       'agentic/configs/manager.py'),
                                          'agentic.configs.manager.ReasoningConfig': ( 'buddy/configs/manager.html#reasoningconfig',
                                                                                       'agentic/configs/manager.py'),
+                                         'agentic.configs.manager.ResilienceConfig': ( 'buddy/configs/manager.html#resilienceconfig',
+                                                                                       'agentic/configs/manager.py'),
+                                         'agentic.configs.manager.ResponseCacheConfig': ( 'buddy/configs/manager.html#responsecacheconfig',
+                                                                                          'agentic/configs/manager.py'),
+                                         'agentic.configs.manager.RouterConfig': ( 'buddy/configs/manager.html#routerconfig',
+                                                                                   'agentic/configs/manager.py'),
                                          'agentic.configs.manager.SettingsConfig': ( 'buddy/configs/manager.html#settingsconfig',
                                                                                      'agentic/configs/manager.py'),
                                          'agentic.configs.manager.ToolsConfig': ( 'buddy/configs/manager.html#toolsconfig',
@@ -235,6 +497,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                                                          'agentic/configs/prompt_manager.py'),
                                                 'agentic.configs.prompt_manager.PromptsManager.get_system_context': ( 'buddy/configs/prompts_manager.html#promptsmanager.get_system_context',
                                                                                                                       'agentic/configs/prompt_manager.py'),
+                                                'agentic.configs.prompt_manager.PromptsManager.get_system_prompt': ( 'buddy/configs/prompts_manager.html#promptsmanager.get_system_prompt',
+                                                                                                                     'agentic/configs/prompt_manager.py'),
                                                 'agentic.configs.prompt_manager.get_prompts_manager': ( 'buddy/configs/prompts_manager.html#get_prompts_manager',
                                                                                                         'agentic/configs/prompt_manager.py'),
                                                 'agentic.configs.prompt_manager.get_system_prompt': ( 'buddy/configs/prompts_manager.html#get_system_prompt',
@@ -259,19 +523,30 @@ d = { 'settings': { 'branch': 'main',
                                                                                              'agentic/core/agent.py'),
                                     'agentic.core.agent.Agent._execute_tool_calls': ( 'buddy/backend/core/agent.html#agent._execute_tool_calls',
                                                                                       'agentic/core/agent.py'),
+                                    'agentic.core.agent.Agent._filter_output': ( 'buddy/backend/core/agent.html#agent._filter_output',
+                                                                                 'agentic/core/agent.py'),
                                     'agentic.core.agent.Agent._format_messages_for_llm': ( 'buddy/backend/core/agent.html#agent._format_messages_for_llm',
                                                                                            'agentic/core/agent.py'),
                                     'agentic.core.agent.Agent._get_available_tools': ( 'buddy/backend/core/agent.html#agent._get_available_tools',
                                                                                        'agentic/core/agent.py'),
                                     'agentic.core.agent.Agent._is_conversation_complete': ( 'buddy/backend/core/agent.html#agent._is_conversation_complete',
                                                                                             'agentic/core/agent.py'),
+                                    'agentic.core.agent.Agent._output_filter': ( 'buddy/backend/core/agent.html#agent._output_filter',
+                                                                                 'agentic/core/agent.py'),
                                     'agentic.core.agent.Agent.add_guardrail': ( 'buddy/backend/core/agent.html#agent.add_guardrail',
                                                                                 'agentic/core/agent.py'),
                                     'agentic.core.agent.Agent.add_tool': ( 'buddy/backend/core/agent.html#agent.add_tool',
                                                                            'agentic/core/agent.py'),
                                     'agentic.core.agent.Agent.clear_history': ( 'buddy/backend/core/agent.html#agent.clear_history',
                                                                                 'agentic/core/agent.py'),
+                                    'agentic.core.agent.Agent.complete': ( 'buddy/backend/core/agent.html#agent.complete',
+                                                                           'agentic/core/agent.py'),
+                                    'agentic.core.agent.Agent.fork': ('buddy/backend/core/agent.html#agent.fork', 'agentic/core/agent.py'),
+                                    'agentic.core.agent.Agent.passes_guardrails': ( 'buddy/backend/core/agent.html#agent.passes_guardrails',
+                                                                                    'agentic/core/agent.py'),
                                     'agentic.core.agent.Agent.run': ('buddy/backend/core/agent.html#agent.run', 'agentic/core/agent.py'),
+                                    'agentic.core.agent.Agent.set_output_guardrails': ( 'buddy/backend/core/agent.html#agent.set_output_guardrails',
+                                                                                        'agentic/core/agent.py'),
                                     'agentic.core.agent.AgentConfig': ( 'buddy/backend/core/agent.html#agentconfig',
                                                                         'agentic/core/agent.py'),
                                     'agentic.core.agent.Message': ('buddy/backend/core/agent.html#message', 'agentic/core/agent.py')},
@@ -357,22 +632,32 @@ d = { 'settings': { 'branch': 'main',
                                                                                                       'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.ContentSafetyGuardrail.evaluate': ( 'buddy/backend/core/guardrails.html#contentsafetyguardrail.evaluate',
                                                                                                       'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.ContentSafetyGuardrail.rules': ( 'buddy/backend/core/guardrails.html#contentsafetyguardrail.rules',
+                                                                                                   'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.Guardrail': ( 'buddy/backend/core/guardrails.html#guardrail',
                                                                                 'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.Guardrail.__init__': ( 'buddy/backend/core/guardrails.html#guardrail.__init__',
                                                                                          'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.Guardrail._scan': ( 'buddy/backend/core/guardrails.html#guardrail._scan',
+                                                                                      'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.Guardrail.disable': ( 'buddy/backend/core/guardrails.html#guardrail.disable',
                                                                                         'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.Guardrail.enable': ( 'buddy/backend/core/guardrails.html#guardrail.enable',
                                                                                        'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.Guardrail.evaluate': ( 'buddy/backend/core/guardrails.html#guardrail.evaluate',
                                                                                          'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.Guardrail.rules': ( 'buddy/backend/core/guardrails.html#guardrail.rules',
+                                                                                      'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.GuardrailAction': ( 'buddy/backend/core/guardrails.html#guardrailaction',
                                                                                       'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.GuardrailManager': ( 'buddy/backend/core/guardrails.html#guardrailmanager',
                                                                                        'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.GuardrailManager.__init__': ( 'buddy/backend/core/guardrails.html#guardrailmanager.__init__',
                                                                                                 'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.GuardrailManager._evaluate': ( 'buddy/backend/core/guardrails.html#guardrailmanager._evaluate',
+                                                                                                 'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.GuardrailManager._scanner': ( 'buddy/backend/core/guardrails.html#guardrailmanager._scanner',
+                                                                                                'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.GuardrailManager.add_guardrail': ( 'buddy/backend/core/guardrails.html#guardrailmanager.add_guardrail',
                                                                                                      'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.GuardrailManager.evaluate_input': ( 'buddy/backend/core/guardrails.html#guardrailmanager.evaluate_input',
@@ -381,8 +666,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                                        'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.GuardrailManager.remove_guardrail': ( 'buddy/backend/core/guardrails.html#guardrailmanager.remove_guardrail',
                                                                                                         'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.GuardrailManager.scan': ( 'buddy/backend/core/guardrails.html#guardrailmanager.scan',
+                                                                                            'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.GuardrailManager.set_enforcement_mode': ( 'buddy/backend/core/guardrails.html#guardrailmanager.set_enforcement_mode',
                                                                                                             'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.GuardrailManager.stream_output': ( 'buddy/backend/core/guardrails.html#guardrailmanager.stream_output',
+                                                                                                     'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.GuardrailResult': ( 'buddy/backend/core/guardrails.html#guardrailresult',
                                                                                       'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.GuardrailType': ( 'buddy/backend/core/guardrails.html#guardrailtype',
@@ -393,26 +682,58 @@ d = { 'settings': { 'branch': 'main',
                                                                                                         'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.InputValidationGuardrail.evaluate': ( 'buddy/backend/core/guardrails.html#inputvalidationguardrail.evaluate',
                                                                                                         'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.InputValidationGuardrail.rules': ( 'buddy/backend/core/guardrails.html#inputvalidationguardrail.rules',
+                                                                                                     'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.OutputFilteringGuardrail': ( 'buddy/backend/core/guardrails.html#outputfilteringguardrail',
                                                                                                'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.OutputFilteringGuardrail.__init__': ( 'buddy/backend/core/guardrails.html#outputfilteringguardrail.__init__',
                                                                                                         'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.OutputFilteringGuardrail.evaluate': ( 'buddy/backend/core/guardrails.html#outputfilteringguardrail.evaluate',
                                                                                                         'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.OutputFilteringGuardrail.rules': ( 'buddy/backend/core/guardrails.html#outputfilteringguardrail.rules',
+                                                                                                     'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.PatternRule': ( 'buddy/backend/core/guardrails.html#patternrule',
+                                                                                  'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.PatternScanner': ( 'buddy/backend/core/guardrails.html#patternscanner',
+                                                                                     'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.PatternScanner.__init__': ( 'buddy/backend/core/guardrails.html#patternscanner.__init__',
+                                                                                              'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.PatternScanner._regex': ( 'buddy/backend/core/guardrails.html#patternscanner._regex',
+                                                                                            'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.PatternScanner.scan': ( 'buddy/backend/core/guardrails.html#patternscanner.scan',
+                                                                                          'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.RateLimitingGuardrail': ( 'buddy/backend/core/guardrails.html#ratelimitingguardrail',
                                                                                             'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.RateLimitingGuardrail.__init__': ( 'buddy/backend/core/guardrails.html#ratelimitingguardrail.__init__',
                                                                                                      'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.RateLimitingGuardrail.evaluate': ( 'buddy/backend/core/guardrails.html#ratelimitingguardrail.evaluate',
                                                                                                      'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.RuleHit': ( 'buddy/backend/core/guardrails.html#rulehit',
+                                                                              'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.StreamingOutputFilter': ( 'buddy/backend/core/guardrails.html#streamingoutputfilter',
+                                                                                            'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.StreamingOutputFilter.__init__': ( 'buddy/backend/core/guardrails.html#streamingoutputfilter.__init__',
+                                                                                                     'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.StreamingOutputFilter._release': ( 'buddy/backend/core/guardrails.html#streamingoutputfilter._release',
+                                                                                                     'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.StreamingOutputFilter.feed': ( 'buddy/backend/core/guardrails.html#streamingoutputfilter.feed',
+                                                                                                 'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.StreamingOutputFilter.flush': ( 'buddy/backend/core/guardrails.html#streamingoutputfilter.flush',
+                                                                                                  'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.ToolRestrictionGuardrail': ( 'buddy/backend/core/guardrails.html#toolrestrictionguardrail',
                                                                                                'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.ToolRestrictionGuardrail.__init__': ( 'buddy/backend/core/guardrails.html#toolrestrictionguardrail.__init__',
                                                                                                         'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.ToolRestrictionGuardrail.evaluate': ( 'buddy/backend/core/guardrails.html#toolrestrictionguardrail.evaluate',
                                                                                                         'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails._first_chars': ( 'buddy/backend/core/guardrails.html#_first_chars',
+                                                                                   'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails._required_literals': ( 'buddy/backend/core/guardrails.html#_required_literals',
+                                                                                         'agentic/core/guardrails.py'),
                                          'agentic.core.guardrails.create_default_guardrails': ( 'buddy/backend/core/guardrails.html#create_default_guardrails',
-                                                                                                'agentic/core/guardrails.py')},
+                                                                                                'agentic/core/guardrails.py'),
+                                         'agentic.core.guardrails.redact': ( 'buddy/backend/core/guardrails.html#redact',
+                                                                             'agentic/core/guardrails.py')},
             'agentic.core.handoffs': { 'agentic.core.handoffs.HandoffManager': ( 'buddy/backend/core/handoffs.html#handoffmanager',
                                                                                  'agentic/core/handoffs.py'),
                                        'agentic.core.handoffs.HandoffManager.__init__': ( 'buddy/backend/core/handoffs.html#handoffmanager.__init__',
@@ -445,20 +766,334 @@ d = { 'settings': { 'branch': 'main',
                                                                                          'agentic/core/handoffs.py'),
                                        'agentic.core.handoffs.HandoffType': ( 'buddy/backend/core/handoffs.html#handofftype',
                                                                               'agentic/core/handoffs.py')},
-            'agentic.llms.client': { 'agentic.llms.client.LLMClient': ( 'buddy/backend/llms/client.html#llmclient',
+            'agentic.core.metrics': { 'agentic.core.metrics.Metrics': ( 'buddy/backend/core/metrics.html#metrics',
+                                                                        'agentic/core/metrics.py'),
+                                      'agentic.core.metrics.Metrics.__init__': ( 'buddy/backend/core/metrics.html#metrics.__init__',
+                                                                                 'agentic/core/metrics.py'),
+                                      'agentic.core.metrics.Metrics.add': ( 'buddy/backend/core/metrics.html#metrics.add',
+                                                                            'agentic/core/metrics.py'),
+                                      'agentic.core.metrics.Metrics.reset': ( 'buddy/backend/core/metrics.html#metrics.reset',
+                                                                              'agentic/core/metrics.py'),
+                                      'agentic.core.metrics.Metrics.snapshot': ( 'buddy/backend/core/metrics.html#metrics.snapshot',
+                                                                                 'agentic/core/metrics.py'),
+                                      'agentic.core.metrics.Metrics.timer': ( 'buddy/backend/core/metrics.html#metrics.timer',
+                                                                              'agentic/core/metrics.py'),
+                                      'agentic.core.metrics.get_metrics': ( 'buddy/backend/core/metrics.html#get_metrics',
+                                                                            'agentic/core/metrics.py')},
+            'agentic.llms.client': { 'agentic.llms.client.Completion': ( 'buddy/backend/llms/client.html#completion',
+                                                                         'agentic/llms/client.py'),
+                                     'agentic.llms.client.Completion.__getattr__': ( 'buddy/backend/llms/client.html#completion.__getattr__',
+                                                                                     'agentic/llms/client.py'),
+                                     'agentic.llms.client.Completion.__init__': ( 'buddy/backend/llms/client.html#completion.__init__',
+                                                                                  'agentic/llms/client.py'),
+                                     'agentic.llms.client.Completion.__iter__': ( 'buddy/backend/llms/client.html#completion.__iter__',
+                                                                                  'agentic/llms/client.py'),
+                                     'agentic.llms.client.Completion.close': ( 'buddy/backend/llms/client.html#completion.close',
+                                                                               'agentic/llms/client.py'),
+                                     'agentic.llms.client.LLMClient': ( 'buddy/backend/llms/client.html#llmclient',
                                                                         'agentic/llms/client.py'),
                                      'agentic.llms.client.LLMClient.__init__': ( 'buddy/backend/llms/client.html#llmclient.__init__',
                                                                                  'agentic/llms/client.py'),
+                                     'agentic.llms.client.LLMClient._client_for': ( 'buddy/backend/llms/client.html#llmclient._client_for',
+                                                                                    'agentic/llms/client.py'),
+                                     'agentic.llms.client.LLMClient._embed': ( 'buddy/backend/llms/client.html#llmclient._embed',
+                                                                               'agentic/llms/client.py'),
+                                     'agentic.llms.client.LLMClient._send': ( 'buddy/backend/llms/client.html#llmclient._send',
+                                                                              'agentic/llms/client.py'),
+                                     'agentic.llms.client.LLMClient._settle_usage': ( 'buddy/backend/llms/client.html#llmclient._settle_usage',
+                                                                                      'agentic/llms/client.py'),
                                      'agentic.llms.client.LLMClient._validate_connection': ( 'buddy/backend/llms/client.html#llmclient._validate_connection',
                                                                                              'agentic/llms/client.py'),
+                                     'agentic.llms.client.LLMClient.clone': ( 'buddy/backend/llms/client.html#llmclient.clone',
+                                                                              'agentic/llms/client.py'),
                                      'agentic.llms.client.LLMClient.create_completion': ( 'buddy/backend/llms/client.html#llmclient.create_completion',
                                                                                           'agentic/llms/client.py'),
+                                     'agentic.llms.client.LLMClient.create_structured_completion': ( 'buddy/backend/llms/client.html#llmclient.create_structured_completion',
+                                                                                                     'agentic/llms/client.py'),
                                      'agentic.llms.client.LLMClient.get_model_info': ( 'buddy/backend/llms/client.html#llmclient.get_model_info',
                                                                                        'agentic/llms/client.py'),
                                      'agentic.llms.client.LLMClient.handle_streaming_response': ( 'buddy/backend/llms/client.html#llmclient.handle_streaming_response',
                                                                                                   'agentic/llms/client.py'),
                                      'agentic.llms.client.LLMClient.process_response': ( 'buddy/backend/llms/client.html#llmclient.process_response',
                                                                                          'agentic/llms/client.py')},
+            'agentic.llms.endpoints': { 'agentic.llms.endpoints.Endpoint': ( 'buddy/backend/llms/endpoints.html#endpoint',
+                                                                             'agentic/llms/endpoints.py'),
+                                        'agentic.llms.endpoints.Endpoint.healthy': ( 'buddy/backend/llms/endpoints.html#endpoint.healthy',
+                                                                                     'agentic/llms/endpoints.py'),
+                                        'agentic.llms.endpoints.EndpointPool': ( 'buddy/backend/llms/endpoints.html#endpointpool',
+                                                                                 'agentic/llms/endpoints.py'),
+                                        'agentic.llms.endpoints.EndpointPool.__init__': ( 'buddy/backend/llms/endpoints.html#endpointpool.__init__',
+                                                                                          'agentic/llms/endpoints.py'),
+                                        'agentic.llms.endpoints.EndpointPool._check_loop': ( 'buddy/backend/llms/endpoints.html#endpointpool._check_loop',
+                                                                                             'agentic/llms/endpoints.py'),
+                                        'agentic.llms.endpoints.EndpointPool._load': ( 'buddy/backend/llms/endpoints.html#endpointpool._load',
+                                                                                       'agentic/llms/endpoints.py'),
+                                        'agentic.llms.endpoints.EndpointPool.answered': ( 'buddy/backend/llms/endpoints.html#endpointpool.answered',
+                                                                                          'agentic/llms/endpoints.py'),
+                                        'agentic.llms.endpoints.EndpointPool.finish': ( 'buddy/backend/llms/endpoints.html#endpointpool.finish',
+                                                                                        'agentic/llms/endpoints.py'),
+                                        'agentic.llms.endpoints.EndpointPool.order': ( 'buddy/backend/llms/endpoints.html#endpointpool.order',
+                                                                                       'agentic/llms/endpoints.py'),
+                                        'agentic.llms.endpoints.EndpointPool.probe': ( 'buddy/backend/llms/endpoints.html#endpointpool.probe',
+                                                                                       'agentic/llms/endpoints.py'),
+                                        'agentic.llms.endpoints.EndpointPool.start': ( 'buddy/backend/llms/endpoints.html#endpointpool.start',
+                                                                                       'agentic/llms/endpoints.py'),
+                                        'agentic.llms.endpoints.EndpointPool.stats': ( 'buddy/backend/llms/endpoints.html#endpointpool.stats',
+                                                                                       'agentic/llms/endpoints.py'),
+                                        'agentic.llms.endpoints.EndpointPool.urls': ( 'buddy/backend/llms/endpoints.html#endpointpool.urls',
+                                                                                      'agentic/llms/endpoints.py'),
+                                        'agentic.llms.endpoints._affinity': ( 'buddy/backend/llms/endpoints.html#_affinity',
+                                                                              'agentic/llms/endpoints.py'),
+                                        'agentic.llms.endpoints.get_endpoint_pool': ( 'buddy/backend/llms/endpoints.html#get_endpoint_pool',
+                                                                                      'agentic/llms/endpoints.py')},
+            'agentic.llms.json_extractor': { 'agentic.llms.json_extractor.JsonExtractionError': ( 'buddy/backend/llms/json_extractor.html#jsonextractionerror',
+                                                                                                  'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.JsonExtractionError.__init__': ( 'buddy/backend/llms/json_extractor.html#jsonextractionerror.__init__',
+                                                                                                           'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.JsonStreamExtractor': ( 'buddy/backend/llms/json_extractor.html#jsonstreamextractor',
+                                                                                                  'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.JsonStreamExtractor.__init__': ( 'buddy/backend/llms/json_extractor.html#jsonstreamextractor.__init__',
+                                                                                                           'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.JsonStreamExtractor._accept': ( 'buddy/backend/llms/json_extractor.html#jsonstreamextractor._accept',
+                                                                                                          'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.JsonStreamExtractor._check_prefix': ( 'buddy/backend/llms/json_extractor.html#jsonstreamextractor._check_prefix',
+                                                                                                                'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.JsonStreamExtractor._diverged': ( 'buddy/backend/llms/json_extractor.html#jsonstreamextractor._diverged',
+                                                                                                            'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.JsonStreamExtractor._reset': ( 'buddy/backend/llms/json_extractor.html#jsonstreamextractor._reset',
+                                                                                                         'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.JsonStreamExtractor._scan': ( 'buddy/backend/llms/json_extractor.html#jsonstreamextractor._scan',
+                                                                                                        'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.JsonStreamExtractor._skip_fence': ( 'buddy/backend/llms/json_extractor.html#jsonstreamextractor._skip_fence',
+                                                                                                              'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.JsonStreamExtractor._skip_noise': ( 'buddy/backend/llms/json_extractor.html#jsonstreamextractor._skip_noise',
+                                                                                                              'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.JsonStreamExtractor.feed': ( 'buddy/backend/llms/json_extractor.html#jsonstreamextractor.feed',
+                                                                                                       'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.JsonStreamExtractor.finish': ( 'buddy/backend/llms/json_extractor.html#jsonstreamextractor.finish',
+                                                                                                         'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.JsonStreamExtractor.result': ( 'buddy/backend/llms/json_extractor.html#jsonstreamextractor.result',
+                                                                                                         'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor._open_paths': ( 'buddy/backend/llms/json_extractor.html#_open_paths',
+                                                                                          'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.complete_json': ( 'buddy/backend/llms/json_extractor.html#complete_json',
+                                                                                            'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.extract_json': ( 'buddy/backend/llms/json_extractor.html#extract_json',
+                                                                                           'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.repair_json': ( 'buddy/backend/llms/json_extractor.html#repair_json',
+                                                                                          'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.response_format_for': ( 'buddy/backend/llms/json_extractor.html#response_format_for',
+                                                                                                  'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.schema_name': ( 'buddy/backend/llms/json_extractor.html#schema_name',
+                                                                                          'agentic/llms/json_extractor.py'),
+                                             'agentic.llms.json_extractor.strip_think': ( 'buddy/backend/llms/json_extractor.html#strip_think',
+                                                                                          'agentic/llms/json_extractor.py')},
+            'agentic.llms.mock_server': { 'agentic.llms.mock_server.MockLLMServer': ( 'buddy/backend/llms/mock_server.html#mockllmserver',
+                                                                                      'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer.__enter__': ( 'buddy/backend/llms/mock_server.html#mockllmserver.__enter__',
+                                                                                                'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer.__exit__': ( 'buddy/backend/llms/mock_server.html#mockllmserver.__exit__',
+                                                                                               'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer.__init__': ( 'buddy/backend/llms/mock_server.html#mockllmserver.__init__',
+                                                                                               'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer._completion': ( 'buddy/backend/llms/mock_server.html#mockllmserver._completion',
+                                                                                                  'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer._deltas': ( 'buddy/backend/llms/mock_server.html#mockllmserver._deltas',
+                                                                                              'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer._handle': ( 'buddy/backend/llms/mock_server.html#mockllmserver._handle',
+                                                                                              'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer._read_request': ( 'buddy/backend/llms/mock_server.html#mockllmserver._read_request',
+                                                                                                    'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer._route': ( 'buddy/backend/llms/mock_server.html#mockllmserver._route',
+                                                                                             'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer._send': ( 'buddy/backend/llms/mock_server.html#mockllmserver._send',
+                                                                                            'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer._send_event': ( 'buddy/backend/llms/mock_server.html#mockllmserver._send_event',
+                                                                                                  'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer._shutdown': ( 'buddy/backend/llms/mock_server.html#mockllmserver._shutdown',
+                                                                                                'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer._stream': ( 'buddy/backend/llms/mock_server.html#mockllmserver._stream',
+                                                                                              'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer._whole': ( 'buddy/backend/llms/mock_server.html#mockllmserver._whole',
+                                                                                             'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer.base_url': ( 'buddy/backend/llms/mock_server.html#mockllmserver.base_url',
+                                                                                               'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer.pick': ( 'buddy/backend/llms/mock_server.html#mockllmserver.pick',
+                                                                                           'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer.run_in_thread': ( 'buddy/backend/llms/mock_server.html#mockllmserver.run_in_thread',
+                                                                                                    'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer.serve_forever': ( 'buddy/backend/llms/mock_server.html#mockllmserver.serve_forever',
+                                                                                                    'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer.start': ( 'buddy/backend/llms/mock_server.html#mockllmserver.start',
+                                                                                            'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.MockLLMServer.stop': ( 'buddy/backend/llms/mock_server.html#mockllmserver.stop',
+                                                                                           'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.ScriptedResponse': ( 'buddy/backend/llms/mock_server.html#scriptedresponse',
+                                                                                         'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server._message_text': ( 'buddy/backend/llms/mock_server.html#_message_text',
+                                                                                      'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server._tokens': ( 'buddy/backend/llms/mock_server.html#_tokens',
+                                                                                'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.load_script': ( 'buddy/backend/llms/mock_server.html#load_script',
+                                                                                    'agentic/llms/mock_server.py'),
+                                          'agentic.llms.mock_server.main': ( 'buddy/backend/llms/mock_server.html#main',
+                                                                             'agentic/llms/mock_server.py')},
+            'agentic.llms.prompt_layout': { 'agentic.llms.prompt_layout.PrefixTracker': ( 'buddy/backend/llms/prompt_layout.html#prefixtracker',
+                                                                                          'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.PrefixTracker.__init__': ( 'buddy/backend/llms/prompt_layout.html#prefixtracker.__init__',
+                                                                                                   'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.PrefixTracker.observe': ( 'buddy/backend/llms/prompt_layout.html#prefixtracker.observe',
+                                                                                                  'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.PrefixTracker.stats': ( 'buddy/backend/llms/prompt_layout.html#prefixtracker.stats',
+                                                                                                'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.PromptLayout': ( 'buddy/backend/llms/prompt_layout.html#promptlayout',
+                                                                                         'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.PromptLayout.__init__': ( 'buddy/backend/llms/prompt_layout.html#promptlayout.__init__',
+                                                                                                  'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.PromptLayout.__str__': ( 'buddy/backend/llms/prompt_layout.html#promptlayout.__str__',
+                                                                                                 'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.PromptLayout.add': ( 'buddy/backend/llms/prompt_layout.html#promptlayout.add',
+                                                                                             'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.PromptLayout.context': ( 'buddy/backend/llms/prompt_layout.html#promptlayout.context',
+                                                                                                 'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.PromptLayout.render': ( 'buddy/backend/llms/prompt_layout.html#promptlayout.render',
+                                                                                                'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.PromptLayout.static': ( 'buddy/backend/llms/prompt_layout.html#promptlayout.static',
+                                                                                                'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.PromptLayout.tools': ( 'buddy/backend/llms/prompt_layout.html#promptlayout.tools',
+                                                                                               'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.PromptLayout.volatile': ( 'buddy/backend/llms/prompt_layout.html#promptlayout.volatile',
+                                                                                                  'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.Segment': ( 'buddy/backend/llms/prompt_layout.html#segment',
+                                                                                    'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.Stability': ( 'buddy/backend/llms/prompt_layout.html#stability',
+                                                                                      'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.get_prefix_tracker': ( 'buddy/backend/llms/prompt_layout.html#get_prefix_tracker',
+                                                                                               'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.serialize_request': ( 'buddy/backend/llms/prompt_layout.html#serialize_request',
+                                                                                              'agentic/llms/prompt_layout.py'),
+                                            'agentic.llms.prompt_layout.shared_prefix': ( 'buddy/backend/llms/prompt_layout.html#shared_prefix',
+                                                                                          'agentic/llms/prompt_layout.py')},
+            'agentic.llms.rate_limiter': { 'agentic.llms.rate_limiter.RateLimitExceeded': ( 'buddy/backend/llms/rate_limiter.html#ratelimitexceeded',
+                                                                                            'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.RateLimitExceeded.__init__': ( 'buddy/backend/llms/rate_limiter.html#ratelimitexceeded.__init__',
+                                                                                                     'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.RateLimiter': ( 'buddy/backend/llms/rate_limiter.html#ratelimiter',
+                                                                                      'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.RateLimiter.__init__': ( 'buddy/backend/llms/rate_limiter.html#ratelimiter.__init__',
+                                                                                               'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.RateLimiter._bucket': ( 'buddy/backend/llms/rate_limiter.html#ratelimiter._bucket',
+                                                                                              'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.RateLimiter._pause_wait': ( 'buddy/backend/llms/rate_limiter.html#ratelimiter._pause_wait',
+                                                                                                  'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.RateLimiter._reserve': ( 'buddy/backend/llms/rate_limiter.html#ratelimiter._reserve',
+                                                                                               'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.RateLimiter.acquire': ( 'buddy/backend/llms/rate_limiter.html#ratelimiter.acquire',
+                                                                                              'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.RateLimiter.acquire_async': ( 'buddy/backend/llms/rate_limiter.html#ratelimiter.acquire_async',
+                                                                                                    'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.RateLimiter.backoff': ( 'buddy/backend/llms/rate_limiter.html#ratelimiter.backoff',
+                                                                                              'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.RateLimiter.limits_tokens': ( 'buddy/backend/llms/rate_limiter.html#ratelimiter.limits_tokens',
+                                                                                                    'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.RateLimiter.record_usage': ( 'buddy/backend/llms/rate_limiter.html#ratelimiter.record_usage',
+                                                                                                   'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.RateLimiter.set_limit': ( 'buddy/backend/llms/rate_limiter.html#ratelimiter.set_limit',
+                                                                                                'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.RateLimiter.stats': ( 'buddy/backend/llms/rate_limiter.html#ratelimiter.stats',
+                                                                                            'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.TokenBucket': ( 'buddy/backend/llms/rate_limiter.html#tokenbucket',
+                                                                                      'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.TokenBucket.__init__': ( 'buddy/backend/llms/rate_limiter.html#tokenbucket.__init__',
+                                                                                               'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.TokenBucket._refill': ( 'buddy/backend/llms/rate_limiter.html#tokenbucket._refill',
+                                                                                              'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.TokenBucket.adjust': ( 'buddy/backend/llms/rate_limiter.html#tokenbucket.adjust',
+                                                                                             'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.TokenBucket.level': ( 'buddy/backend/llms/rate_limiter.html#tokenbucket.level',
+                                                                                            'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.TokenBucket.pause': ( 'buddy/backend/llms/rate_limiter.html#tokenbucket.pause',
+                                                                                            'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.TokenBucket.reserve': ( 'buddy/backend/llms/rate_limiter.html#tokenbucket.reserve',
+                                                                                              'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.TokenBucket.try_acquire': ( 'buddy/backend/llms/rate_limiter.html#tokenbucket.try_acquire',
+                                                                                                  'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.TokenBucket.wait_time': ( 'buddy/backend/llms/rate_limiter.html#tokenbucket.wait_time',
+                                                                                                'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.estimate_tokens': ( 'buddy/backend/llms/rate_limiter.html#estimate_tokens',
+                                                                                          'agentic/llms/rate_limiter.py'),
+                                           'agentic.llms.rate_limiter.get_rate_limiter': ( 'buddy/backend/llms/rate_limiter.html#get_rate_limiter',
+                                                                                           'agentic/llms/rate_limiter.py')},
+            'agentic.llms.resilience': { 'agentic.llms.resilience.PrimedStream': ( 'buddy/backend/llms/resilience.html#primedstream',
+                                                                                   'agentic/llms/resilience.py'),
+                                         'agentic.llms.resilience.PrimedStream.__getattr__': ( 'buddy/backend/llms/resilience.html#primedstream.__getattr__',
+                                                                                               'agentic/llms/resilience.py'),
+                                         'agentic.llms.resilience.PrimedStream.__init__': ( 'buddy/backend/llms/resilience.html#primedstream.__init__',
+                                                                                            'agentic/llms/resilience.py'),
+                                         'agentic.llms.resilience.PrimedStream.__iter__': ( 'buddy/backend/llms/resilience.html#primedstream.__iter__',
+                                                                                            'agentic/llms/resilience.py'),
+                                         'agentic.llms.resilience.PrimedStream.close': ( 'buddy/backend/llms/resilience.html#primedstream.close',
+                                                                                         'agentic/llms/resilience.py'),
+                                         'agentic.llms.resilience.ResilientCaller': ( 'buddy/backend/llms/resilience.html#resilientcaller',
+                                                                                      'agentic/llms/resilience.py'),
+                                         'agentic.llms.resilience.ResilientCaller.__init__': ( 'buddy/backend/llms/resilience.html#resilientcaller.__init__',
+                                                                                               'agentic/llms/resilience.py'),
+                                         'agentic.llms.resilience.ResilientCaller._attempt': ( 'buddy/backend/llms/resilience.html#resilientcaller._attempt',
+                                                                                               'agentic/llms/resilience.py'),
+                                         'agentic.llms.resilience.ResilientCaller._first': ( 'buddy/backend/llms/resilience.html#resilientcaller._first',
+                                                                                             'agentic/llms/resilience.py'),
+                                         'agentic.llms.resilience.ResilientCaller.backoff': ( 'buddy/backend/llms/resilience.html#resilientcaller.backoff',
+                                                                                              'agentic/llms/resilience.py'),
+                                         'agentic.llms.resilience.ResilientCaller.call': ( 'buddy/backend/llms/resilience.html#resilientcaller.call',
+                                                                                           'agentic/llms/resilience.py'),
+                                         'agentic.llms.resilience.ResilientCaller.hedge_delay': ( 'buddy/backend/llms/resilience.html#resilientcaller.hedge_delay',
+                                                                                                  'agentic/llms/resilience.py'),
+                                         'agentic.llms.resilience._close_loser': ( 'buddy/backend/llms/resilience.html#_close_loser',
+                                                                                   'agentic/llms/resilience.py'),
+                                         'agentic.llms.resilience._hedge_executor': ( 'buddy/backend/llms/resilience.html#_hedge_executor',
+                                                                                      'agentic/llms/resilience.py'),
+                                         'agentic.llms.resilience.is_retryable': ( 'buddy/backend/llms/resilience.html#is_retryable',
+                                                                                   'agentic/llms/resilience.py'),
+                                         'agentic.llms.resilience.retry_after': ( 'buddy/backend/llms/resilience.html#retry_after',
+                                                                                  'agentic/llms/resilience.py')},
+            'agentic.llms.response_cache': { 'agentic.llms.response_cache.ResponseCache': ( 'buddy/backend/llms/response_cache.html#responsecache',
+                                                                                            'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache.ResponseCache.__init__': ( 'buddy/backend/llms/response_cache.html#responsecache.__init__',
+                                                                                                     'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache.ResponseCache._connect': ( 'buddy/backend/llms/response_cache.html#responsecache._connect',
+                                                                                                     'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache.ResponseCache._evict': ( 'buddy/backend/llms/response_cache.html#responsecache._evict',
+                                                                                                   'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache.ResponseCache._nearest': ( 'buddy/backend/llms/response_cache.html#responsecache._nearest',
+                                                                                                     'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache.ResponseCache.cacheable': ( 'buddy/backend/llms/response_cache.html#responsecache.cacheable',
+                                                                                                      'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache.ResponseCache.clear': ( 'buddy/backend/llms/response_cache.html#responsecache.clear',
+                                                                                                  'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache.ResponseCache.lookup': ( 'buddy/backend/llms/response_cache.html#responsecache.lookup',
+                                                                                                   'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache.ResponseCache.stats': ( 'buddy/backend/llms/response_cache.html#responsecache.stats',
+                                                                                                  'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache.ResponseCache.store': ( 'buddy/backend/llms/response_cache.html#responsecache.store',
+                                                                                                  'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache._canonical': ( 'buddy/backend/llms/response_cache.html#_canonical',
+                                                                                         'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache._normalized': ( 'buddy/backend/llms/response_cache.html#_normalized',
+                                                                                          'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache._usage_dict': ( 'buddy/backend/llms/response_cache.html#_usage_dict',
+                                                                                          'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache.get_response_cache': ( 'buddy/backend/llms/response_cache.html#get_response_cache',
+                                                                                                 'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache.hashed_embedding': ( 'buddy/backend/llms/response_cache.html#hashed_embedding',
+                                                                                               'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache.prompt_text': ( 'buddy/backend/llms/response_cache.html#prompt_text',
+                                                                                          'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache.replay_response': ( 'buddy/backend/llms/response_cache.html#replay_response',
+                                                                                              'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache.replay_stream': ( 'buddy/backend/llms/response_cache.html#replay_stream',
+                                                                                            'agentic/llms/response_cache.py'),
+                                             'agentic.llms.response_cache.request_keys': ( 'buddy/backend/llms/response_cache.html#request_keys',
+                                                                                           'agentic/llms/response_cache.py')},
             'agentic.llms.response_processor': { 'agentic.llms.response_processor.ResponseProcessor': ( 'buddy/backend/llms/response_processor.html#responseprocessor',
                                                                                                         'agentic/llms/response_processor.py'),
                                                  'agentic.llms.response_processor.ResponseProcessor.__init__': ( 'buddy/backend/llms/response_processor.html#responseprocessor.__init__',
@@ -481,6 +1116,28 @@ d = { 'settings': { 'branch': 'main',
                                                                                                          'agentic/llms/streaming_handler.py'),
                                                 'agentic.llms.streaming_handler.show_thinking_header': ( 'buddy/backend/llms/streaming_handler.html#show_thinking_header',
                                                                                                          'agentic/llms/streaming_handler.py')},
+            'agentic.router': { 'agentic.router.RequestRouter': ('buddy/frontend/router.html#requestrouter', 'agentic/router.py'),
+                                'agentic.router.RequestRouter.__init__': ( 'buddy/frontend/router.html#requestrouter.__init__',
+                                                                           'agentic/router.py'),
+                                'agentic.router.RequestRouter._fs_args': ( 'buddy/frontend/router.html#requestrouter._fs_args',
+                                                                           'agentic/router.py'),
+                                'agentic.router.RequestRouter._load_log': ( 'buddy/frontend/router.html#requestrouter._load_log',
+                                                                            'agentic/router.py'),
+                                'agentic.router.RequestRouter._train': ( 'buddy/frontend/router.html#requestrouter._train',
+                                                                         'agentic/router.py'),
+                                'agentic.router.RequestRouter._vector': ( 'buddy/frontend/router.html#requestrouter._vector',
+                                                                          'agentic/router.py'),
+                                'agentic.router.RequestRouter.classify': ( 'buddy/frontend/router.html#requestrouter.classify',
+                                                                           'agentic/router.py'),
+                                'agentic.router.RequestRouter.label_from_tool_calls': ( 'buddy/frontend/router.html#requestrouter.label_from_tool_calls',
+                                                                                        'agentic/router.py'),
+                                'agentic.router.RequestRouter.record': ( 'buddy/frontend/router.html#requestrouter.record',
+                                                                         'agentic/router.py'),
+                                'agentic.router.RequestRouter.route': ( 'buddy/frontend/router.html#requestrouter.route',
+                                                                        'agentic/router.py'),
+                                'agentic.router.Route': ('buddy/frontend/router.html#route', 'agentic/router.py'),
+                                'agentic.router._existing_path': ('buddy/frontend/router.html#_existing_path', 'agentic/router.py'),
+                                'agentic.router._tokens': ('buddy/frontend/router.html#_tokens', 'agentic/router.py')},
             'agentic.schemas': { 'agentic.schemas.AnalysisResult': ('buddy/backend/schemas.html#analysisresult', 'agentic/schemas.py'),
                                  'agentic.schemas.BuddyTool': ('buddy/backend/schemas.html#buddytool', 'agentic/schemas.py'),
                                  'agentic.schemas.CodeInterpreterParams': ( 'buddy/backend/schemas.html#codeinterpreterparams',
@@ -768,8 +1425,12 @@ d = { 'settings': { 'branch': 'main',
                                                                                        'agentic/tools/manager.py'),
                                        'agentic.tools.manager.ToolManager._register_default_tools': ( 'buddy/backend/tools/core/manager.html#toolmanager._register_default_tools',
                                                                                                       'agentic/tools/manager.py'),
+                                       'agentic.tools.manager.ToolManager._register_plugin_tools': ( 'buddy/backend/tools/core/manager.html#toolmanager._register_plugin_tools',
+                                                                                                     'agentic/tools/manager.py'),
                                        'agentic.tools.manager.ToolManager.execute_tool': ( 'buddy/backend/tools/core/manager.html#toolmanager.execute_tool',
                                                                                            'agentic/tools/manager.py'),
+                                       'agentic.tools.manager.ToolManager.get_plugin_report': ( 'buddy/backend/tools/core/manager.html#toolmanager.get_plugin_report',
+                                                                                                'agentic/tools/manager.py'),
                                        'agentic.tools.manager.ToolManager.get_tool_info': ( 'buddy/backend/tools/core/manager.html#toolmanager.get_tool_info',
                                                                                             'agentic/tools/manager.py'),
                                        'agentic.tools.manager.ToolManager.get_tools': ( 'buddy/backend/tools/core/manager.html#toolmanager.get_tools',
@@ -778,6 +1439,8 @@ d = { 'settings': { 'branch': 'main',
                                                                                          'agentic/tools/manager.py'),
                                        'agentic.tools.manager.ToolManager.register_custom_tool': ( 'buddy/backend/tools/core/manager.html#toolmanager.register_custom_tool',
                                                                                                    'agentic/tools/manager.py'),
+                                       'agentic.tools.manager.ToolManager.select_tools': ( 'buddy/backend/tools/core/manager.html#toolmanager.select_tools',
+                                                                                           'agentic/tools/manager.py'),
                                        'agentic.tools.manager.ToolManager.unregister_tool': ( 'buddy/backend/tools/core/manager.html#toolmanager.unregister_tool',
                                                                                               'agentic/tools/manager.py')},
             'agentic.tools.memory': { 'agentic.tools.memory.MemoryManagerTool': ( 'buddy/backend/tools/utilities/memory.html#memorymanagertool',
@@ -796,6 +1459,34 @@ d = { 'settings': { 'branch': 'main',
                                                                                       'agentic/tools/planner.py'),
                                        'agentic.tools.planner.PlannerTool.get_parameters_schema': ( 'buddy/backend/tools/planner/task_planner.html#plannertool.get_parameters_schema',
                                                                                                     'agentic/tools/planner.py')},
+            'agentic.tools.plugins': { 'agentic.tools.plugins.LazyPluginTool': ( 'buddy/backend/tools/core/plugins.html#lazyplugintool',
+                                                                                 'agentic/tools/plugins.py'),
+                                       'agentic.tools.plugins.LazyPluginTool.__init__': ( 'buddy/backend/tools/core/plugins.html#lazyplugintool.__init__',
+                                                                                          'agentic/tools/plugins.py'),
+                                       'agentic.tools.plugins.LazyPluginTool._load': ( 'buddy/backend/tools/core/plugins.html#lazyplugintool._load',
+                                                                                       'agentic/tools/plugins.py'),
+                                       'agentic.tools.plugins.LazyPluginTool.execute': ( 'buddy/backend/tools/core/plugins.html#lazyplugintool.execute',
+                                                                                         'agentic/tools/plugins.py'),
+                                       'agentic.tools.plugins.LazyPluginTool.get_parameters_schema': ( 'buddy/backend/tools/core/plugins.html#lazyplugintool.get_parameters_schema',
+                                                                                                       'agentic/tools/plugins.py'),
+                                       'agentic.tools.plugins.LazyPluginTool.validate_parameters': ( 'buddy/backend/tools/core/plugins.html#lazyplugintool.validate_parameters',
+                                                                                                     'agentic/tools/plugins.py'),
+                                       'agentic.tools.plugins.ToolPluginInfo': ( 'buddy/backend/tools/core/plugins.html#toolplugininfo',
+                                                                                 'agentic/tools/plugins.py'),
+                                       'agentic.tools.plugins.ToolPluginLoader': ( 'buddy/backend/tools/core/plugins.html#toolpluginloader',
+                                                                                   'agentic/tools/plugins.py'),
+                                       'agentic.tools.plugins.ToolPluginLoader.__init__': ( 'buddy/backend/tools/core/plugins.html#toolpluginloader.__init__',
+                                                                                            'agentic/tools/plugins.py'),
+                                       'agentic.tools.plugins.ToolPluginLoader._build_tool': ( 'buddy/backend/tools/core/plugins.html#toolpluginloader._build_tool',
+                                                                                               'agentic/tools/plugins.py'),
+                                       'agentic.tools.plugins.ToolPluginLoader.discover': ( 'buddy/backend/tools/core/plugins.html#toolpluginloader.discover',
+                                                                                            'agentic/tools/plugins.py'),
+                                       'agentic.tools.plugins.ToolPluginLoader.report': ( 'buddy/backend/tools/core/plugins.html#toolpluginloader.report',
+                                                                                          'agentic/tools/plugins.py'),
+                                       'agentic.tools.plugins._resolve': ( 'buddy/backend/tools/core/plugins.html#_resolve',
+                                                                           'agentic/tools/plugins.py'),
+                                       'agentic.tools.plugins._to_category': ( 'buddy/backend/tools/core/plugins.html#_to_category',
+                                                                               'agentic/tools/plugins.py')},
             'agentic.tools.registry': { 'agentic.tools.registry.ToolRegistry': ( 'buddy/backend/tools/core/registry.html#toolregistry',
                                                                                  'agentic/tools/registry.py'),
                                         'agentic.tools.registry.ToolRegistry.__init__': ( 'buddy/backend/tools/core/registry.html#toolregistry.__init__',
@@ -818,6 +1509,24 @@ d = { 'settings': { 'branch': 'main',
                                                                                               'agentic/tools/registry.py'),
                                         'agentic.tools.registry.ToolRegistry.unregister_tool': ( 'buddy/backend/tools/core/registry.html#toolregistry.unregister_tool',
                                                                                                  'agentic/tools/registry.py')},
+            'agentic.tools.selector': { 'agentic.tools.selector.ToolSelector': ( 'buddy/backend/tools/core/selector.html#toolselector',
+                                                                                 'agentic/tools/selector.py'),
+                                        'agentic.tools.selector.ToolSelector.__init__': ( 'buddy/backend/tools/core/selector.html#toolselector.__init__',
+                                                                                          'agentic/tools/selector.py'),
+                                        'agentic.tools.selector.ToolSelector._ensure_index': ( 'buddy/backend/tools/core/selector.html#toolselector._ensure_index',
+                                                                                               'agentic/tools/selector.py'),
+                                        'agentic.tools.selector.ToolSelector._tokenize': ( 'buddy/backend/tools/core/selector.html#toolselector._tokenize',
+                                                                                           'agentic/tools/selector.py'),
+                                        'agentic.tools.selector.ToolSelector._tool_document': ( 'buddy/backend/tools/core/selector.html#toolselector._tool_document',
+                                                                                                'agentic/tools/selector.py'),
+                                        'agentic.tools.selector.ToolSelector._usage_boost': ( 'buddy/backend/tools/core/selector.html#toolselector._usage_boost',
+                                                                                              'agentic/tools/selector.py'),
+                                        'agentic.tools.selector.ToolSelector.record_usage': ( 'buddy/backend/tools/core/selector.html#toolselector.record_usage',
+                                                                                              'agentic/tools/selector.py'),
+                                        'agentic.tools.selector.ToolSelector.score': ( 'buddy/backend/tools/core/selector.html#toolselector.score',
+                                                                                       'agentic/tools/selector.py'),
+                                        'agentic.tools.selector.ToolSelector.select': ( 'buddy/backend/tools/core/selector.html#toolselector.select',
+                                                                                        'agentic/tools/selector.py')},
             'agentic.tools.task_executor': { 'agentic.tools.task_executor.TaskExecutorTool': ( 'buddy/backend/tools/planning/task_executor.html#taskexecutortool',
                                                                                                'agentic/tools/task_executor.py'),
                                              'agentic.tools.task_executor.TaskExecutorTool.__init__': ( 'buddy/backend/tools/planning/task_executor.html#taskexecutortool.__init__',
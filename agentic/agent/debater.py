@@ -1,15 +1,20 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/backend/agents/debater.ipynb.
 
 # %% auto 0
-__all__ = ['DebateRole', 'DebateConfig', 'DebateAgent', 'create_debate']
+__all__ = ['REBUTTAL_CUES', 'EVIDENCE_CUES', 'DEBATERS', 'DebateRole', 'DebateConfig', 'StatementDigest', 'DebateTranscript',
+           'DebateAgent', 'create_debate']
 
 # %% ../../nbs/buddy/backend/agents/debater.ipynb 1
 from enum import Enum
-from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Callable, Awaitable
+import io
+import re
 import asyncio
+from rich.console import Console
 from ..core.agent import Agent, AgentConfig
 from ..llms.client import LLMClient
+from .decisions import DecisionCache
 
 
 # %% ../../nbs/buddy/backend/agents/debater.ipynb 2
@@ -26,6 +31,84 @@ class DebateConfig:
     max_rounds: int = 2
     time_limit: Optional[int] = None
 
+REBUTTAL_CUES = re.compile(r"\b(however|but|although|contrary|overlooks?|ignores?|fails? to|disagree|counter|flawed|weakness)\b", re.I)
+EVIDENCE_CUES = re.compile(r"(\d|%|\b(for example|e\.g\.|for instance|benchmarks?|stud(y|ies)|data|measured|according to|in practice)\b)", re.I)
+
+@dataclass
+class StatementDigest:
+    role: str
+    type: str
+    claims: List[str] = field(default_factory=list)
+    rebuttals: List[str] = field(default_factory=list)
+    evidence: List[str] = field(default_factory=list)
+
+    def render(self) -> str:
+        parts = [f"{name}: {' | '.join(items)}" for name, items in
+                 [("claims", self.claims), ("rebuts", self.rebuttals), ("evidence", self.evidence)] if items]
+        return f"- {self.role.capitalize()}: " + ("; ".join(parts) or "(no substantive points)")
+
+class DebateTranscript:
+    """Debate statements with a rolling digest of everything before the latest round.
+
+    Each statement is reduced once, when added, to a few claim, rebuttal and
+    evidence sentences (picked by cue words, no LLM call). Prompts get that
+    digest for earlier rounds and only the latest round verbatim, so they grow
+    by a few lines per round instead of by every full statement.
+    """
+
+    def __init__(self, max_items: int = 2, max_chars: int = 160):
+        self.max_items = max_items
+        self.max_chars = max_chars
+        self.statements: List[Dict] = []
+        self._digests: Dict[int, StatementDigest] = {}
+
+    def add(self, role: str, type: str, content: str):
+        statement = {"role": role, "type": type, "content": content}
+        self._digests[len(self.statements)] = self.digest(statement)
+        self.statements.append(statement)
+
+    def digest(self, statement: Dict) -> StatementDigest:
+        """Claims, rebuttals and evidence sentences of one statement"""
+        digest = StatementDigest(role=statement["role"], type=statement["type"])
+        text = re.sub(r"<think>.*?</think>", "", statement["content"], flags=re.S)
+        for sentence in re.split(r"(?<=[.!?])\s+|\n+", text):
+            sentence = re.sub(r"^[\s#>*\-\d.)]+|[*_`]", "", sentence).strip()
+            if len(sentence) < 25:
+                continue
+            if REBUTTAL_CUES.search(sentence):
+                bucket = digest.rebuttals
+            elif EVIDENCE_CUES.search(sentence):
+                bucket = digest.evidence
+            else:
+                bucket = digest.claims
+            sentence = sentence[:self.max_chars]
+            if len(bucket) < self.max_items and sentence not in bucket:
+                bucket.append(sentence)
+        return digest
+
+    def summary(self) -> str:
+        """Digest of every statement"""
+        return "\n".join(self._digests[i].render() for i in range(len(self.statements)))
+
+    def render(self) -> str:
+        """Digest of earlier rounds followed by the latest round verbatim"""
+        if not self.statements:
+            return ""
+        latest = self.statements[-1]["type"]
+        parts = []
+        rounds: Dict[str, List[str]] = {}
+        for i, statement in enumerate(self.statements):
+            if statement["type"] != latest:
+                rounds.setdefault(statement["type"], []).append(self._digests[i].render())
+        if rounds:
+            parts.append("Digest of earlier rounds:")
+            for round_type, lines in rounds.items():
+                parts.append(f"[{round_type}]\n" + "\n".join(lines))
+            parts.append(f"Latest round ({latest}):")
+        parts.extend(f"{stmt['role'].capitalize()} ({stmt['type']}): {stmt['content']}"
+                     for stmt in self.statements if stmt["type"] == latest)
+        return "\n\n".join(parts)
+
 class DebateAgent(Agent):
     """Multi-agent debate system for structured decision making"""
 
@@ -42,7 +125,14 @@ class DebateAgent(Agent):
             DebateRole.MODERATOR: f"You moderate the debate on: {debate_config.topic}. Synthesize arguments and provide final verdict."
         }
 
-    async def opening_statement(self) -> str:
+    def _generate(self, prompt: str, console: Optional[Console] = None) -> str:
+        """Stream one completion into `console` (the default console when None)"""
+        messages = [{"role": "user", "content": prompt}]
+        response = self.llm_client.create_completion(messages=messages, stream=True, session=self.session_id)
+        result = self.llm_client.handle_streaming_response(response, console)
+        return result.get("content", "") if isinstance(result, dict) else str(result)
+
+    async def opening_statement(self, console: Optional[Console] = None) -> str:
         """Generate opening statement based on role"""
         prompt = f"""
 {self.role_prompts[self.role]}
@@ -54,22 +144,13 @@ Provide your opening statement:
 - Provide 2-3 key arguments supporting your stance
 - Preview technical evidence or examples to back your claims
 """
-        messages = [{"role": "user", "content": prompt}]
-        response = self.llm_client.create_completion(messages=messages, stream=True)
-        result = self.llm_client.handle_streaming_response(response)
-
-        text = result.get("content", "") if isinstance(result, dict) else str(result)
+        # LLMClient is synchronous - run it in a thread so turns can overlap
+        text = await asyncio.to_thread(self._generate, prompt, console)
         self.debate_history.append({"role": self.role.value, "type": "opening", "content": text})
         return text
 
-    async def respond_to_debate(self, previous_statements: List[Dict]) -> str:
-        """Respond to previous debate statements with context"""
-        # Format previous statements for context
-        debate_context = "\n\n".join(
-            [f"{stmt['role'].capitalize()} ({stmt['type']}): {stmt['content']}" 
-             for stmt in previous_statements]
-        )
-
+    async def respond_to_debate(self, debate_context: str, console: Optional[Console] = None) -> str:
+        """Respond to previous debate statements (a rendered DebateTranscript)"""
         prompt = f"""
 {self.role_prompts[self.role]}
 
@@ -83,24 +164,16 @@ Respond to the ongoing debate (250-300 words):
 - Reinforce or refute arguments with technical reasoning
 - Provide concise, evidence-based arguments
 """
-        messages = [{"role": "user", "content": prompt}]
-        response = self.llm_client.create_completion(messages=messages, stream=True)
-        result = self.llm_client.handle_streaming_response(response)
-
-        text = result.get("content", "") if isinstance(result, dict) else str(result)
+        # LLMClient is synchronous - run it in a thread so turns can overlap
+        text = await asyncio.to_thread(self._generate, prompt, console)
         self.debate_history.append({"role": self.role.value, "type": "response", "content": text})
         return text
 
-    async def final_verdict(self, all_statements: List[Dict]) -> str:
-        """Generate final verdict (moderator only)"""
+    async def final_verdict(self, context: str, console: Optional[Console] = None) -> str:
+        """Generate final verdict (moderator only) from a rendered DebateTranscript"""
         if self.role != DebateRole.MODERATOR:
             return ""
 
-        context = "\n\n".join(
-            [f"{stmt['role'].capitalize()} ({stmt['type']}): {stmt['content']}" 
-             for stmt in all_statements]
-        )
-
         prompt = f"""
 {self.role_prompts[self.role]}
 
@@ -115,16 +188,35 @@ Provide the final verdict (200-250 words):
 3. Provide a final recommendation with clear reasoning
 4. Discuss implementation considerations
 """
-        messages = [{"role": "user", "content": prompt}]
-        response = self.llm_client.create_completion(messages=messages, stream=True)
-        result = self.llm_client.handle_streaming_response(response)
-
-        text = result.get("content", "") if isinstance(result, dict) else str(result)
+        # LLMClient is synchronous - run it in a thread so turns can overlap
+        text = await asyncio.to_thread(self._generate, prompt, console)
         self.debate_history.append({"role": self.role.value, "type": "verdict", "content": text})
         return text
 
-async def create_debate(topic: str, context: str, max_rounds: int = 2) -> Dict[str, Any]:
-    """Create and run a structured debate"""
+DEBATERS = [DebateRole.ADVOCATE, DebateRole.CRITIC, DebateRole.EXPERT]
+
+async def _run_turns(agents: Dict[DebateRole, DebateAgent], turn: Callable[[DebateAgent, Console], Awaitable[str]],
+                     console: Console) -> List[str]:
+    """Run the debaters' turns concurrently, printing each buffered turn in role order"""
+    buffers = {role: Console(file=io.StringIO(), force_terminal=console.is_terminal, width=console.width) for role in DEBATERS}
+    tasks = [asyncio.create_task(turn(agents[role], buffers[role])) for role in DEBATERS]
+    statements = []
+    for role, task in zip(DEBATERS, tasks):
+        statements.append(await task)
+        console.print(f"\n🗣️ {role.value.capitalize()}")
+        console.file.write(buffers[role].file.getvalue())
+        console.file.flush()
+    return statements
+
+async def create_debate(topic: str, context: str, max_rounds: int = 2, use_cache: bool = True) -> Dict[str, Any]:
+    """Create and run a structured debate, reusing the verdict of a near-duplicate one"""
+    console = Console()
+    decisions = DecisionCache() if use_cache else None
+    cached = decisions.lookup("debate", topic, context) if decisions else None
+    if cached:
+        console.print(f"♻️ Reusing cached verdict for '{topic}' (similarity {cached.similarity:.2f}, {cached.age_seconds / 3600:.1f}h old)")
+        return cached.verdict
+
     debate_config = DebateConfig(topic=topic, context=context, max_rounds=max_rounds)
 
     base_config = AgentConfig(name="debate_agent", model="qwen3:8b")
@@ -135,26 +227,29 @@ async def create_debate(topic: str, context: str, max_rounds: int = 2) -> Dict[s
         DebateRole.MODERATOR: DebateAgent(base_config, DebateRole.MODERATOR, debate_config),
     }
 
-    all_statements: List[Dict] = []
+    transcript = DebateTranscript()
 
-    # Opening statements
-    for role in [DebateRole.ADVOCATE, DebateRole.CRITIC, DebateRole.EXPERT]:
-        statement = await agents[role].opening_statement()
-        all_statements.append({"role": role.value, "type": "opening", "content": statement})
+    # Opening statements are independent of each other
+    openings = await _run_turns(agents, lambda agent, out: agent.opening_statement(out), console)
+    for role, statement in zip(DEBATERS, openings):
+        transcript.add(role.value, "opening", statement)
 
-    # Discussion rounds
+    # Discussion rounds: every role answers the statements up to the previous round
     for round_num in range(max_rounds):
-        for role in [DebateRole.ADVOCATE, DebateRole.CRITIC, DebateRole.EXPERT]:
-            response = await agents[role].respond_to_debate(all_statements)
-            all_statements.append({"role": role.value, "type": f"round_{round_num+1}", "content": response})
+        previous = transcript.render()
+        responses = await _run_turns(agents, lambda agent, out: agent.respond_to_debate(previous, out), console)
+        for role, response in zip(DEBATERS, responses):
+            transcript.add(role.value, f"round_{round_num+1}", response)
 
     # Final verdict
-    verdict = await agents[DebateRole.MODERATOR].final_verdict(all_statements)
+    verdict = await agents[DebateRole.MODERATOR].final_verdict(transcript.render())
+    if decisions and verdict:
+        decisions.store("debate", topic, context, verdict, rationale=transcript.summary())
     return verdict
     # return {
     #     "topic": topic,
     #     "context": context,
-    #     "statements": all_statements,
+    #     "statements": transcript.statements,
     #     "verdict": verdict,
     #     "rounds": max_rounds,
     # }
@@ -0,0 +1,163 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/backend/agents/decisions.ipynb.
+
+# %% auto 0
+__all__ = ['STOPWORDS', 'CachedDecision', 'normalize_topic', 'MinHasher', 'DecisionCache']
+
+# %% ../../nbs/buddy/backend/agents/decisions.ipynb 1
+import os
+import re
+import json
+import time
+import sqlite3
+import hashlib
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from ..configs.loader import get_decision_cache_config
+
+
+# %% ../../nbs/buddy/backend/agents/decisions.ipynb 2
+STOPWORDS = {
+    "a", "an", "the", "and", "or", "vs", "versus", "between", "choose", "choosing", "select", "selection",
+    "which", "should", "we", "use", "using", "for", "of", "to", "in", "on", "with", "is", "best", "analysis"
+}
+
+_MERSENNE = (1 << 61) - 1
+
+
+@dataclass
+class CachedDecision:
+    verdict: Any
+    rationale: str
+    similarity: float
+    age_seconds: float
+
+
+def normalize_topic(topic: str) -> str:
+    """Order-insensitive topic key: "FastAPI vs Flask" == "flask or fastapi?" """
+    words = re.findall(r"[a-z0-9][a-z0-9+#.]*", topic.lower())
+    return " ".join(sorted({w.rstrip(".") for w in words} - STOPWORDS))
+
+
+class MinHasher:
+    """MinHash signatures over word 3-shingles; agreement estimates Jaccard similarity"""
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 3):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        seed = hashlib.sha256(b"agentic-decisions").digest()
+        self._perms = [
+            (int.from_bytes(hashlib.sha256(seed + bytes([i])).digest()[:8], "big") % _MERSENNE | 1,
+             int.from_bytes(hashlib.sha256(seed + bytes([i, 1])).digest()[:8], "big") % _MERSENNE)
+            for i in range(num_perm)
+        ]
+
+    def shingles(self, text: str) -> set:
+        words = re.findall(r"\w+", text.lower())
+        if len(words) < self.shingle_size:
+            return {" ".join(words)} if words else set()
+        return {" ".join(words[i:i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)}
+
+    def signature(self, text: str) -> List[int]:
+        hashes = [int.from_bytes(hashlib.blake2b(s.encode(), digest_size=8).digest(), "big") for s in self.shingles(text)]
+        if not hashes:
+            return [0] * self.num_perm
+        return [min((a * h + b) % _MERSENNE for h in hashes) for a, b in self._perms]
+
+    @staticmethod
+    def similarity(sig_a: List[int], sig_b: List[int]) -> float:
+        if not sig_a or len(sig_a) != len(sig_b):
+            return 0.0
+        return sum(a == b for a, b in zip(sig_a, sig_b)) / len(sig_a)
+
+
+class DecisionCache:
+    """Persistent cache of debate verdicts and framework selections.
+
+    Entries are keyed by kind (e.g. "debate", "frameworks") and a normalized
+    topic; the context is fingerprinted with MinHash so a near-duplicate context
+    (estimated Jaccard >= `threshold`) reuses the cached verdict. Entries older
+    than `ttl_seconds` are ignored and purged. Backed by SQLite, one connection
+    per call, so it is safe to use from worker threads.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl_seconds: Optional[float] = None,
+                 threshold: Optional[float] = None, enabled: Optional[bool] = None):
+        config = get_decision_cache_config()
+        self.enabled = config.get('enabled', True) if enabled is None else enabled
+        self.path = os.path.expanduser(path or config.get('path') or "~/.agentic/decisions.sqlite")
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else config.get('ttl_hours', 720.0) * 3600
+        self.threshold = threshold if threshold is not None else config.get('similarity_threshold', 0.8)
+        self.hasher = MinHasher()
+        if self.enabled:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with self._connect() as db:
+                db.execute("""CREATE TABLE IF NOT EXISTS decisions (
+                    id INTEGER PRIMARY KEY, kind TEXT, topic_key TEXT, topic TEXT,
+                    signature TEXT, verdict TEXT, rationale TEXT, created REAL, hits INTEGER DEFAULT 0)""")
+                db.execute("CREATE INDEX IF NOT EXISTS idx_decisions_topic ON decisions(kind, topic_key)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5)
+
+    def lookup(self, kind: str, topic: str, context: str) -> Optional[CachedDecision]:
+        """Best cached decision for a near-duplicate topic and context, if any"""
+        if not self.enabled:
+            return None
+        signature = self.hasher.signature(context)
+        now = time.time()
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT id, signature, verdict, rationale, created FROM decisions WHERE kind = ? AND topic_key = ? AND created >= ?",
+                (kind, normalize_topic(topic), now - self.ttl_seconds)
+            ).fetchall()
+            best = None
+            for row_id, stored, verdict, rationale, created in rows:
+                similarity = self.hasher.similarity(signature, json.loads(stored))
+                if similarity >= self.threshold and (best is None or similarity > best[1]):
+                    best = (row_id, similarity, verdict, rationale, created)
+            if best is None:
+                return None
+            db.execute("UPDATE decisions SET hits = hits + 1 WHERE id = ?", (best[0],))
+        return CachedDecision(verdict=json.loads(best[2]), rationale=best[3], similarity=best[1], age_seconds=now - best[4])
+
+    def store(self, kind: str, topic: str, context: str, verdict: Any, rationale: str = ""):
+        """Record a decision"""
+        if not self.enabled:
+            return
+        with self._connect() as db:
+            db.execute(
+                "INSERT INTO decisions (kind, topic_key, topic, signature, verdict, rationale, created) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kind, normalize_topic(topic), topic, json.dumps(self.hasher.signature(context)),
+                 json.dumps(verdict), rationale, time.time())
+            )
+
+    def invalidate(self, kind: Optional[str] = None, topic: Optional[str] = None) -> int:
+        """Drop cached decisions, optionally only one kind and/or topic; returns rows removed"""
+        if not self.enabled:
+            return 0
+        clauses, params = [], []
+        if kind:
+            clauses.append("kind = ?")
+            params.append(kind)
+        if topic:
+            clauses.append("topic_key = ?")
+            params.append(normalize_topic(topic))
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._connect() as db:
+            return db.execute(f"DELETE FROM decisions{where}", params).rowcount
+
+    def purge_expired(self) -> int:
+        """Delete entries past their TTL; returns rows removed"""
+        if not self.enabled:
+            return 0
+        with self._connect() as db:
+            return db.execute("DELETE FROM decisions WHERE created < ?", (time.time() - self.ttl_seconds,)).rowcount
+
+    def stats(self) -> dict:
+        if not self.enabled:
+            return {"enabled": False}
+        with self._connect() as db:
+            count, hits = db.execute("SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM decisions").fetchone()
+        return {"enabled": True, "path": self.path, "entries": count, "hits": hits}
+
@@ -7,13 +7,24 @@ __all__ = ['IntrospectAgent', 'create_introspection']
 from typing import Dict, Any, Optional
 from rich.console import Console
 
+from ..llms.json_extractor import complete_json
+
 
 class IntrospectAgent:
     """LLM-powered task execution evaluation agent"""
     
-    def __init__(self, agent, console: Console):
+    def __init__(self, agent, console: Console, max_result_chars: int = 4000):
         self.agent = agent
         self.console = console
+        self.max_result_chars = max_result_chars
+    
+    def _clip(self, text: str) -> str:
+        """Keep the head and tail of long execution output"""
+        text = str(text)
+        if len(text) <= self.max_result_chars:
+            return text
+        half = self.max_result_chars // 2
+        return f"{text[:half]}\n... [{len(text) - 2 * half} chars omitted] ...\n{text[-half:]}"
     
     def evaluate_execution(
         self, 
@@ -33,7 +44,7 @@ TASK CONTEXT:
 - Purpose: {task_context.get('purpose', '')}
 
 EXECUTION DETAILS:
-- Result: {execution_result}
+- Result: {self._clip(execution_result)}
 - Success Criteria: {success_criteria}
 - Expected Outputs: {expected_outputs or []}
 
@@ -73,7 +84,7 @@ Provide thorough, constructive evaluation focusing on actionable feedback.
 """
 
         try:
-            response = self.agent.run(prompt, stream=True, max_iterations=1)
+            response = self.agent.complete(prompt, stream=True)
             content = response.get("content", "")
             
             # Try to parse JSON response
@@ -104,6 +115,56 @@ Provide thorough, constructive evaluation focusing on actionable feedback.
                 "reasoning": "Agent evaluation failed"
             }
 
+    def evaluate_steps(
+        self,
+        task_context: Dict[str, Any],
+        steps: list,
+        success_criteria: str,
+        expected_outputs: list = None
+    ) -> Optional[list]:
+        """Evaluate several executed steps in one call; None if the evaluation failed"""
+
+        budget = max(self.max_result_chars // max(len(steps), 1), 500)
+        step_details = "\n\n".join(
+            f"STEP {s['step']} - {s.get('purpose', '')}\nResult: {self._clip(s.get('result', ''))[:budget]}"
+            for s in steps
+        )
+        prompt = f"""
+BATCHED STEP EVALUATION
+
+TASK CONTEXT:
+- Task ID: {task_context.get('task_id', 'unknown')}
+- Description: {task_context.get('description', '')}
+- Success Criteria: {success_criteria}
+- Expected Outputs: {expected_outputs or []}
+
+EXECUTED STEPS:
+{step_details}
+
+Evaluate each step on completeness, quality, correctness and efficiency (0-10 overall).
+A step succeeds with an overall score of 7 or more.
+
+RESPONSE FORMAT (JSON array, one entry per step):
+[
+  {{
+    "step": <step number>,
+    "overall_score": <0-10>,
+    "success": <true/false>,
+    "recommendations": ["recommendation1"],
+    "feedback_for_retry": "Specific guidance for improvement",
+    "next_action": "proceed|retry"
+  }}
+]
+"""
+
+        try:
+            # Ends the stream once the array closes; a blocked reply raises like a malformed one
+            result, _ = complete_json(self.agent, prompt, root="[", stream=True)
+            return [r for r in result if isinstance(r, dict)]
+        except Exception as e:
+            self.console.print(f"❌ Batched introspection error: {e}")
+            return None
+
 
 def create_introspection(
     task_context: Dict[str, Any],
@@ -4,17 +4,35 @@
 __all__ = ['AgentTaskAnalyzer']
 
 # %% ../../../nbs/buddy/backend/agents/planner/analyzier.ipynb 1
+import io
+import re
 import json
-from typing import List, Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 from rich.console import Console
 
+from ...core.agent import Agent, AgentConfig
 from ...llms.client import LLMClient
+from ...llms.json_extractor import complete_json
 from ...schemas import Task, ExecutionPlan, AnalysisResult, ComplexityLevel, BuddyTool, ExecutionMode
 from ...configs.prompts import AnalyzerPrompts
+from ..decisions import DecisionCache
 
 # %% ../../../nbs/buddy/backend/agents/planner/analyzier.ipynb 2
 class AgentTaskAnalyzer:
-    def __init__(self, model: str = None, base_url: str = None, api_key: str = None):
+    # Keyword rules shared by _create_simple_task and the local complexity heuristic
+    SIMPLE_KEYWORDS = {
+        "search": ['list', 'find', 'search', 'files', 'containing', 'keyword', 'grep'],
+        "listing": ['list directory', 'show files', 'directory contents', 'ls'],
+        "read": ['read file', 'show file', 'cat', 'view file'],
+        "execute": ['run', 'execute', 'calculate', 'compute'],
+    }
+    # Words that suggest a project rather than a one-off command
+    PROJECT_KEYWORDS = ['build', 'create', 'implement', 'develop', 'design', 'deploy', 'refactor', 'migrate',
+                        'app', 'application', 'api', 'service', 'system', 'pipeline', 'website', 'platform']
+
+    def __init__(self, model: str = None, base_url: str = None, api_key: str = None, memo_size: int = 32):
         # Initialize agent with default config
         agent_config = AgentConfig(
             name="planner_analyzer",
@@ -23,23 +41,28 @@ class AgentTaskAnalyzer:
         )
         self.agent = Agent(agent_config)
         self.console = Console()
+        self.decisions = DecisionCache()
+        self.memo_size = memo_size
+        self._memo: Dict[str, AnalysisResult] = {}
+        self._local = threading.local()  # Agent of the current thread during concurrent analysis
 
     def analyze(self, user_input: str) -> AnalysisResult:
         """Analyze input and create Buddy-executable task plan"""
+        key = " ".join(user_input.split())
+        if key in self._memo:
+            print("♻️  Reusing analysis of an identical request")
+            return self._memo[key].model_copy(deep=True)
+        
         try:
-            print("📊 Step 1: Assessing complexity...")
-            # Step 1: Assess complexity
-            complexity = self._assess_complexity(user_input)
-            print(f"✅ Complexity: {complexity.value}")
-            
-            # Step 2: Create tasks (including framework selection task)
-            if complexity == ComplexityLevel.SIMPLE:
-                print("📋 Step 2: Creating simple task...")
-                tasks = self._create_simple_task(user_input)
+            # Step 1: Simple commands are classified locally, everything else in one concurrent round-trip
+            complexity = self._heuristic_complexity(user_input)
+            if complexity:
+                print(f"⚡ Step 1: Recognized a {complexity.value} request locally, skipping LLM analysis")
+                tasks, assessed = self._create_simple_task(user_input), True
             else:
-                print("📋 Step 2: Decomposing into tasks...")
-                tasks = self._decompose_tasks(user_input, complexity)
-            
+                print("📊 Step 1: Assessing complexity and decomposing tasks concurrently...")
+                complexity, tasks, assessed = self._analyze_concurrently(user_input)
+            print(f"✅ Complexity: {complexity.value}")
             print(f"✅ Created {len(tasks)} tasks")
 
             # Step 4: Identify required Buddy tools
@@ -50,53 +73,141 @@ class AgentTaskAnalyzer:
             
             print("✅ Analysis complete!")
             
-            return AnalysisResult(
+            result = AnalysisResult(
                 input_complexity=complexity,
-                recommended_frameworks={},  # Will be determined during task execution
+                recommended_frameworks={},  # Will be determined during task execution (T000)
                 tasks=tasks,
-                execution_plan=execution_plan,
+                execution_plan=self._build_execution_plan(tasks),
                 buddy_tools_needed=buddy_tools,
                 success_criteria=success_criteria
             )
+            # A complexity guessed after the LLM failed is not worth keeping for the whole process
+            if assessed:
+                self._memo[key] = result
+                if len(self._memo) > self.memo_size:
+                    self._memo.pop(next(iter(self._memo)))
+            return result.model_copy(deep=True)
             
         except Exception as e:
             print(f"❌ Analysis error: {e}")
             return self._create_fallback_result(user_input)
 
-    def _assess_complexity(self, user_input: str) -> ComplexityLevel:
-        """Assess input complexity using LLM analysis"""
+    def _heuristic_complexity(self, user_input: str) -> Optional[ComplexityLevel]:
+        """SIMPLE for short requests matching the simple-task keyword rules, else None (ask the LLM)"""
+        words = re.findall(r"[a-z0-9']+", user_input.lower())
+        if not words or len(words) >= 20:
+            return None
+        text = " ".join(words)
+        has = lambda keyword: re.search(rf"\b{re.escape(keyword)}\b", text)
+        if any(has(keyword) for keyword in self.PROJECT_KEYWORDS):
+            return None
+        if any(has(keyword) for keywords in self.SIMPLE_KEYWORDS.values() for keyword in keywords):
+            return ComplexityLevel.SIMPLE
+        return None
+
+    def _estimate_complexity(self, user_input: str) -> ComplexityLevel:
+        """Word count estimate used before (or instead of) the LLM assessment"""
+        word_count = len(user_input.split())
+        if word_count < 20:
+            return ComplexityLevel.SIMPLE
+        elif word_count < 100:
+            return ComplexityLevel.MODERATE
+        else:
+            return ComplexityLevel.COMPLEX
+
+    def _analyze_concurrently(self, user_input: str) -> Tuple[ComplexityLevel, List[Task], bool]:
+        """Issue the complexity and decomposition prompts at once.
+        
+        The decomposition prompt doesn't need the complexity verdict, so the two
+        calls overlap; frameworks are chosen later by the T000 task. If the request
+        turns out simple, the decomposition stream is abandoned. Returns the
+        complexity, the tasks and whether the complexity came from the LLM.
+        """
+        cancel = threading.Event()
+        pool = ThreadPoolExecutor(max_workers=2)
+        try:
+            complexity_future = pool.submit(self._on_own_client, self._assess_complexity, user_input, False)
+            tasks_future = pool.submit(self._on_own_client, self._decompose_tasks, user_input,
+                                       self._estimate_complexity(user_input), False, cancel=cancel)
+            
+            complexity, assessed = complexity_future.result()
+            if complexity == ComplexityLevel.SIMPLE:
+                cancel.set()
+                tasks = self._create_simple_task(user_input)
+            else:
+                tasks = tasks_future.result()
+            return complexity, tasks, assessed
+        finally:
+            pool.shutdown(wait=False)
+
+    def _on_own_client(self, fn, *args, cancel: Optional[threading.Event] = None):
+        """Run `fn` with a fork of the agent on its own LLM client, so concurrent calls don't share one.
+        Setting `cancel` ends its JSON calls at the next streamed chunk."""
+        self._local.agent = self.agent.fork(own_client=True)
+        self._local.cancel = cancel
+        try:
+            return fn(*args)
+        finally:
+            del self._local.agent, self._local.cancel
+
+    def _cancelled(self) -> bool:
+        cancel = getattr(self._local, "cancel", None)
+        return cancel is not None and cancel.is_set()
+
+    def _build_execution_plan(self, tasks: List[Task]) -> ExecutionPlan:
+        """Phases by dependency depth; the critical path is the deepest dependency chain"""
+        level: Dict[str, int] = {}
+        for task in tasks:
+            # Dependencies on unknown or later tasks are ignored
+            level[task.id] = 1 + max((level[dep] for dep in task.dependencies if dep in level), default=-1)
+        depth = max(level.values(), default=-1) + 1
+        phases = [[task.id for task in tasks if level[task.id] == i] for i in range(depth)]
+        
+        by_id = {task.id: task for task in tasks}
+        critical_path = []
+        current = max(tasks, key=lambda task: level[task.id]).id if tasks else None
+        while current:
+            critical_path.insert(0, current)
+            deps = [dep for dep in by_id[current].dependencies if dep in level and level[dep] < level[current]]
+            current = max(deps, key=lambda dep: level[dep]) if deps else None
+        
+        return ExecutionPlan(
+            sequential_phases=phases,
+            parallel_groups=[phase for phase in phases if len(phase) > 1],
+            critical_path=critical_path,
+            total_actions=sum(len(task.actions) for task in tasks)
+        )
+
+    def _assess_complexity(self, user_input: str, stream: bool = True) -> Tuple[ComplexityLevel, bool]:
+        """Assess input complexity using LLM analysis; False with the word-count estimate when the LLM failed"""
         print("🔍 Analyzing complexity with LLM...")
         
         prompt = AnalyzerPrompts.complexity_analysis(user_input)
         
         try:
-            response = self._call_llm(prompt)
-            cleaned = self._clean_json(response)
-            data = json.loads(cleaned)
+            data = self._call_llm_json(prompt, stream=stream, root="{")
             complexity_str = data.get("complexity", "moderate")
             print(f"🧠 LLM Assessment: {complexity_str} - {data.get('reasoning', '')}")
-            return ComplexityLevel(complexity_str)
+            return ComplexityLevel(complexity_str), True
         except Exception as e:
             print(f"⚠️  LLM complexity analysis failed, using heuristic: {e}")
             # Fallback to word count heuristic
-            word_count = len(user_input.split())
-            if word_count < 20:
-                return ComplexityLevel.SIMPLE
-            elif word_count < 100:
-                return ComplexityLevel.MODERATE
-            else:
-                return ComplexityLevel.COMPLEX
+            return self._estimate_complexity(user_input), False
 
-    def _select_frameworks(self, user_input: str, complexity: ComplexityLevel) -> Dict[str, str]:
+    def _select_frameworks(self, user_input: str, complexity: ComplexityLevel, stream: bool = True) -> Dict[str, str]:
         """Use debate agent to select optimal frameworks"""
+        topic = f"{complexity.value} project frameworks"
+        cached = self.decisions.lookup("frameworks", topic, user_input)
+        if cached:
+            print(f"♻️  Reusing cached framework selection (similarity {cached.similarity:.2f})")
+            return cached.verdict
+        
         print("🗣️  Starting framework debate...")
         
         debate_prompt = AnalyzerPrompts.framework_selection(user_input, complexity.value)
         
         try:
-            response = self._call_llm(debate_prompt)
-            cleaned = self._clean_json(response)
-            data = json.loads(cleaned)
+            data = self._call_llm_json(debate_prompt, stream=stream, root="{")
             
             # Extract frameworks (exclude reasoning)
             frameworks = {k: v for k, v in data.items() if k != "reasoning"}
@@ -106,6 +217,7 @@ class AgentTaskAnalyzer:
                 for category, reason in data["reasoning"].items():
                     print(f"   {category}: {reason}")
             
+            self.decisions.store("frameworks", topic, user_input, frameworks, rationale=json.dumps(data.get("reasoning", {})))
             return frameworks
             
         except Exception as e:
@@ -132,7 +244,7 @@ class AgentTaskAnalyzer:
         user_lower = user_input.lower()
         
         # File search/grep operations
-        if any(keyword in user_lower for keyword in ['list', 'find', 'search', 'files', 'containing', 'keyword', 'grep']):
+        if any(keyword in user_lower for keyword in self.SIMPLE_KEYWORDS["search"]):
             return [Task(
                 id="T001",
                 name="Search files with keyword",
@@ -154,7 +266,7 @@ class AgentTaskAnalyzer:
             )]
         
         # File/directory listing operations
-        elif any(keyword in user_lower for keyword in ['list directory', 'show files', 'directory contents', 'ls']):
+        elif any(keyword in user_lower for keyword in self.SIMPLE_KEYWORDS["listing"]):
             return [Task(
                 id="T001", 
                 name="List directory contents",
@@ -176,7 +288,7 @@ class AgentTaskAnalyzer:
             )]
         
         # File reading operations
-        elif any(keyword in user_lower for keyword in ['read file', 'show file', 'cat', 'view file']):
+        elif any(keyword in user_lower for keyword in self.SIMPLE_KEYWORDS["read"]):
             return [Task(
                 id="T001",
                 name="Read file contents", 
@@ -198,7 +310,7 @@ class AgentTaskAnalyzer:
             )]
         
         # Code execution operations
-        elif any(keyword in user_lower for keyword in ['run', 'execute', 'calculate', 'compute']):
+        elif any(keyword in user_lower for keyword in self.SIMPLE_KEYWORDS["execute"]):
             return [Task(
                 id="T001",
                 name="Execute code or calculation",
@@ -241,7 +353,7 @@ class AgentTaskAnalyzer:
                 expected_outputs=["solution_output"]
             )]
 
-    def _decompose_tasks(self, user_input: str, complexity: ComplexityLevel) -> List[Task]:
+    def _decompose_tasks(self, user_input: str, complexity: ComplexityLevel, stream: bool = True) -> List[Task]:
         """Decompose complex input into detailed Buddy-executable tasks"""
         print("🔍 Analyzing requirements and breaking down into tasks...")
         
@@ -300,9 +412,7 @@ class AgentTaskAnalyzer:
         prompt = AnalyzerPrompts.task_decomposition(user_input)
         
         try:
-            response = self._call_llm(prompt)
-            cleaned = self._clean_json(response)
-            task_data = json.loads(cleaned)
+            task_data = self._call_llm_json(prompt, stream=stream, root="[")
             
             tasks = [framework_task]  # Start with framework selection task
             for data in task_data:
@@ -324,6 +434,8 @@ class AgentTaskAnalyzer:
             return tasks if len(tasks) > 1 else [framework_task] + self._create_simple_task(user_input)
             
         except Exception as e:
+            if self._cancelled():
+                return []  # Abandoned: the request turned out simple
             print(f"❌ Task decomposition failed: {e}")
             return [framework_task] + self._create_simple_task(user_input)
 
@@ -341,47 +453,31 @@ class AgentTaskAnalyzer:
         criteria.extend(list(unique_criteria)[:3])  # Max 3 additional criteria
         return criteria
 
-    def _call_llm(self, prompt: str) -> str:
-        """Call LLM using agent with streaming"""
+    def _call_llm(self, prompt: str, stream: bool = True) -> str:
+        """Call LLM using a one-shot agent completion"""
         try:
-            result = self.agent.run(prompt, stream=True)
+            result = self._current_agent().complete(prompt, stream=stream)
             return result.get("content", "")
             
         except Exception as e:
             print(f"\n❌ LLM call failed: {e}")
             return ""
 
-    def _clean_json(self, response: str) -> str:
-        """Extract clean JSON from response"""
-        response = response.strip()
-        
-        # Remove thinking tags
-        if "<think>" in response and "</think>" in response:
-            start = response.find("</think>") + 8
-            response = response[start:].strip()
-        
-        # Extract from code blocks
-        if "```json" in response:
-            start = response.find("```json") + 7
-            end = response.find("```", start)
-            response = response[start:end].strip()
-        elif "```" in response:
-            start = response.find("```") + 3
-            end = response.find("```", start)
-            response = response[start:end].strip()
-        
-        # Find JSON boundaries
-        if response.startswith("["):
-            bracket_count = 0
-            for i, char in enumerate(response):
-                if char == "[":
-                    bracket_count += 1
-                elif char == "]":
-                    bracket_count -= 1
-                    if bracket_count == 0:
-                        return response[:i+1]
-        
-        return response
+    def _call_llm_json(self, prompt: str, stream: bool = True, root: Optional[str] = None):
+        """Call LLM for a JSON answer, ending the stream as soon as a complete value has arrived"""
+        cancel = getattr(self._local, "cancel", None)
+        if cancel is not None:
+            # Streamed unprinted, so the call can be abandoned between chunks
+            data, _ = complete_json(self._current_agent(), prompt, root=root, stream=True,
+                                    console=Console(file=io.StringIO()), stop_when=lambda _: cancel.is_set())
+            if cancel.is_set():
+                raise RuntimeError("analysis no longer needed")  # Not a partial value repaired at the cut
+        else:
+            data, _ = complete_json(self._current_agent(), prompt, root=root, stream=stream)
+        return data
+
+    def _current_agent(self) -> Agent:
+        return getattr(self._local, "agent", self.agent)
 
     def _create_fallback_result(self, user_input: str) -> AnalysisResult:
         """Create fallback result when analysis fails"""
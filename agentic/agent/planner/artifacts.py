@@ -0,0 +1,105 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/buddy/backend/agents/planner/artifacts.ipynb.
+
+# %% auto 0
+__all__ = ['EXCLUDED_DIRS', 'EXCLUDED_SUFFIXES', 'Snapshot', 'ArtifactChanges', 'ArtifactTracker']
+
+# %% ../../../nbs/buddy/backend/agents/planner/artifacts.ipynb 1
+import os
+from typing import Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field
+
+
+# %% ../../../nbs/buddy/backend/agents/planner/artifacts.ipynb 2
+EXCLUDED_DIRS = {
+    '.venv', '__pycache__', '.git', 'node_modules',
+    '.pytest_cache', '.mypy_cache', 'execution_cache'
+}
+EXCLUDED_SUFFIXES = {'.pyc', '.pyo', '.log', '.tmp'}
+
+# path -> (size, mtime_ns)
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+class ArtifactChanges(BaseModel):
+    created: List[str] = Field(default_factory=list, description="Files that did not exist before")
+    modified: List[str] = Field(default_factory=list, description="Files whose size or mtime changed")
+    deleted: List[str] = Field(default_factory=list, description="Files that no longer exist")
+
+    def __bool__(self) -> bool:
+        return bool(self.created or self.modified or self.deleted)
+
+
+class ArtifactTracker:
+    """Detects files created, modified or deleted by an action by diffing snapshots.
+
+    A snapshot maps each file to `(size, mtime_ns)` and is built with a single
+    `os.scandir` walk that never descends into excluded or hidden directories.
+    The snapshot taken after one action is reused as the baseline for the next,
+    so each action costs one walk. Set `reuse_snapshots=False` when other workers
+    may write to the same tree between actions.
+    """
+
+    def __init__(self, root: str = ".", reuse_snapshots: bool = True):
+        self.root = root
+        self.reuse_snapshots = reuse_snapshots
+        self._last: Optional[Tuple[str, Snapshot]] = None  # (cwd, snapshot)
+
+    def snapshot(self) -> Snapshot:
+        """Walk the tree and record size and mtime of every tracked file"""
+        files: Snapshot = {}
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.name.startswith('.') or entry.name in EXCLUDED_DIRS:
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            if os.path.splitext(entry.name)[1] in EXCLUDED_SUFFIXES:
+                                continue
+                            stat = entry.stat(follow_symlinks=False)
+                            files[os.path.relpath(entry.path, self.root)] = (stat.st_size, stat.st_mtime_ns)
+                    except OSError:
+                        continue  # Vanished mid-walk
+        return files
+
+    def begin(self) -> Snapshot:
+        """Baseline snapshot for the next action"""
+        cwd = os.getcwd()
+        if self.reuse_snapshots and self._last and self._last[0] == cwd:
+            return self._last[1]
+        snapshot = self.snapshot()
+        self._last = (cwd, snapshot)
+        return snapshot
+
+    def changes_since(self, baseline: Snapshot) -> ArtifactChanges:
+        """Diff the current tree against a baseline (and keep it for the next action)"""
+        current = self.snapshot()
+        self._last = (os.getcwd(), current)
+        return self.diff(baseline, current)
+
+    @staticmethod
+    def attributed(changes: ArtifactChanges, tool_calls: List[Dict]) -> ArtifactChanges:
+        """The changes whose path (or file name) appears in the tool calls' arguments.
+        For trees other workers write to at the same time; files an action
+        changes without naming them (e.g. written by a build command) are dropped."""
+        named = "\n".join(str(call.get("function", {}).get("arguments", "")) for call in tool_calls or [])
+        keep = lambda paths: [path for path in paths if path in named or os.path.basename(path) in named]
+        return ArtifactChanges(created=keep(changes.created), modified=keep(changes.modified), deleted=keep(changes.deleted))
+
+    @staticmethod
+    def diff(before: Snapshot, after: Snapshot) -> ArtifactChanges:
+        """Created, modified and deleted files between two snapshots"""
+        return ArtifactChanges(
+            created=sorted(path for path in after.keys() - before.keys()),
+            modified=sorted(path for path in after.keys() & before.keys() if after[path] != before[path]),
+            deleted=sorted(path for path in before.keys() - after.keys())
+        )
+
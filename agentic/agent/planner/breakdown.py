@@ -7,6 +7,7 @@ __all__ = ['ProjectBreakdownGenerator']
 from typing import Optional
 from rich.console import Console
 from .models import ProjectBreakdown
+from ...llms.json_extractor import JsonExtractionError, extract_json, strip_think
 
 # %% ../../../nbs/buddy/backend/agents/planner/breakdown.ipynb 2
 class ProjectBreakdownGenerator:
@@ -65,7 +66,7 @@ Avoid human-centric activities like interviews, meetings, or manual processes.
 """
         
         try:
-            agent_response = self.agent.run(prompt)
+            agent_response = self.agent.complete(prompt)
             self.console.print(f"🔍 Agent response type: {type(agent_response)}")
             self.console.print(f"🔍 Agent response keys: {agent_response.keys() if isinstance(agent_response, dict) else 'Not a dict'}")
             
@@ -94,7 +95,14 @@ Avoid human-centric activities like interviews, meetings, or manual processes.
     def _parse_breakdown_response(self, response: str) -> ProjectBreakdown:
         """Parse breakdown response into structured format"""
         
-        lines = response.split('\n')
+        # A JSON answer (bare or fenced) is taken as is; otherwise parse the sections
+        try:
+            return extract_json(response, schema=ProjectBreakdown, root="{")
+        except JsonExtractionError:
+            pass
+        
+        # Reasoning mentions "summary", "phase" etc. and would derail the section detection
+        lines = strip_think(response).split('\n')
         
         title = "Untitled Project"
         project_summary = "Project breakdown generated"
@@ -5,75 +5,192 @@ __all__ = ['CacheManager']
 
 # %% ../../../nbs/buddy/backend/agents/planner/cache.ipynb 1
 import json
+import os
+import hashlib
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Dict, Any
 from rich.console import Console
 
 from .models import ProjectContext, ProjectBreakdown
 
 # %% ../../../nbs/buddy/backend/agents/planner/cache.ipynb 2
 class CacheManager:
-    """Handles execution state caching and restoration"""
+    """Handles execution state caching and restoration.
     
-    def __init__(self, console: Console, cache_dir: str = "execution_cache"):
+    Each project lives in `<cache_dir>/<request hash>/` as a compacted `snapshot.json`
+    plus an append-only `journal.jsonl`. Saving appends only what changed since the
+    last save (new task results and a small state delta), fsynced per record; the
+    journal is folded into the snapshot every `compact_every` records with an atomic
+    replace. Records carry a sequence number so a crash between writing the snapshot
+    and truncating the journal never replays a record twice.
+    """
+    
+    def __init__(self, console: Console, cache_dir: str = "execution_cache", compact_every: int = 20):
         self.console = console
-        self.cache_dir = Path(cache_dir)
+        # Resolve now - the executor changes into the project folder later
+        self.cache_dir = Path(cache_dir).resolve()
         self.cache_dir.mkdir(exist_ok=True)
-        self.context_cache = self.cache_dir / "project_context.json"
-        self.breakdown_cache = self.cache_dir / "project_breakdown.json"
+        self.compact_every = compact_every
+        self._journals: Dict[str, Dict[str, Any]] = {}  # per-project bookkeeping
+        self._active_key: Optional[str] = None
+    
+    def _project_key(self, user_request: str) -> str:
+        return hashlib.sha256(user_request.encode()).hexdigest()[:16]
+    
+    def _project_dir(self, key: str) -> Path:
+        return self.cache_dir / key
+    
+    def _append(self, key: str, record_type: str, data: Any):
+        """Append one fsynced record to the project journal"""
+        state = self._journals[key]
+        state["seq"] += 1
+        line = json.dumps({"seq": state["seq"], "type": record_type, "data": data}, default=str)
+        with open(self._project_dir(key) / "journal.jsonl", 'a') as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        state["pending"] += 1
+    
+    def _write_atomic(self, path: Path, text: str):
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp, 'w') as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    
+    def _compact(self, key: str, context: ProjectContext, breakdown: Optional[ProjectBreakdown]):
+        """Fold the journal into a fresh snapshot and start an empty journal"""
+        state = self._journals[key]
+        project_dir = self._project_dir(key)
+        snapshot = {
+            "seq": state["seq"],
+            "context": context.model_dump(),
+            "breakdown": breakdown.model_dump() if breakdown else None
+        }
+        self._write_atomic(project_dir / "snapshot.json", json.dumps(snapshot, default=str))
+        self._write_atomic(project_dir / "journal.jsonl", "")
+        state["pending"] = 0
     
     def save_to_cache(self, context: Optional[ProjectContext], breakdown: Optional[ProjectBreakdown]):
-        """Save current execution state to cache"""
+        """Checkpoint what changed since the last save"""
+        if not context:
+            return
         try:
-            if context:
-                with open(self.context_cache, 'w') as f:
-                    json.dump(context.model_dump(), f, indent=2, default=str)
+            key = self._project_key(context.original_request)
+            self._active_key = key
+            
+            if key not in self._journals:
+                # First save for this project in this run: start from a full snapshot
+                self._project_dir(key).mkdir(exist_ok=True)
+                self._journals[key] = {"seq": 0, "pending": 0, "tasks": len(context.execution_history),
+                                       "artifacts": list(context.current_artifacts), "has_breakdown": breakdown is not None}
+                self._compact(key, context, breakdown)
+                return
+            
+            state = self._journals[key]
+            if breakdown and not state["has_breakdown"]:
+                self._append(key, "breakdown", breakdown.model_dump())
+                state["has_breakdown"] = True
             
-            if breakdown:
-                with open(self.breakdown_cache, 'w') as f:
-                    json.dump(breakdown.model_dump(), f, indent=2)
+            for task_result in context.execution_history[state["tasks"]:]:
+                self._append(key, "task", task_result.model_dump())
+            state["tasks"] = len(context.execution_history)
+            
+            previous, current = set(state["artifacts"]), set(context.current_artifacts)
+            self._append(key, "state", {
+                "total_tasks_completed": context.total_tasks_completed,
+                "project_status": context.project_status,
+                "failed_tasks": context.failed_tasks,
+                "artifacts_added": [a for a in context.current_artifacts if a not in previous],
+                "artifacts_removed": [a for a in state["artifacts"] if a not in current]
+            })
+            state["artifacts"] = list(context.current_artifacts)
+            
+            if state["pending"] >= self.compact_every:
+                self._compact(key, context, breakdown)
                     
         except Exception as e:
             self.console.print(f"⚠️ Cache save failed: {e}")
     
     def restore_from_cache(self, user_request: str) -> tuple[Optional[ProjectContext], Optional[ProjectBreakdown]]:
-        """Restore execution state from cache"""
+        """Restore execution state by replaying the journal over the last snapshot"""
         try:
-            if not (self.context_cache.exists() and self.breakdown_cache.exists()):
+            key = self._project_key(user_request)
+            project_dir = self._project_dir(key)
+            snapshot_path = project_dir / "snapshot.json"
+            if not snapshot_path.exists():
                 return None, None
             
-            # Load context
-            with open(self.context_cache, 'r') as f:
-                context_data = json.load(f)
-                
-            # Check if it's the same request
+            with open(snapshot_path, 'r') as f:
+                snapshot = json.load(f)
+            
+            context_data = snapshot["context"]
+            # Check if it's the same request (guards against hash collisions)
             if context_data.get('original_request') != user_request:
                 return None, None
-                
+            breakdown_data = snapshot.get("breakdown")
+            seq = snapshot.get("seq", 0)
+            
+            journal_path = project_dir / "journal.jsonl"
+            if journal_path.exists():
+                with open(journal_path, 'r') as f:
+                    for line in f:
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            break  # Torn final write from a crash
+                        if record["seq"] <= seq:
+                            continue  # Already folded into the snapshot
+                        seq = record["seq"]
+                        data = record["data"]
+                        if record["type"] == "breakdown":
+                            breakdown_data = data
+                        elif record["type"] == "task":
+                            context_data["execution_history"].append(data)
+                        elif record["type"] == "state":
+                            removed = set(data["artifacts_removed"])
+                            context_data["current_artifacts"] = [a for a in context_data["current_artifacts"] if a not in removed] + data["artifacts_added"]
+                            for field in ("total_tasks_completed", "project_status", "failed_tasks"):
+                                context_data[field] = data[field]
+            
+            if not breakdown_data:
+                return None, None
+            
             context = ProjectContext(**context_data)
             
             # Ensure current_artifacts is always a list (safety check)
             if not isinstance(context.current_artifacts, list):
                 context.current_artifacts = []
             
-            # Load breakdown
-            with open(self.breakdown_cache, 'r') as f:
-                breakdown_data = json.load(f)
             breakdown = ProjectBreakdown(**breakdown_data)
             
+            # Continue from a fresh snapshot: appending after a torn final line would glue
+            # the next record onto it and make everything after it unreadable
+            self._active_key = key
+            self._journals[key] = {"seq": seq, "pending": 0, "tasks": len(context.execution_history),
+                                   "artifacts": list(context.current_artifacts), "has_breakdown": True}
+            self._compact(key, context, breakdown)
             return context, breakdown
             
         except Exception as e:
             self.console.print(f"⚠️ Cache restore failed: {e}")
             return None, None
     
-    def clear_cache(self):
-        """Clear cache files"""
+    def clear_cache(self, user_request: Optional[str] = None):
+        """Clear the cached state of one project (the active one by default)"""
         try:
-            if self.context_cache.exists():
-                self.context_cache.unlink()
-            if self.breakdown_cache.exists():
-                self.breakdown_cache.unlink()
+            key = self._project_key(user_request) if user_request else self._active_key
+            if not key:
+                return
+            project_dir = self._project_dir(key)
+            for name in ("snapshot.json", "journal.jsonl"):
+                path = project_dir / name
+                if path.exists():
+                    path.unlink()
+            if project_dir.exists() and not any(project_dir.iterdir()):
+                project_dir.rmdir()
+            self._journals.pop(key, None)
         except Exception as e:
             self.console.print(f"⚠️ Cache clear failed: {e}")
 
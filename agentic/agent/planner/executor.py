@@ -9,7 +9,7 @@ from typing import Optional
 from rich.console import Console
 
 from ...core.agent import Agent, AgentConfig
-from ...configs.loader import get_model_config
+from ...configs.loader import get_model_config, get_planner_config
 
 from .models import ProjectContext, ExecutionStatus
 from .breakdown import ProjectBreakdownGenerator
@@ -17,7 +17,9 @@ from .task_generator import TaskGenerator
 from .task_executor import TaskExecutor
 from .validation import TaskValidator
 from .cache import CacheManager
+from .scheduler import TaskScheduler
 import asyncio
+import threading
 import concurrent.futures
 
 import re
@@ -48,22 +50,32 @@ class DynamicTaskExecutor:
         # Use provided console or create new one
         self.console = console if console is not None else Console()
         
+        # Configuration
+        self.max_retries = 3
+        self.max_tasks = 20
+        planner_config = get_planner_config()
+        self.max_workers = max(1, planner_config.get('max_workers', 1))
+        self.speculative_generation = planner_config.get('speculative_generation', False)
+        self.introspection_mode = planner_config.get('introspection_mode', 'batched')
+        self.introspection_batch_size = max(1, planner_config.get('introspection_batch_size', 5))
+        
         # Initialize components
         self.breakdown_generator = ProjectBreakdownGenerator(self.agent, self.console)
         self.task_generator = TaskGenerator(self.agent, self.console)
-        self.task_executor = TaskExecutor(self.agent, self.console)
+        # Agent calls in flight across all workers, parallel steps included
+        self.action_slots = threading.BoundedSemaphore(self.max_workers)
+        # Tasks run on worker threads while this agent generates and validates, so workers get their own
+        self.task_executor = self._create_task_executor(self.agent.fork(f"{self.agent.config.name}_worker_0", own_client=True))
         self.validator = TaskValidator(self.console)
         self.cache_manager = CacheManager(self.console)
         
-        # Configuration
-        self.max_retries = 3
-        self.max_tasks = 20
-        
         # State
         self.context: Optional[ProjectContext] = None
         self.project_breakdown = None
         self.estimated_total_tasks: int = 0
         self.project_folder: Optional[str] = None
+        self._speculation = None  # (future, basis task IDs) for the task being generated ahead
+        self._speculative_generator: Optional[TaskGenerator] = None
         
     def execute(self, user_request: str) -> ProjectContext:
         """Synchronous wrapper for execute_project."""
@@ -118,73 +130,45 @@ class DynamicTaskExecutor:
             # Save initial state
             self.cache_manager.save_to_cache(self.context, self.project_breakdown)
         
-        # Phase 2: Execute tasks one by one
+        # Phase 2: Execute tasks as their dependencies are satisfied
         self.console.print("\n🔄 PHASE 2: Executing tasks dynamically...")
         
+        scheduler = TaskScheduler(self._create_worker_executors(), self.console)
         task_counter = len(self.context.execution_history) + 1
+        generation_done = False
         
-        while not self._is_project_complete() and task_counter <= self.max_tasks:
-            self.console.print(f"\n{'='*60}")
-            self.console.print(f"📋 GENERATING TASK {task_counter}")
-            self.console.print(f"{'='*60}")
+        while True:
+            # Fill the ready queue up to the worker limit
+            while (not generation_done and scheduler.has_capacity() and task_counter <= self.max_tasks
+                   and not self._is_project_complete(in_flight=len(scheduler.in_flight))):
+                task = await self._take_speculative_task(scheduler.in_flight) if self._speculation else None
+                if task is None:
+                    task = self._generate_task(task_counter, scheduler.in_flight)
+                if not task:
+                    if not scheduler.in_flight:
+                        self.console.print("❌ No more tasks to generate. Project complete.")
+                        generation_done = True
+                    # Otherwise try again once running tasks have finished
+                    break
+                scheduler.add(task)
+                task_counter += 1
             
-            # Generate next task using breakdown context
-            task = self.task_generator.generate_next_task(self.context, self.project_breakdown, self.estimated_total_tasks)
-            if not task:
-                self.console.print("❌ No more tasks to generate. Project complete.")
+            scheduler.launch_ready()
+            if not scheduler.running:
                 break
             
-            self.console.print(f"✅ Generated: {task.name}")
-            self.console.print(f"🔍 Task ID: {task.id}, Dependencies: {task.dependencies}")
-            
-            # PRE-EXECUTION INTROSPECTION
-            pre_validation = self.validator.introspect_task_planning(task, self.project_breakdown, self.context)
-            if not pre_validation.success:
-                self.console.print(f"⚠️ Pre-execution validation failed: {pre_validation.feedback}")
-                if pre_validation.next_action == "regenerate":
-                    self.console.print("🔄 Regenerating task with feedback...")
-                    regenerated_task = self.task_generator.regenerate_task_with_feedback(self.context, self.project_breakdown, pre_validation.feedback)
-                    if regenerated_task:
-                        task = regenerated_task
-                        self.console.print("✅ Task regenerated successfully")
-                    else:
-                        self.console.print("⚠️ Task regeneration failed. Proceeding with original task.")
-            
-            # Execute task
-            task_result = await self.task_executor.execute_task(task)
+            # Overlap generation of the next task with the running ones
+            if (self.speculative_generation and self._speculation is None and not generation_done
+                    and not scheduler.has_capacity() and task_counter <= self.max_tasks):
+                self._start_speculation(task_counter, scheduler.in_flight)
             
-            # Update context
-            self.context.execution_history.append(task_result)
-            
-            if not isinstance(self.context.current_artifacts, list):
-                self.context.current_artifacts = []
-                
-            artifacts = task_result.artifacts_created
-            # Ensure artifacts is always a list
-            if not isinstance(artifacts, list):
-                if isinstance(artifacts, str):
-                    artifacts = [artifacts]
-                elif artifacts is None or isinstance(artifacts, bool):
-                    artifacts = []
-                else:
-                    artifacts = [str(artifacts)]
-            
-            self.context.current_artifacts.extend(artifacts)
-            
-            self.context.total_tasks_completed += 1
-            
-            # Save state after each task
-            self.cache_manager.save_to_cache(self.context, self.project_breakdown)
-            
-            # Update project status
-            if task_result.status == ExecutionStatus.FAILED:
-                self.console.print(f"⚠️ Task {task.id} failed. Continuing with next task.")
-                # Mark task as failed but don't stop execution
-                failed_tasks = getattr(self.context, 'failed_tasks', [])
-                failed_tasks.append(task.id)
-                self.context.failed_tasks = failed_tasks
-            
-            task_counter += 1
+            for task_result in await scheduler.wait_next():
+                self._record_task_result(task_result)
+        
+        if self._speculation:
+            # Project finished before the speculative task was needed
+            self._speculation[0].cancel()
+            self._speculation = None
         
         # Final project status
         failed_tasks = getattr(self.context, 'failed_tasks', [])
@@ -201,6 +185,145 @@ class DynamicTaskExecutor:
         self.console.print(f"\n🎉 Project execution completed! Generated {len(self.context.execution_history)} tasks.")
         return self.context
     
+    def _generate_task(self, task_counter: int, in_flight: list):
+        """Generate and pre-validate the next task, aware of tasks still in flight"""
+        self.console.print(f"\n{'='*60}")
+        self.console.print(f"📋 GENERATING TASK {task_counter}")
+        self.console.print(f"{'='*60}")
+        
+        # Generate next task using breakdown context
+        task = self.task_generator.generate_next_task(self.context, self.project_breakdown, self.estimated_total_tasks, in_flight)
+        if not task:
+            return None
+        
+        self.console.print(f"✅ Generated: {task.name}")
+        self.console.print(f"🔍 Task ID: {task.id}, Dependencies: {task.dependencies}")
+        return self._prevalidate_task(task, in_flight)
+    
+    def _prevalidate_task(self, task, in_flight: list):
+        """Cheap pre-execution checks, regenerating the task if they ask for it"""
+        # PRE-EXECUTION INTROSPECTION
+        pre_validation = self.validator.introspect_task_planning(task, self.project_breakdown, self.context)
+        if not pre_validation.success:
+            self.console.print(f"⚠️ Pre-execution validation failed: {pre_validation.feedback}")
+            if pre_validation.next_action == "regenerate":
+                self.console.print("🔄 Regenerating task with feedback...")
+                regenerated_task = self.task_generator.regenerate_task_with_feedback(self.context, self.project_breakdown, pre_validation.feedback, in_flight)
+                if regenerated_task:
+                    task = regenerated_task
+                    self.console.print("✅ Task regenerated successfully")
+                else:
+                    self.console.print("⚠️ Task regeneration failed. Proceeding with original task.")
+        return task
+    
+    def _start_speculation(self, task_counter: int, in_flight: list):
+        """Generate the next task in the background from a snapshot of the current context"""
+        if self._speculative_generator is None:
+            # The main agent is busy executing tasks, so speculation needs its own agent and client
+            speculative_agent = self.agent.fork(f"{self.agent.config.name}_speculative", own_client=True)
+            self._speculative_generator = TaskGenerator(speculative_agent, self.console)
+        
+        snapshot = self.context.model_copy(update={
+            "execution_history": list(self.context.execution_history),
+            "current_artifacts": list(self.context.current_artifacts),
+            "failed_tasks": list(self.context.failed_tasks)
+        })
+        self.console.print(f"🔮 Speculatively generating task {task_counter} while {[t.id for t in in_flight]} run")
+        # run_in_executor submits right away, before the event loop is blocked by task execution
+        future = asyncio.get_running_loop().run_in_executor(
+            None, self._speculative_generator.generate_next_task,
+            snapshot, self.project_breakdown, self.estimated_total_tasks, list(in_flight)
+        )
+        self._speculation = (future, {t.id for t in in_flight})
+    
+    async def _take_speculative_task(self, in_flight: list):
+        """Accept the speculative task if it still fits the finished work, else None"""
+        future, basis = self._speculation
+        self._speculation = None
+        try:
+            task = await future
+        except Exception as e:
+            self.console.print(f"⚠️ Speculative generation failed: {e}")
+            return None
+        if not task:
+            return None
+        
+        reason = None
+        failed_basis = basis & set(self.context.failed_tasks)
+        existing_artifacts = {a.lstrip("./") for a in self.context.current_artifacts}
+        taken_names = {r.task_name.lower().strip() for r in self.context.execution_history} | {t.name.lower().strip() for t in in_flight}
+        if failed_basis:
+            reason = f"it assumed {sorted(failed_basis)} would succeed"
+        elif task.name.lower().strip() in taken_names:
+            reason = "it repeats an existing task"
+        elif task.expected_outputs and all(o.lstrip("./") in existing_artifacts for o in task.expected_outputs):
+            reason = "its outputs already exist"
+        if reason:
+            self.console.print(f"🗑️ Discarding speculative task '{task.name}': {reason}")
+            return None
+        
+        task.id = self.task_generator._next_task_id(self.context, in_flight)
+        self.console.print(f"🔮 Using speculative task: {task.name}")
+        self.console.print(f"🔍 Task ID: {task.id}, Dependencies: {task.dependencies}")
+        return self._prevalidate_task(task, in_flight)
+    
+    def _record_task_result(self, task_result):
+        """Join a finished task into the project context"""
+        self.context.execution_history.append(task_result)
+        
+        if not isinstance(self.context.current_artifacts, list):
+            self.context.current_artifacts = []
+            
+        artifacts = task_result.artifacts_created
+        # Ensure artifacts is always a list
+        if not isinstance(artifacts, list):
+            if isinstance(artifacts, str):
+                artifacts = [artifacts]
+            elif artifacts is None or isinstance(artifacts, bool):
+                artifacts = []
+            else:
+                artifacts = [str(artifacts)]
+        
+        # Keep one entry per live file: drop deletions, skip ones already known
+        deleted = set(task_result.artifacts_deleted)
+        known = set()
+        current = []
+        for path in self.context.current_artifacts + artifacts + task_result.artifacts_modified:
+            if path not in deleted and path not in known:
+                known.add(path)
+                current.append(path)
+        self.context.current_artifacts = current
+        
+        self.context.total_tasks_completed += 1
+        
+        # Save state after each task
+        self.cache_manager.save_to_cache(self.context, self.project_breakdown)
+        
+        # Update project status
+        if task_result.status == ExecutionStatus.FAILED:
+            self.console.print(f"⚠️ Task {task_result.task_id} failed. Continuing with next task.")
+            # Mark task as failed but don't stop execution
+            failed_tasks = getattr(self.context, 'failed_tasks', [])
+            failed_tasks.append(task_result.task_id)
+            self.context.failed_tasks = failed_tasks
+    
+    def _create_worker_executors(self) -> list:
+        """One TaskExecutor per worker, each with its own agent and LLM client"""
+        executors = [self.task_executor]
+        for i in range(1, self.max_workers):
+            worker_agent = self.agent.fork(f"{self.agent.config.name}_worker_{i}", own_client=True)
+            executors.append(self._create_task_executor(worker_agent))
+        return executors
+    
+    def _create_task_executor(self, agent) -> TaskExecutor:
+        return TaskExecutor(
+            agent, self.console,
+            max_workers=self.max_workers,
+            introspection_mode=self.introspection_mode,
+            introspection_batch_size=self.introspection_batch_size,
+            action_slots=self.action_slots
+        )
+    
     def _create_project_folder(self, title: str) -> str:
         """Create project folder based on title"""
         # Sanitize title for folder name - keep it simple and meaningful
@@ -221,12 +344,12 @@ class DynamicTaskExecutor:
         
         return folder_name
     
-    def _is_project_complete(self) -> bool:
-        """Determine if project is complete based on progress"""
+    def _is_project_complete(self, in_flight: int = 0) -> bool:
+        """Determine if project is complete based on progress (counting tasks still in flight)"""
         if not self.context.execution_history:
             return False
         
-        if self.context.total_tasks_completed >= max(self.estimated_total_tasks, 5):
+        if self.context.total_tasks_completed + in_flight >= max(self.estimated_total_tasks, 5):
             self.console.print(f"✅ Project completion reached: {self.context.total_tasks_completed}/{self.estimated_total_tasks} tasks")
             return True
         
@@ -0,0 +1,191 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/buddy/backend/agents/planner/introspection.ipynb.
+
+# %% auto 0
+__all__ = ['DEFERRED', 'CheckStatus', 'CheckResult', 'CheckVerdict', 'IntrospectionScheduler']
+
+# %% ../../../nbs/buddy/backend/agents/planner/introspection.ipynb 1
+import os
+import re
+import sys
+import time
+import subprocess
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
+from pydantic import BaseModel, Field
+from rich.console import Console
+
+from .models import Task, ActionStep, ActionResult, IntrospectionResult
+
+
+# %% ../../../nbs/buddy/backend/agents/planner/introspection.ipynb 2
+class CheckStatus(str, Enum):
+    PASS = "pass"
+    FAIL = "fail"
+    INCONCLUSIVE = "inconclusive"
+
+
+class CheckResult(BaseModel):
+    name: str = Field(..., description="Check name")
+    status: CheckStatus = Field(..., description="Check outcome")
+    detail: str = Field("", description="What the check found")
+    elapsed: float = Field(0.0, description="Seconds spent")
+    budget: float = Field(0.0, description="Seconds the check was allowed")
+
+
+class CheckVerdict(BaseModel):
+    status: CheckStatus = Field(..., description="Combined outcome of all checks")
+    checks: List[CheckResult] = Field(default_factory=list, description="Individual check results")
+
+    @property
+    def feedback(self) -> str:
+        failed = [f"{c.name}: {c.detail}" for c in self.checks if c.status == CheckStatus.FAIL]
+        return "; ".join(failed) or "; ".join(f"{c.name}: {c.detail}" for c in self.checks if c.detail)
+
+    def to_introspection_result(self) -> IntrospectionResult:
+        passed = self.status == CheckStatus.PASS
+        return IntrospectionResult(
+            success=passed,
+            score=8.0 if passed else 3.0,
+            feedback=f"Deterministic checks {self.status.value}: {self.feedback}",
+            next_action="proceed" if passed else "retry",
+            recommendations=[] if passed else [c.detail for c in self.checks if c.status == CheckStatus.FAIL]
+        )
+
+
+# IntrospectionResult.next_action for steps whose evaluation was deferred to a batch
+DEFERRED = "defer"
+
+
+class IntrospectionScheduler:
+    """Decides how each action gets evaluated, cheapest first.
+
+    After every action it runs deterministic checks (expected output files exist,
+    the last shell/tool calls succeeded, touched tests pass), each within a time
+    budget. A failing check is conclusive and triggers a retry without an LLM
+    call; passing output or test checks are conclusive success. Only steps the
+    checks can't settle are queued and evaluated by the LLM together, in one
+    call per `batch_size` steps.
+    """
+
+    # Seconds each check may take; an over-budget outcome counts as inconclusive
+    CHECK_BUDGETS = {"expected_outputs": 0.5, "tool_exit_status": 0.1, "tests": 60.0}
+    # Checks whose pass settles a step on its own
+    CONCLUSIVE_CHECKS = {"expected_outputs", "tests"}
+
+    def __init__(self, console: Console, batch_size: int = 5, budgets: Optional[Dict[str, float]] = None):
+        self.console = console
+        self.batch_size = batch_size
+        self.budgets = {**self.CHECK_BUDGETS, **(budgets or {})}
+
+    def run_checks(self, task: Task, action: ActionStep, action_result: ActionResult,
+                   tool_calls: List[Dict], is_last_step: bool) -> CheckVerdict:
+        """Run the deterministic checks for one action"""
+        checks = [
+            self._timed("expected_outputs", self._check_expected_outputs, task, action, is_last_step),
+            self._timed("tool_exit_status", self._check_tool_exit_status, tool_calls),
+            self._timed("tests", self._check_tests, action, action_result)
+        ]
+        if any(c.status == CheckStatus.FAIL for c in checks):
+            status = CheckStatus.FAIL
+        elif any(c.status == CheckStatus.PASS and c.name in self.CONCLUSIVE_CHECKS for c in checks):
+            status = CheckStatus.PASS
+        else:
+            status = CheckStatus.INCONCLUSIVE
+        return CheckVerdict(status=status, checks=checks)
+
+    def _timed(self, name: str, check, *args) -> CheckResult:
+        budget = self.budgets.get(name, 1.0)
+        start = time.perf_counter()
+        try:
+            status, detail = check(*args, budget=budget)
+        except Exception as e:
+            status, detail = CheckStatus.INCONCLUSIVE, f"check errored: {e}"
+        elapsed = time.perf_counter() - start
+        if elapsed > budget and status != CheckStatus.FAIL:
+            status, detail = CheckStatus.INCONCLUSIVE, f"over budget ({elapsed:.1f}s > {budget:.1f}s)"
+        return CheckResult(name=name, status=status, detail=detail, elapsed=elapsed, budget=budget)
+
+    @staticmethod
+    def _is_path(output: str) -> bool:
+        return bool(output) and " " not in output.strip() and ("." in output or output.endswith("/"))
+
+    def _check_expected_outputs(self, task: Task, action: ActionStep, is_last_step: bool, budget: float) -> Tuple[CheckStatus, str]:
+        """Expected outputs this step mentions (or all of them after the last step) exist"""
+        outputs = [o.strip() for o in task.expected_outputs if self._is_path(o)]
+        action_text = " ".join([action.purpose, action.user_prompt, *action.sub_steps])
+        if is_last_step:
+            relevant = outputs
+        else:
+            relevant = [o for o in outputs if o.rstrip("/") in action_text or os.path.basename(o.rstrip("/")) in action_text]
+        if not relevant:
+            return CheckStatus.INCONCLUSIVE, "no expected outputs tied to this step"
+        missing = [o for o in relevant if not os.path.exists(o.rstrip("/") or o)]
+        if missing:
+            return CheckStatus.FAIL, f"missing expected outputs: {', '.join(missing)}"
+        return CheckStatus.PASS, f"{len(relevant)} expected outputs present"
+
+    def _check_tool_exit_status(self, tool_calls: List[Dict], budget: float) -> Tuple[CheckStatus, str]:
+        """The last call of each tool in the step succeeded"""
+        last_results = {}
+        for call in tool_calls or []:
+            result = {"success": False, "error": call["error"]} if "error" in call else call.get("result")
+            if isinstance(result, dict):
+                last_results[call.get("function", {}).get("name", "unknown")] = result
+        if not last_results:
+            return CheckStatus.INCONCLUSIVE, "no tool calls recorded"
+        failures = []
+        for name, result in last_results.items():
+            data = result.get("data") if isinstance(result.get("data"), dict) else {}
+            exit_status = data.get("exit_status")
+            if result.get("success") is False or "error" in result or (exit_status not in (None, 0)):
+                failures.append(f"{name} failed ({result.get('message') or result.get('error') or f'exit {exit_status}'})")
+        if failures:
+            return CheckStatus.FAIL, "; ".join(failures)[:500]
+        return CheckStatus.PASS, f"last calls of {', '.join(last_results)} succeeded"
+
+    def _check_tests(self, action: ActionStep, action_result: ActionResult, budget: float) -> Tuple[CheckStatus, str]:
+        """Run pytest on test files the step created or modified"""
+        touched = action_result.artifacts_created + action_result.artifacts_modified
+        tests = [p for p in touched if re.search(r"(^|/)(test_[^/]*|[^/]*_test)\.py$", p)]
+        if not tests:
+            return CheckStatus.INCONCLUSIVE, "no test files touched"
+        try:
+            proc = subprocess.run([sys.executable, "-m", "pytest", "-q", "-x", *tests],
+                                  capture_output=True, text=True, timeout=budget)
+        except subprocess.TimeoutExpired:
+            return CheckStatus.INCONCLUSIVE, f"tests exceeded {budget:.0f}s budget"
+        output = (proc.stdout + proc.stderr).strip()
+        if "No module named pytest" in output or proc.returncode == 5:
+            return CheckStatus.INCONCLUSIVE, "pytest unavailable or no tests collected"
+        if proc.returncode == 0:
+            return CheckStatus.PASS, f"{len(tests)} test files pass"
+        return CheckStatus.FAIL, f"tests failed: {output[-400:]}"
+
+    def evaluate_batch(self, introspect_agent, task: Task, steps: List[Tuple[ActionStep, ActionResult]]) -> Optional[Dict[int, IntrospectionResult]]:
+        """One LLM evaluation for several deferred steps; None if the call failed"""
+        self.console.print(f"    🔍 Batched introspection of steps {[a.step for a, _ in steps]} (1 LLM call)")
+        verdicts = introspect_agent.evaluate_steps(
+            task_context={"task_id": task.id, "description": task.description},
+            steps=[{"step": action.step, "purpose": action.purpose, "result": str(result.result)} for action, result in steps],
+            success_criteria=task.success_criteria,
+            expected_outputs=task.expected_outputs
+        )
+        if not verdicts:
+            return None
+        results = {}
+        for verdict in verdicts:
+            try:
+                step = int(verdict.get("step"))
+                score = float(verdict.get("overall_score", 0))
+            except (TypeError, ValueError):
+                continue
+            success = verdict.get("success", score >= 7)
+            results[step] = IntrospectionResult(
+                success=bool(success),
+                score=score,
+                feedback=verdict.get("feedback_for_retry", "No feedback provided"),
+                next_action=verdict.get("next_action", "proceed" if success else "retry"),
+                recommendations=verdict.get("recommendations", [])
+            )
+        return results
+
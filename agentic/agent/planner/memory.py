@@ -0,0 +1,139 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/buddy/backend/agents/planner/memory.ipynb.
+
+# %% auto 0
+__all__ = ['ProjectMemory']
+
+# %% ../../../nbs/buddy/backend/agents/planner/memory.ipynb 1
+import os
+from collections import Counter
+from typing import Dict, List
+from .models import ProjectContext, TaskExecutionResult, ExecutionStatus
+
+
+# %% ../../../nbs/buddy/backend/agents/planner/memory.ipynb 2
+class ProjectMemory:
+    """Fixed-size rolling digest of project progress for generation prompts.
+
+    - the last `recent_tasks` tasks are shown verbatim
+    - older tasks become one-line summaries, cached per task and computed once
+    - beyond `max_summaries`, the oldest tasks collapse into per-status counts
+    - artifacts are rendered as a directory tree with file counts
+
+    `sync` folds in only the tasks added since the previous call, so keeping the
+    digest current costs O(new tasks) and the rendered prompt stays bounded.
+    """
+
+    def __init__(self, recent_tasks: int = 3, max_summaries: int = 8,
+                 max_artifact_dirs: int = 8, max_files_per_dir: int = 3):
+        self.recent_tasks = recent_tasks
+        self.max_summaries = max_summaries
+        self.max_artifact_dirs = max_artifact_dirs
+        self.max_files_per_dir = max_files_per_dir
+        self._request = None
+        self._synced = 0
+        self._summaries: Dict[str, str] = {}
+        self._status_counts: Counter = Counter()
+        self._tree: Dict[str, List[str]] = {}
+
+    def reset(self):
+        self._synced = 0
+        self._summaries.clear()
+        self._status_counts.clear()
+        self._tree.clear()
+
+    def sync(self, context: ProjectContext):
+        """Fold tasks completed since the last sync into the digest"""
+        history = context.execution_history
+        if context.original_request != self._request or len(history) < self._synced:
+            # Different project or a rewound context - rebuild once
+            self._request = context.original_request
+            self.reset()
+        for task_result in history[self._synced:]:
+            self._summaries[task_result.task_id] = self._summarize(task_result)
+            self._status_counts[self._status(task_result)] += 1
+            for path in task_result.artifacts_deleted:
+                files = self._tree.get(os.path.dirname(path) or ".", [])
+                if path in files:
+                    files.remove(path)
+            for path in task_result.artifacts_created:
+                files = self._tree.setdefault(os.path.dirname(path) or ".", [])
+                if path not in files:
+                    files.append(path)
+        self._synced = len(history)
+
+    @staticmethod
+    def _status(task_result: TaskExecutionResult) -> str:
+        status = task_result.status
+        return status.value if isinstance(status, ExecutionStatus) else str(status)
+
+    def _summarize(self, task_result: TaskExecutionResult) -> str:
+        """One-line summary of a finished task"""
+        parts = [f"{task_result.task_id} {task_result.task_name} - {self._status(task_result)}"]
+        if task_result.artifacts_created:
+            dirs = Counter(os.path.dirname(path) or "." for path in task_result.artifacts_created)
+            parts.append(f"{len(task_result.artifacts_created)} files in {', '.join(d for d, _ in dirs.most_common(2))}")
+        failed = [a.action_id for a in task_result.actions_executed if self._status(a) == ExecutionStatus.FAILED.value]
+        if failed:
+            parts.append(f"failed at {failed[0]}")
+        return "; ".join(parts)
+
+    def task_names(self, context: ProjectContext, limit: int = 10) -> List[str]:
+        """Names of the most recent tasks"""
+        return [t.task_name for t in context.execution_history[-limit:]]
+
+    def render_tasks(self, context: ProjectContext) -> List[str]:
+        """History lines: status rollup, cached summaries, then recent tasks verbatim"""
+        history = context.execution_history
+        older = history[:-self.recent_tasks] if len(history) > self.recent_tasks else []
+        recent = history[len(older):]
+        summarized = older[-self.max_summaries:]
+        rolled_up = older[:len(older) - len(summarized)]
+
+        counts = ", ".join(f"{count} {status}" for status, count in self._status_counts.items())
+        lines = [f"EXECUTION HISTORY ({len(history)} tasks: {counts}):"]
+        if rolled_up:
+            rolled_counts = Counter(self._status(t) for t in rolled_up)
+            lines.append(f"Earliest {len(rolled_up)} tasks ({rolled_up[0].task_id}-{rolled_up[-1].task_id}): "
+                         + ", ".join(f"{count} {status}" for status, count in rolled_counts.items()))
+        for task_result in summarized:
+            lines.append(f"- {self._summaries.get(task_result.task_id) or self._summarize(task_result)}")
+
+        for i, task_result in enumerate(recent, len(older) + 1):
+            status = self._status(task_result)
+            status_emoji = "✅" if status == "success" else "❌"
+            lines.append(f"{i}. {task_result.task_name} (ID: {task_result.task_id}) - {status_emoji} {status}")
+            if task_result.artifacts_created:
+                if len(task_result.artifacts_created) <= 3:
+                    lines.append(f"   Artifacts: {', '.join(task_result.artifacts_created)}")
+                else:
+                    shown = ', '.join(task_result.artifacts_created[:3])
+                    remaining = len(task_result.artifacts_created) - 3
+                    lines.append(f"   Artifacts: {shown} ... (+{remaining} more)")
+        return lines
+
+    def render_artifacts(self) -> List[str]:
+        """Artifact tree: largest directories first, a few file names each"""
+        dirs = sorted(((d, files) for d, files in self._tree.items() if files), key=lambda item: (-len(item[1]), item[0]))
+        total = sum(len(files) for _, files in dirs)
+        lines = [f"ARTIFACT TREE ({total} files in {len(dirs)} directories):"]
+        for directory, files in dirs[:self.max_artifact_dirs]:
+            names = [os.path.basename(path) for path in files[-self.max_files_per_dir:]]
+            more = f" (+{len(files) - len(names)} more)" if len(files) > len(names) else ""
+            lines.append(f"  {directory}/ ({len(files)}): {', '.join(names)}{more}")
+        if len(dirs) > self.max_artifact_dirs:
+            lines.append(f"  ... (+{len(dirs) - self.max_artifact_dirs} more directories)")
+        return lines
+
+    def render(self, context: ProjectContext) -> str:
+        """Bounded context block for task generation prompts"""
+        self.sync(context)
+        if not context.execution_history:
+            return "PREVIOUS CONTEXT: This is the first task."
+        parts = self.render_tasks(context)
+        parts.append("")
+        parts.extend(self.render_artifacts())
+        parts.append(f"\nTOTAL ARTIFACTS: {len(context.current_artifacts)}")
+        parts.append(f"PROJECT STATUS: {context.project_status}")
+        parts.append(f"PROGRESS: {context.total_tasks_completed}/{len(context.execution_history)} tasks completed")
+        return "\n".join(parts)
+
@@ -57,6 +57,8 @@ class ActionResult(BaseModel):
     status: ExecutionStatus = Field(..., description="Execution status")
     error_message: Optional[str] = Field(None, description="Error message if failed")
     artifacts_created: List[str] = Field(default_factory=list, description="Files/artifacts created")
+    artifacts_modified: List[str] = Field(default_factory=list, description="Existing files changed")
+    artifacts_deleted: List[str] = Field(default_factory=list, description="Files removed")
 
 class IntrospectionResult(BaseModel):
     success: bool = Field(..., description="Whether introspection passed")
@@ -72,6 +74,8 @@ class TaskExecutionResult(BaseModel):
     actions_executed: List[ActionResult] = Field(default_factory=list, description="ActionStep results")
     introspection_results: List[IntrospectionResult] = Field(default_factory=list, description="Introspection results")
     artifacts_created: List[str] = Field(default_factory=list, description="All artifacts from this task")
+    artifacts_modified: List[str] = Field(default_factory=list, description="Pre-existing files changed by this task")
+    artifacts_deleted: List[str] = Field(default_factory=list, description="Files removed by this task")
     execution_time: float = Field(..., description="Total task execution time")
     timestamp: datetime = Field(default_factory=datetime.now, description="Execution timestamp")
     success_criteria_met: bool = Field(..., description="Whether success criteria were met")
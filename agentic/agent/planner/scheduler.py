@@ -0,0 +1,92 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../../nbs/buddy/backend/agents/planner/scheduler.ipynb.
+
+# %% auto 0
+__all__ = ['TaskScheduler']
+
+# %% ../../../nbs/buddy/backend/agents/planner/scheduler.ipynb 1
+import asyncio
+from typing import Dict, List
+from rich.console import Console
+
+from .models import Task, TaskExecutionResult, ExecutionStatus
+
+
+# %% ../../../nbs/buddy/backend/agents/planner/scheduler.ipynb 2
+class TaskScheduler:
+    """Dependency-aware scheduler running ready tasks on a bounded worker pool.
+
+    Tasks wait in `pending` until every dependency that is still known to the
+    scheduler has finished (successfully or not); dependencies on unknown IDs are
+    treated as satisfied. Each worker owns a TaskExecutor, so the pool size is the
+    number of executors passed in.
+    """
+
+    def __init__(self, executors: List, console: Console):
+        self.console = console
+        self.max_workers = len(executors)
+        self.idle = list(executors)
+        self.pending: Dict[str, Task] = {}
+        self.running: Dict[asyncio.Task, tuple] = {}
+        self.finished: set = set()
+
+    @property
+    def in_flight(self) -> List[Task]:
+        """Tasks generated but not finished yet"""
+        return list(self.pending.values()) + [task for task, _ in self.running.values()]
+
+    def has_capacity(self) -> bool:
+        """Whether another task can be queued without exceeding the worker pool"""
+        return len(self.pending) + len(self.running) < self.max_workers
+
+    def add(self, task: Task):
+        """Queue a task for execution"""
+        self.pending[task.id] = task
+
+    def _is_ready(self, task: Task) -> bool:
+        known = set(self.pending) | {t.id for t, _ in self.running.values()}
+        return all(dep in self.finished or dep not in known for dep in task.dependencies if dep != task.id)
+
+    def launch_ready(self):
+        """Start every ready task that has a free worker"""
+        ready = [task for task in self.pending.values() if self._is_ready(task)]
+        if not ready and not self.running and self.pending:
+            # Dependency cycle among queued tasks - break it in queue order
+            ready = [next(iter(self.pending.values()))]
+            self.console.print(f"⚠️ Dependency cycle detected, starting {ready[0].id} anyway")
+
+        for task in ready:
+            if not self.idle:
+                break
+            executor = self.idle.pop()
+            del self.pending[task.id]
+            self.running[asyncio.create_task(self._run(executor, task))] = (task, executor)
+            if self.max_workers > 1:
+                self.console.print(f"⚡ Started {task.id} ({len(self.running)}/{self.max_workers} workers busy)")
+
+    async def _run(self, executor, task: Task) -> TaskExecutionResult:
+        if self.max_workers == 1:
+            return await executor.execute_task(task)
+        # TaskExecutor blocks on the LLM, so each worker gets its own thread and loop
+        return await asyncio.to_thread(asyncio.run, executor.execute_task(task))
+
+    async def wait_next(self) -> List[TaskExecutionResult]:
+        """Wait for at least one running task and return the finished results"""
+        done, _ = await asyncio.wait(self.running, return_when=asyncio.FIRST_COMPLETED)
+        results = []
+        for future in done:
+            task, executor = self.running.pop(future)
+            self.idle.append(executor)
+            self.finished.add(task.id)
+            try:
+                results.append(future.result())
+            except Exception as e:
+                self.console.print(f"❌ Task {task.id} crashed: {e}")
+                results.append(TaskExecutionResult(
+                    task_id=task.id,
+                    task_name=task.name,
+                    status=ExecutionStatus.FAILED,
+                    execution_time=0.0,
+                    success_criteria_met=False
+                ))
+        return results
+
@@ -5,9 +5,10 @@ __all__ = ['TaskExecutor']
 
 # %% ../../../nbs/buddy/backend/agents/planner/task_executor.ipynb 1
 import json
+import asyncio
+import threading
 from typing import Optional, List, Tuple
 from datetime import datetime
-from pathlib import Path
 from rich.console import Console
 
 from ..debater import create_debate
@@ -16,19 +17,31 @@ from ...tools.base import ToolMetadata, ToolCategory
 
 from agentic.agent.planner.models import (
     Task, ActionStep, ActionResult, IntrospectionResult, 
-    TaskExecutionResult, ExecutionStatus
+    TaskExecutionResult, ExecutionStatus, ExecutionMode
 )
 from ..introspector import IntrospectAgent
+from .artifacts import ArtifactTracker
+from .introspection import IntrospectionScheduler, CheckStatus, DEFERRED
 
 # %% ../../../nbs/buddy/backend/agents/planner/task_executor.ipynb 2
 class TaskExecutor:
     """Handles task execution with introspection and retries"""
     
-    def __init__(self, agent, console: Console, max_retries: int = 3):
+    def __init__(self, agent, console: Console, max_retries: int = 3, max_workers: int = 1,
+                 introspection_mode: str = "batched", introspection_batch_size: int = 5,
+                 action_slots: Optional[threading.Semaphore] = None):
         self.agent = agent
         self.console = console
         self.max_retries = max_retries
+        self.max_workers = max_workers
+        # Caps agent calls in flight; share one between executors so parallel steps don't multiply the limit
+        self.action_slots = action_slots or threading.BoundedSemaphore(max_workers)
         self.introspect_agent = IntrospectAgent(agent, console)
+        # "batched": deterministic checks first, unsettled steps share one LLM call; "per_step": LLM after every step
+        self.introspection_mode = introspection_mode
+        self.introspection_scheduler = IntrospectionScheduler(console, batch_size=introspection_batch_size)
+        # Other workers write to the same tree, so only reuse snapshots when running alone
+        self.artifact_tracker = ArtifactTracker(reuse_snapshots=max_workers == 1)
     
     async def execute_task(self, task: Task) -> TaskExecutionResult:
         """Execute all actions in a task with full tracking"""
@@ -51,49 +64,157 @@ class TaskExecutor:
         )
         
         overall_success = True
+        evaluation_complete = True
+        deferred: List[Tuple[ActionStep, ActionResult]] = []
         
-        for action in task.actions:
-            self.console.print(f"\n  📌 Step {action.step}: {action.purpose}")
-            
-            action_result, introspection_result = self._execute_action_with_retries(task, action)
-            
-            task_result.actions_executed.append(action_result)
-            if introspection_result:
-                task_result.introspection_results.append(introspection_result)
+        for group in self._group_actions(task.actions):
+            if len(group) > 1 and self.max_workers > 1:
+                outcomes = await self._execute_parallel_actions(task, group)
+            else:
+                outcomes = []
+                for action in group:
+                    self.console.print(f"\n  📌 Step {action.step}: {action.purpose}")
+                    outcomes.append(self._run_action(task, action))
+                    if outcomes[-1][0].status != ExecutionStatus.SUCCESS:
+                        break
             
-            # Update artifacts (ensure it's a list)
-            if not isinstance(task_result.artifacts_created, list):
-                task_result.artifacts_created = []
+            for action, (action_result, introspection_result) in zip(group, outcomes):
+                task_result.actions_executed.append(action_result)
+                if introspection_result and introspection_result.next_action == DEFERRED:
+                    deferred.append((action, action_result))
+                elif introspection_result:
+                    task_result.introspection_results.append(introspection_result)
+                
+                # Update artifacts (ensure it's a list)
+                if not isinstance(task_result.artifacts_created, list):
+                    task_result.artifacts_created = []
+                    
+                artifacts = action_result.artifacts_created
+                # Ensure artifacts is always a list
+                if not isinstance(artifacts, list):
+                    if isinstance(artifacts, str):
+                        artifacts = [artifacts]
+                    elif artifacts is None or isinstance(artifacts, bool):
+                        artifacts = []
+                    else:
+                        artifacts = [str(artifacts)]
                 
-            artifacts = action_result.artifacts_created
-            # Ensure artifacts is always a list
-            if not isinstance(artifacts, list):
-                if isinstance(artifacts, str):
-                    artifacts = [artifacts]
-                elif artifacts is None or isinstance(artifacts, bool):
-                    artifacts = []
+                self._merge_artifacts(task_result, artifacts, action_result.artifacts_modified, action_result.artifacts_deleted)
+                
+                if action_result.status != ExecutionStatus.SUCCESS:
+                    self.console.print(f"  ❌ Step {action.step} failed after {self.max_retries} retries")
+                    overall_success = False
                 else:
-                    artifacts = [str(artifacts)]
+                    self.console.print(f"  ✅ Step {action.step} completed successfully")
             
-            task_result.artifacts_created.extend(artifacts)
+            if overall_success and len(deferred) >= self.introspection_scheduler.batch_size:
+                overall_success, evaluation_complete = self._flush_introspection(task, task_result, deferred, evaluation_complete)
             
-            if action_result.status != ExecutionStatus.SUCCESS:
-                self.console.print(f"  ❌ Step {action.step} failed after {self.max_retries} retries")
-                overall_success = False
+            if not overall_success:
                 break
-            else:
-                self.console.print(f"  ✅ Step {action.step} completed successfully")
+        
+        if overall_success and deferred:
+            overall_success, evaluation_complete = self._flush_introspection(task, task_result, deferred, evaluation_complete)
         
         # Finalize task result
         end_time = datetime.now()
         task_result.execution_time = (end_time - start_time).total_seconds()
-        task_result.status = ExecutionStatus.SUCCESS if overall_success else ExecutionStatus.FAILED
+        if not overall_success:
+            task_result.status = ExecutionStatus.FAILED
+        elif not evaluation_complete:
+            task_result.status = ExecutionStatus.PARTIAL_SUCCESS
+        else:
+            task_result.status = ExecutionStatus.SUCCESS
         task_result.success_criteria_met = overall_success
         
         return task_result
     
-    def _execute_action_with_retries(self, task: Task, action: ActionStep) -> Tuple[ActionResult, Optional[IntrospectionResult]]:
+    def _flush_introspection(self, task: Task, task_result: TaskExecutionResult,
+                             deferred: List[Tuple[ActionStep, ActionResult]], evaluation_complete: bool) -> Tuple[bool, bool]:
+        """Evaluate deferred steps in one LLM call and rerun the ones it rejects.
+        
+        Returns (overall_success, evaluation_complete); steps the call could not
+        evaluate are accepted but leave the task a partial success.
+        """
+        steps = list(deferred)
+        deferred.clear()
+        results = self.introspection_scheduler.evaluate_batch(self.introspect_agent, task, steps)
+        if results is None:
+            self.console.print(f"    ⚠️ Batched introspection unavailable, accepting steps {[a.step for a, _ in steps]} unevaluated")
+            return True, False
+        
+        for action, action_result in steps:
+            introspection_result = results.get(action.step)
+            if introspection_result is None:
+                evaluation_complete = False
+                continue
+            task_result.introspection_results.append(introspection_result)
+            if introspection_result.success:
+                self.console.print(f"    ✅ Step {action.step} passed batched introspection (score: {introspection_result.score})")
+                continue
+            
+            self.console.print(f"    ⚠️ Step {action.step} failed batched introspection (score: {introspection_result.score})")
+            self.console.print(f"\n  📌 Corrective rerun of step {action.step}: {action.purpose}")
+            rerun_result, rerun_introspection = self._run_action(
+                task, action, initial_feedback=introspection_result.feedback, allow_defer=False
+            )
+            index = task_result.actions_executed.index(action_result)
+            task_result.actions_executed[index] = rerun_result
+            if rerun_introspection:
+                task_result.introspection_results.append(rerun_introspection)
+            self._merge_artifacts(task_result, rerun_result.artifacts_created, rerun_result.artifacts_modified, rerun_result.artifacts_deleted)
+            if rerun_result.status != ExecutionStatus.SUCCESS:
+                self.console.print(f"  ❌ Step {action.step} failed after corrective rerun")
+                return False, evaluation_complete
+        return True, evaluation_complete
+    
+    def _merge_artifacts(self, task_result: TaskExecutionResult, created: List[str], modified: List[str], deleted: List[str]):
+        """Fold one action's file changes into the task totals"""
+        deleted_set = set(deleted)
+        task_result.artifacts_created = [a for a in task_result.artifacts_created if a not in deleted_set]
+        task_result.artifacts_modified = [a for a in task_result.artifacts_modified if a not in deleted_set]
+        for path in created:
+            if path not in task_result.artifacts_created:
+                task_result.artifacts_created.append(path)
+        for path in modified:
+            if path not in task_result.artifacts_created and path not in task_result.artifacts_modified:
+                task_result.artifacts_modified.append(path)
+        for path in deleted:
+            if path not in task_result.artifacts_deleted:
+                task_result.artifacts_deleted.append(path)
+    
+    def _group_actions(self, actions: List[ActionStep]) -> List[List[ActionStep]]:
+        """Split actions into runs: consecutive parallel actions share a group"""
+        groups = []
+        for action in actions:
+            if (action.execution_mode == ExecutionMode.PARALLEL and groups
+                    and groups[-1][-1].execution_mode == ExecutionMode.PARALLEL):
+                groups[-1].append(action)
+            else:
+                groups.append([action])
+        return groups
+    
+    async def _execute_parallel_actions(self, task: Task, actions: List[ActionStep]) -> List[Tuple[ActionResult, Optional[IntrospectionResult]]]:
+        """Run independent actions concurrently, each on its own agent"""
+        self.console.print(f"\n  ⚡ Steps {[a.step for a in actions]} running in parallel")
+        
+        def run(action: ActionStep):
+            worker_agent = self.agent.fork(f"{self.agent.config.name}_{task.id}_step_{action.step}", own_client=True)
+            return self._run_action(task, action, worker_agent, announce=True)
+        
+        return await asyncio.gather(*(asyncio.to_thread(run, action) for action in actions))
+    
+    def _run_action(self, task: Task, action: ActionStep, agent=None, announce: bool = False, **kwargs) -> Tuple[ActionResult, Optional[IntrospectionResult]]:
+        """`_execute_action_with_retries` once an action slot is free"""
+        with self.action_slots:
+            if announce:
+                self.console.print(f"\n  📌 Step {action.step}: {action.purpose}")
+            return self._execute_action_with_retries(task, action, agent, **kwargs)
+    
+    def _execute_action_with_retries(self, task: Task, action: ActionStep, agent=None,
+                                     initial_feedback: str = "", allow_defer: bool = True) -> Tuple[ActionResult, Optional[IntrospectionResult]]:
         """Execute single action with introspection and retries"""
+        agent = agent or self.agent
         
         action_result = ActionResult(
             action_id=f"{task.id}_step_{action.step}",
@@ -105,7 +226,9 @@ class TaskExecutor:
         )
         
         introspection_result = None
-        retry_feedback = ""
+        retry_feedback = initial_feedback
+        # Changes are measured against the state before the first attempt
+        baseline = self.artifact_tracker.begin()
         
         for attempt in range(self.max_retries):
             self.console.print(f"    🔄 Attempt {attempt + 1}/{self.max_retries}")
@@ -115,7 +238,8 @@ class TaskExecutor:
                 
                 self.console.print(f"    🚀 Executing action: {action.purpose}")
                 
-                result = self._execute_single_action(action, retry_feedback, attempt + 1, retry_feedback)
+                run = self._execute_single_action(action, retry_feedback, attempt + 1, retry_feedback, agent=agent)
+                result = run.get("content", "")
                 
                 end_time = datetime.now()
                 execution_time = (end_time - start_time).total_seconds()
@@ -127,8 +251,13 @@ class TaskExecutor:
                 action_result.execution_time = execution_time
                 action_result.status = ExecutionStatus.SUCCESS
                 
-                new_artifacts = self._detect_new_artifacts()
-                action_result.artifacts_created = new_artifacts if isinstance(new_artifacts, list) else []
+                changes = self.artifact_tracker.changes_since(baseline)
+                if self.max_workers > 1:
+                    # Other workers write to the same tree: keep what this action's tool calls name
+                    changes = ArtifactTracker.attributed(changes, run.get("tool_calls", []))
+                action_result.artifacts_created = changes.created
+                action_result.artifacts_modified = changes.modified
+                action_result.artifacts_deleted = changes.deleted
                 
                 self.console.print(f"    📝 ActionStep completed in {execution_time:.2f}s")
                 if action_result.artifacts_created:
@@ -140,12 +269,15 @@ class TaskExecutor:
                         self.console.print(f"    📁 New artifacts: {shown} ... (+{remaining} more)")
                 else:
                     self.console.print(f"    📁 New artifacts: []")
+                if changes.modified or changes.deleted:
+                    self.console.print(f"    ✏️ Modified: {len(changes.modified)}, 🗑️ Deleted: {len(changes.deleted)}")
                 
                 if action.introspect_after:
-                    self.console.print(f"    🔍 Starting introspection...")
-                    introspection_result = self._introspect_action(task, action, result)
+                    introspection_result = self._evaluate_action(task, action, action_result, run.get("tool_calls", []), allow_defer, agent=agent)
                     
-                    if introspection_result.success:
+                    if introspection_result.next_action == DEFERRED:
+                        return action_result, introspection_result
+                    elif introspection_result.success:
                         self.console.print(f"    ✅ Introspection passed (score: {introspection_result.score})")
                         return action_result, introspection_result
                     else:
@@ -175,8 +307,29 @@ class TaskExecutor:
         action_result.status = ExecutionStatus.FAILED
         return action_result, introspection_result
     
-    def _execute_single_action(self, action: ActionStep, retry_feedback: str = "", attempt: int = 1, validation_error: str = "") -> str:
+    def _evaluate_action(self, task: Task, action: ActionStep, action_result: ActionResult,
+                         tool_calls: list, allow_defer: bool, agent=None) -> IntrospectionResult:
+        """Cheap deterministic checks first; the LLM only when they are inconclusive"""
+        if self.introspection_mode != "batched":
+            self.console.print(f"    🔍 Starting introspection...")
+            return self._introspect_action(task, action, action_result.result, agent=agent)
+        
+        is_last_step = action.step == task.actions[-1].step
+        verdict = self.introspection_scheduler.run_checks(task, action, action_result, tool_calls, is_last_step)
+        checks = ", ".join(f"{c.name}={c.status.value}" for c in verdict.checks)
+        self.console.print(f"    🧪 Checks {verdict.status.value} ({checks})")
+        
+        if verdict.status != CheckStatus.INCONCLUSIVE:
+            return verdict.to_introspection_result()
+        if allow_defer:
+            self.console.print(f"    ⏳ Deferring step {action.step} to batched introspection")
+            return IntrospectionResult(success=True, score=0.0, feedback="Deferred to batched introspection", next_action=DEFERRED)
+        self.console.print(f"    🔍 Starting introspection...")
+        return self._introspect_action(task, action, action_result.result, agent=agent)
+    
+    def _execute_single_action(self, action: ActionStep, retry_feedback: str = "", attempt: int = 1, validation_error: str = "", agent=None) -> dict:
         """Execute single action using Agent's tool system"""
+        agent = agent or self.agent
         
         retry_guidance = ""
         if attempt > 1:
@@ -239,11 +392,11 @@ TOOL USAGE EXAMPLES:
 Execute this action systematically and report detailed results.
 """
         
-        result = self.agent.run(enriched_prompt, stream=False, max_iterations=5)
-        return result.get("content", "")
+        return agent.run(enriched_prompt, stream=False, max_iterations=5)
     
-    def _introspect_action(self, task: Task, action: ActionStep, result: str) -> IntrospectionResult:
+    def _introspect_action(self, task: Task, action: ActionStep, result: str, agent=None) -> IntrospectionResult:
         """Use IntrospectAgent to validate action success"""
+        introspect_agent = self.introspect_agent if agent in (None, self.agent) else IntrospectAgent(agent, self.console)
         
         self.console.print(f"    🔍 Starting introspection for step {action.step}")
         
@@ -255,7 +408,7 @@ Execute this action systematically and report detailed results.
             }
             
             # Run introspection synchronously
-            introspect_result = self.introspect_agent.evaluate_execution(
+            introspect_result = introspect_agent.evaluate_execution(
                 task_context=task_context,
                 execution_result=result,
                 success_criteria=task.success_criteria,
@@ -297,25 +450,5 @@ Execute this action systematically and report detailed results.
             next_action="retry",
             recommendations=["Fix introspection system"]
         )
-    
-    def _detect_new_artifacts(self) -> List[str]:
-        """Detect newly created files/artifacts"""
-        current_files = set()
-        current_dir = Path(".")
-        
-        exclude_patterns = {
-            '.venv', '__pycache__', '.git', 'node_modules', 
-            '.pytest_cache', '.mypy_cache', 'execution_cache'
-        }
-        
-        for file_path in current_dir.glob("**/*"):
-            if file_path.is_file() and not file_path.name.startswith('.'):
-                if any(part in exclude_patterns for part in file_path.parts):
-                    continue
-                if file_path.suffix in {'.pyc', '.pyo', '.log', '.tmp'}:
-                    continue
-                current_files.add(str(file_path))
-        
-        return list(current_files)
 
 
@@ -6,10 +6,13 @@ __all__ = ['TaskGenerator']
 # %% ../../../nbs/buddy/backend/agents/planner/task_generator.ipynb 1
 import json
 import re
-from typing import Optional
+from typing import Optional, List
 from rich.console import Console
 from datetime import datetime
 from .models import Task, ProjectBreakdown, ProjectContext
+from .memory import ProjectMemory
+from ...llms.json_extractor import JsonExtractionError, extract_json, complete_json
+from ...llms.prompt_layout import PromptLayout
 
 
 # %% ../../../nbs/buddy/backend/agents/planner/task_generator.ipynb 2
@@ -19,6 +22,7 @@ class TaskGenerator:
     def __init__(self, agent, console: Console):
         self.agent = agent
         self.console = console
+        self.memory = ProjectMemory()
     
     def _determine_project_phase(self, completed: int, total: int) -> str:
         """Determine current project phase based on completion"""
@@ -65,46 +69,42 @@ class TaskGenerator:
         return guidance.get(phase, "Continue with next logical development step")
     
     
-    def generate_next_task(self, context: ProjectContext, breakdown: ProjectBreakdown, estimated_total: int) -> Optional[Task]:
+    def _next_task_id(self, context: ProjectContext, in_flight: Optional[List[Task]] = None) -> str:
+        """Next unused task ID, counting tasks that are queued or running"""
+        return f"T{len(context.execution_history) + len(in_flight or []) + 1:03d}"
+    
+    def _build_in_flight_prompt(self, in_flight: Optional[List[Task]]) -> str:
+        """Describe queued/running tasks so the next task can depend on or avoid them"""
+        if not in_flight:
+            return ""
+        lines = ["TASKS IN PROGRESS (not finished yet - list them in dependencies only if the new task needs their outputs; prefer independent work):"]
+        for task in in_flight:
+            lines.append(f"- {task.id}: {task.name} (outputs: {', '.join(task.expected_outputs) or 'n/a'})")
+        return "\n".join(lines)
+    
+    def generate_next_task(self, context: ProjectContext, breakdown: ProjectBreakdown, estimated_total: int, in_flight: Optional[List[Task]] = None) -> Optional[Task]:
         """Generate single next task using project breakdown context"""
         
         context_prompt = self._build_context_prompt(context)
         execution_context = self._get_execution_context(context)
+        in_flight_prompt = self._build_in_flight_prompt(in_flight)
         
         completed_count = len(context.execution_history)
-        next_task_id = f"T{completed_count + 1:03d}"
+        next_task_id = self._next_task_id(context, in_flight)
         
-        prompt = f"""
-MISSION: Generate the next critical task in the software development pipeline.
-
-EXECUTION CONTEXT:
-• Progress: {completed_count}/{estimated_total} tasks completed
-• Project Phase: {self._determine_project_phase(completed_count, estimated_total)}
-• Quality Standard: Production-grade implementation required
-
-{execution_context}
-
-PROJECT SPECIFICATION:
-• Objective: {breakdown.project_summary}
-• Development Phases: {' → '.join(breakdown.phases)}
-• Target Deliverables: {', '.join(breakdown.key_deliverables)}
-• Technical Stack: {breakdown.technical_approach}
-
-ORIGINAL REQUIREMENT: {context.original_request}
-
-{context_prompt}
-
-TASK GENERATION STRATEGY:
-{self._get_phase_guidance(completed_count, estimated_total)}
+        # Instructions and format first, project details next, progress last: every
+        # task of a run (and of other runs) shares the instructions as a cached prefix
+        prompt = (PromptLayout()
+            .static("""MISSION: Generate the next critical task in the software development pipeline.
 
 RESPONSE FORMAT - SINGLE TASK OBJECT:
-{{
-  "id": "{next_task_id}",
+{
+  "id": "[next task id]",
   "name": "[Descriptive Task Name - Action Oriented]",
   "description": "[Detailed description aligned with current project phase and deliverables]",
   "dependencies": [/* Previous task IDs if applicable */],
   "actions": [
-    {{
+    {
       "step": 1,
       "purpose": "[Clear, actionable purpose statement]",
       "sub_steps": [
@@ -113,17 +113,17 @@ RESPONSE FORMAT - SINGLE TASK OBJECT:
         "[Specific action 3 - mention exact files/outputs]"
       ],
       "introspect_after": true,
-      "system_prompt": "You are a senior software engineer working on: {breakdown.project_summary}. Deliver high-quality code with proper error handling, documentation, and best practices.",
+      "system_prompt": "You are a senior software engineer working on: [project objective]. Deliver high-quality code with proper error handling, documentation, and best practices.",
       "user_prompt": "Implement the required functionality focusing on: [LIST ALL expected_outputs HERE]. Use appropriate tools (fs_write, execute_bash) to create well-structured, documented code.",
       "introspect_prompt": "Validate implementation quality: check file existence, code structure, documentation completeness, and adherence to requirements.",
       "execution_mode": "sequential"
-    }}
+    }
   ],
   "success_criteria": "[Specific, measurable success criteria with file/component verification]",
   "expected_outputs": ["[specific_file1.py]", "[specific_file2.json]", "[directory/]"],
   "potential_options": [],
   "needs_debate": false
-}}
+}
 
 DEBATE USAGE GUIDELINES:
 • Set "needs_debate": true for tasks involving:
@@ -139,81 +139,81 @@ QUALITY REQUIREMENTS:
 ✓ Task must advance toward project objectives
 ✓ Actions must be specific and executable
 ✓ Success criteria must be measurable
+✓ Mark consecutive actions that don't depend on each other with "execution_mode": "parallel"
 ✓ High-quality standards apply
 
-Generate the next logical task or return null if project is complete.
-"""
+Generate the next logical task or return null if project is complete.""")
+            .context(f"""PROJECT SPECIFICATION:
+• Objective: {breakdown.project_summary}
+• Development Phases: {' → '.join(breakdown.phases)}
+• Target Deliverables: {', '.join(breakdown.key_deliverables)}
+• Technical Stack: {breakdown.technical_approach}
+
+ORIGINAL REQUIREMENT: {context.original_request}""")
+            .volatile(f"""EXECUTION CONTEXT:
+• Progress: {completed_count}/{estimated_total} tasks completed
+• Project Phase: {self._determine_project_phase(completed_count, estimated_total)}
+• Quality Standard: Production-grade implementation required
+
+{execution_context}""")
+            .volatile(context_prompt)
+            .volatile(in_flight_prompt)
+            .volatile(f"""TASK GENERATION STRATEGY:
+{self._get_phase_guidance(completed_count, estimated_total)}
+
+Use "{next_task_id}" as the task id.""")
+            .render())
         
+        # Structured output: the task arrives validated, or the model answered null
+        error = None
         try:
-            response = self.agent.run(prompt).get("content", "")
-            
-            # Save raw response for debugging in JSONL format
-            import json
-            from datetime import datetime
-            log_entry = {
-                "timestamp": datetime.now().isoformat(),
-                "task_id": next_task_id,
-                "title": breakdown.title if hasattr(breakdown, 'title') else "Unknown Project",
-                "response": response
-            }
-            with open("task_generation_raw.jsonl", 'a') as f:
-                f.write(json.dumps(log_entry) + '\n')
-            
-            # Parse and validate task
-            response = response.strip()
-            
-            # Only return None if explicitly null AND we have enough tasks
-            if response.lower() == "null":
-                if context.total_tasks_completed >= 5:
-                    return None
-                else:
-                    self.console.print("⚠️ LLM returned null but project needs more tasks. Regenerating...")
-                    return self._force_generate_next_task(context, breakdown, estimated_total)
-            
-            # Try to extract JSON from response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                json_str = json_match.group()
-                task_data = json.loads(json_str)
-            else:
-                task_data = json.loads(response)
-                
-        except json.JSONDecodeError as e:
-            self.console.print(f"❌ JSON parsing failed: {e}")
+            task, response = complete_json(self.agent, prompt, schema=Optional[Task])
+        except JsonExtractionError as e:
+            task, response, error = None, e.content, e
+        
+        # Save raw response for debugging in JSONL format
+        log_entry = {
+            "timestamp": datetime.now().isoformat(),
+            "task_id": next_task_id,
+            "title": breakdown.title if hasattr(breakdown, 'title') else "Unknown Project",
+            "response": response
+        }
+        with open("task_generation_raw.jsonl", 'a') as f:
+            f.write(json.dumps(log_entry) + '\n')
+        
+        if error:
+            self.console.print(f"❌ JSON parsing failed: {error}")
             task_data = self._extract_task_from_text(response, context)
             if not task_data:
                 self.console.print("❌ Failed to extract task from response")
                 return None
-        
-        # If LLM returns array, take only the first task
-        if isinstance(task_data, list):
-            if len(task_data) > 0:
-                task_data = task_data[0]
-                self.console.print("⚠️ LLM returned multiple tasks, using only the first one")
-            else:
-                self.console.print("⚠️ LLM returned empty task array")
+            if not isinstance(task_data, dict) or 'name' not in task_data:
+                self.console.print("⚠️ Invalid task format returned by LLM")
                 return None
+            task = Task(**{"id": next_task_id, **task_data})
+        elif task is None:
+            # Only return None if explicitly null AND we have enough tasks
+            if context.total_tasks_completed >= 5:
+                return None
+            self.console.print("⚠️ LLM returned null but project needs more tasks. Regenerating...")
+            return self._force_generate_next_task(context, breakdown, estimated_total, in_flight)
         
-        # Validate required fields
-        if not isinstance(task_data, dict) or 'name' not in task_data:
-            self.console.print("⚠️ Invalid task format returned by LLM")
-            return None
-        
-        task = Task(**task_data)
-        task.id = f"T{len(context.execution_history) + 1:03d}"
+        task.id = next_task_id
         
         # Check for task repetition
-        for prev_task in context.execution_history:
-            if task.name.lower().strip() == prev_task.task_name.lower().strip():
+        previous_names = [prev_task.task_name for prev_task in context.execution_history] + [t.name for t in in_flight or []]
+        for prev_name in previous_names:
+            if task.name.lower().strip() == prev_name.lower().strip():
                 self.console.print(f"⚠️ Task '{task.name}' appears to be a repeat. Skipping.")
                 return None
         
         return task
     
-    def regenerate_task_with_feedback(self, context: ProjectContext, breakdown: ProjectBreakdown, feedback: str) -> Optional[Task]:
+    def regenerate_task_with_feedback(self, context: ProjectContext, breakdown: ProjectBreakdown, feedback: str, in_flight: Optional[List[Task]] = None) -> Optional[Task]:
         """Regenerate task incorporating introspection feedback"""
         context_prompt = self._build_context_prompt(context)
         execution_context = self._get_execution_context(context)
+        in_flight_prompt = self._build_in_flight_prompt(in_flight)
         
         prompt = f"""
 CRITICAL: The previously generated task was rejected. Generate a BETTER task incorporating the feedback.
@@ -229,47 +229,38 @@ Key Deliverables: {', '.join(breakdown.key_deliverables)}
 
 {context_prompt}
 
+{in_flight_prompt}
+
 Generate ONE improved task that addresses the validation feedback. Ensure it's unique and not a repeat.
 
 RESPOND WITH SINGLE TASK OBJECT OR NULL:
 """
         
         try:
-            agent_response = self.agent.run(prompt)
-            response = agent_response.get("content", "") if isinstance(agent_response, dict) else str(agent_response)
-            
-            if response.strip().lower() == "null":
-                return None
-                
-            task_data = json.loads(response.strip())
-            
-        except json.JSONDecodeError:
-            task_data = self._extract_task_from_text(response.strip(), context)
-            if not task_data:
-                raise ValueError("Failed to parse JSON and extract task fields. Please provide valid JSON format with required fields: id, name, description, actions.")
-            
-            if isinstance(task_data, list) and len(task_data) > 0:
-                task_data = task_data[0]
-            elif isinstance(task_data, list):
-                return None
-                
-            if not isinstance(task_data, dict) or 'name' not in task_data:
+            try:
+                task, _ = complete_json(self.agent, prompt, schema=Optional[Task])
+            except JsonExtractionError as e:
+                task_data = self._extract_task_from_text(e.content.strip(), context)
+                if not task_data:
+                    raise ValueError("Failed to parse JSON and extract task fields. Please provide valid JSON format with required fields: id, name, description, actions.")
+                if not isinstance(task_data, dict) or 'name' not in task_data:
+                    return None
+                task = Task(**task_data)
+            if task is None:
                 return None
-                
-            task = Task(**task_data)
-            task.id = f"T{len(context.execution_history) + 1:03d}"
             
+            task.id = self._next_task_id(context, in_flight)
             return task
             
         except Exception as e:
             self.console.print(f"❌ Task regeneration failed: {e}")
             return None
     
-    def _force_generate_next_task(self, context: ProjectContext, breakdown: ProjectBreakdown, estimated_total: int) -> Optional[Task]:
+    def _force_generate_next_task(self, context: ProjectContext, breakdown: ProjectBreakdown, estimated_total: int, in_flight: Optional[List[Task]] = None) -> Optional[Task]:
         """Force generation of next task when LLM returns null prematurely"""
         
         completed_count = len(context.execution_history)
-        next_task_id = f"T{completed_count + 1:03d}"
+        next_task_id = self._next_task_id(context, in_flight)
         
         # Determine what type of task is needed based on progress
         if completed_count < 3:
@@ -293,7 +284,7 @@ EXAMPLES: {', '.join(example_tasks)}
 PROJECT CONTEXT:
 - Original Request: {context.original_request}
 - Project Summary: {breakdown.project_summary}
-- Completed Tasks: {[t.task_name for t in context.execution_history]}
+- Recent Tasks: {self.memory.task_names(context)}
 
 Generate a {task_type} task that is essential for completing the web scraping framework.
 
@@ -323,18 +314,9 @@ RESPOND WITH TASK OBJECT:
 """
         
         try:
-            response = self.agent.run(prompt).get("content", "")
-            
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                task_data = json.loads(json_match.group())
-            else:
-                task_data = json.loads(response.strip())
-            
-            if isinstance(task_data, dict) and 'name' in task_data:
-                task = Task(**task_data)
-                task.id = next_task_id
-                return task
+            task, _ = complete_json(self.agent, prompt, schema=Task)
+            task.id = next_task_id
+            return task
                 
         except Exception as e:
             self.console.print(f"❌ Force task generation failed: {e}")
@@ -342,29 +324,8 @@ RESPOND WITH TASK OBJECT:
         return None
     
     def _build_context_prompt(self, context: ProjectContext) -> str:
-        """Build comprehensive context from execution history"""
-        if not context.execution_history:
-            return "PREVIOUS CONTEXT: This is the first task."
-        
-        context_parts = ["EXECUTION HISTORY:"]
-        
-        for i, task_result in enumerate(context.execution_history, 1):
-            status_emoji = "✅" if task_result.status == "success" else "❌"
-            context_parts.append(f"{i}. {task_result.task_name} (ID: {task_result.task_id}) - {status_emoji} {task_result.status}")
-            context_parts.append(f"   Description: {task_result.task_name}")
-            if task_result.artifacts_created:
-                if len(task_result.artifacts_created) <= 3:
-                    context_parts.append(f"   Artifacts: {', '.join(task_result.artifacts_created)}")
-                else:
-                    shown = ', '.join(task_result.artifacts_created[:3])
-                    remaining = len(task_result.artifacts_created) - 3
-                    context_parts.append(f"   Artifacts: {shown} ... (+{remaining} more)")
-        
-        context_parts.append(f"\nTOTAL ARTIFACTS: {len(context.current_artifacts)}")
-        context_parts.append(f"PROJECT STATUS: {context.project_status}")
-        context_parts.append(f"PROGRESS: {context.total_tasks_completed}/{len(context.execution_history)} tasks completed")
-        
-        return "\n".join(context_parts)
+        """Build bounded context from the rolling project memory"""
+        return self.memory.render(context)
     
     def _get_execution_context(self, context: ProjectContext) -> str:
         """Generate minimal context for next task generation"""
@@ -379,12 +340,10 @@ RESPOND WITH TASK OBJECT:
     def _extract_task_from_text(self, text: str, context: ProjectContext) -> Optional[dict]:
         """Extract task fields from malformed JSON/text as fallback"""
         
-        json_match = re.search(r'\{.*\}', text, re.DOTALL)
-        if json_match:
-            try:
-                return json.loads(json_match.group())
-            except:
-                pass
+        try:
+            return extract_json(text, root="{")
+        except JsonExtractionError:
+            pass
         
         task_data = {}
         
@@ -0,0 +1,315 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/buddy/frontend/benchmark.ipynb.
+
+# %% auto 0
+__all__ = ['REGRESSION_FLOORS', 'BenchmarkTask', 'load_task', 'load_tasks', 'run_task', 'BenchmarkRunner', 'compare',
+           'print_results', 'main']
+
+# %% ../nbs/buddy/frontend/benchmark.ipynb 1
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import argparse
+import resource
+import tempfile
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from dataclasses import dataclass, asdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from .core.metrics import get_metrics
+
+
+# %% ../nbs/buddy/frontend/benchmark.ipynb 2
+@dataclass
+class BenchmarkTask:
+    id: str  # "02/task-006": numbers repeat across categories, so the category's number is part of it
+    category: str  # "01-project-analysis"
+    title: str
+    complexity: str
+    path: str
+
+    @property
+    def prompt(self) -> str:
+        return Path(self.path).read_text()
+
+
+def load_task(path: Path) -> BenchmarkTask:
+    """A task file: id from its category and file name, title from its heading, complexity from "Complexity: ..." """
+    text = path.read_text()
+    title = re.search(r"^#\s+(.+)$", text, re.M)
+    complexity = re.search(r"Complexity:\s*\**\s*(\w+)", text)
+    task_id = f"{path.parent.name.split('-')[0]}/{'-'.join(path.stem.split('-')[:2])}"
+    return BenchmarkTask(task_id, path.parent.name,
+                         title.group(1).strip() if title else path.stem,
+                         complexity.group(1) if complexity else "", str(path.resolve()))
+
+
+def load_tasks(root: str = "benchmark", categories: Optional[List[str]] = None, ids: Optional[List[str]] = None,
+               limit: Optional[int] = None) -> List[BenchmarkTask]:
+    """Task files under `root`/<category>/task-NNN-*.md, in suite order"""
+    tasks = []
+    for path in sorted(Path(root).glob("*/task-*.md")):
+        task = load_task(path)
+        if categories and not any(task.category.startswith(c) for c in categories):
+            continue
+        if ids and not {task.id, task.id.split("/")[1], path.stem} & set(ids):
+            continue
+        tasks.append(task)
+    return tasks[:limit] if limit else tasks
+
+
+# Metrics compared against the baseline, with the smallest change that counts as a regression
+REGRESSION_FLOORS = {"wall_seconds": 0.5, "llm_calls": 1, "prompt_tokens": 200, "completion_tokens": 100,
+                     "tool_calls": 1, "tool_seconds": 0.5, "llm_retries": 1, "peak_rss_mb": 20.0}
+
+
+# %% ../nbs/buddy/frontend/benchmark.ipynb 3
+def run_task(task: BenchmarkTask, mode: str = "client") -> Dict[str, Any]:
+    """Run one task in this process and measure it; the metrics are process-wide, so one task per process"""
+    metrics = get_metrics()
+    metrics.reset()
+    started = time.perf_counter()
+    success, error = False, None
+    try:
+        if mode == "planner":
+            from agentic.agent.planner.executor import DynamicTaskExecutor
+            context = DynamicTaskExecutor().execute(task.prompt)
+            # The executor reports success even when it generated no task
+            success = context.total_tasks_completed > 0 and context.project_status != "failed"
+        else:
+            from agentic.client import BuddyClient
+            result = BuddyClient().process_request(task.prompt)
+            success, error = result.get("success", False), result.get("error")
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    counters = metrics.snapshot()
+    return {
+        "id": task.id, "category": task.category, "title": task.title, "complexity": task.complexity,
+        "success": bool(success), "error": error,
+        "wall_seconds": round(time.perf_counter() - started, 3),
+        "llm_calls": counters.get("llm_calls", 0),
+        "llm_errors": counters.get("llm_errors", 0),
+        "llm_retries": counters.get("llm_retries", 0),
+        "llm_hedges": counters.get("llm_hedges", 0),
+        "llm_cache_hits": counters.get("llm_cache_hits", 0),
+        "prompt_tokens": counters.get("prompt_tokens", 0),
+        "completion_tokens": counters.get("completion_tokens", 0),
+        "tool_calls": counters.get("tool_calls", 0),
+        "tool_errors": counters.get("tool_errors", 0),
+        "tool_seconds": round(counters.get("tool_calls_seconds", 0.0), 3),
+        # ru_maxrss is in KiB on Linux
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def _worker(args: argparse.Namespace):
+    """Child process: point the config at the backend, run one task, write result.json in the sandbox"""
+    from agentic.configs.manager import get_config_manager
+    sandbox = Path.cwd()  # The planner changes into its project folder
+    config = get_config_manager().config
+    if not args.cache:
+        config.response_cache.mode = "off"  # Measure the work, not earlier runs' answers
+    server = None
+    if args.mock:
+        from agentic.llms.mock_server import MockLLMServer, load_script
+        server = MockLLMServer(load_script(args.mock_script) if args.mock_script else None,
+                               ttft=args.ttft, tokens_per_second=args.tps).run_in_thread()
+        config.model.url, config.model.name, config.model.api_key = server.base_url, server.model, "mock"
+        config.endpoints.urls = []
+    result = run_task(load_task(Path(args.worker)), args.mode)
+    if server is not None:
+        server.stop()
+    (sandbox / "result.json").write_text(json.dumps(result))
+
+
+class BenchmarkRunner:
+    """Runs benchmark tasks, each in its own process and scratch directory.
+
+    A task runs as `python -m agentic.benchmark --worker <task.md>` with a
+    fresh temporary directory as working directory, so files, execution
+    caches and peak RSS do not leak between tasks and `parallel` tasks can
+    run side by side. Against the mock backend every worker starts its own
+    MockLLMServer; otherwise workers use the configured model server.
+    """
+
+    def __init__(self, mode: str = "client", mock: bool = False, mock_script: Optional[str] = None,
+                 ttft: float = 0.05, tps: float = 200.0, parallel: int = 1, timeout: float = 900.0,
+                 cache: bool = False, keep: bool = False, console: Optional[Console] = None):
+        self.mode = mode
+        self.mock = mock
+        self.mock_script = os.path.abspath(mock_script) if mock_script else None
+        self.ttft = ttft
+        self.tps = tps
+        self.parallel = max(1, parallel)
+        self.timeout = timeout
+        self.cache = cache
+        self.keep = keep
+        self.console = console or Console()
+
+    def _command(self, task: BenchmarkTask) -> List[str]:
+        command = [sys.executable, "-m", "agentic.benchmark", "--worker", task.path, "--mode", self.mode,
+                   "--ttft", str(self.ttft), "--tps", str(self.tps)]
+        if self.mock:
+            command.append("--mock")
+        if self.mock_script:
+            command += ["--mock-script", self.mock_script]
+        if self.cache:
+            command.append("--cache")
+        return command
+
+    def run_one(self, task: BenchmarkTask) -> Dict[str, Any]:
+        sandbox = tempfile.mkdtemp(prefix=f"benchmark-{task.id.replace('/', '-')}-")
+        env = dict(os.environ)
+        # The package may not be installed; the worker imports it from this checkout
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(Path(__file__).resolve().parents[1]), env.get("PYTHONPATH")]))
+        started = time.perf_counter()
+        try:
+            with open(os.path.join(sandbox, "output.log"), "w") as log:
+                process = subprocess.run(self._command(task), cwd=sandbox, env=env, stdout=log,
+                                         stderr=subprocess.STDOUT, stdin=subprocess.DEVNULL, timeout=self.timeout)
+            result_file = Path(sandbox) / "result.json"
+            if result_file.exists():
+                result = json.loads(result_file.read_text())
+            else:
+                result = {**asdict(task), "success": False, "error": f"worker exited with {process.returncode}"}
+        except subprocess.TimeoutExpired:
+            result = {**asdict(task), "success": False, "error": f"timed out after {self.timeout:g}s"}
+        result.pop("path", None)
+        result["process_seconds"] = round(time.perf_counter() - started, 3)
+        if self.keep:
+            result["sandbox"] = sandbox
+        else:
+            shutil.rmtree(sandbox, ignore_errors=True)
+        status = "✅" if result.get("success") else "❌"
+        self.console.print(f"{status} {task.id} {task.title} ({result['process_seconds']:.1f}s)")
+        return result
+
+    def run(self, tasks: List[BenchmarkTask]) -> Dict[str, Any]:
+        """Run the tasks; returns the results document"""
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.parallel) as pool:
+            results = list(pool.map(self.run_one, tasks))
+        totals = {name: round(sum(r.get(name, 0) for r in results), 3)
+                  for name in ("wall_seconds", "llm_calls", "llm_retries", "prompt_tokens", "completion_tokens",
+                               "tool_calls", "tool_seconds")}
+        return {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "mode": self.mode,
+            "backend": "mock" if self.mock else "configured",
+            "parallel": self.parallel,
+            "elapsed_seconds": round(time.perf_counter() - started, 3),
+            "succeeded": sum(1 for r in results if r.get("success")),
+            "totals": totals,
+            "tasks": results,
+        }
+
+
+# %% ../nbs/buddy/frontend/benchmark.ipynb 4
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float = 0.2) -> List[Dict[str, Any]]:
+    """Regressions against a baseline: tasks that stopped succeeding, and metrics that grew by more
+    than `tolerance` (relative) and their floor in REGRESSION_FLOORS (absolute)"""
+    before = {task["id"]: task for task in baseline.get("tasks", [])}
+    regressions = []
+    for task in results.get("tasks", []):
+        base = before.get(task["id"])
+        if base is None:
+            continue
+        if base.get("success") and not task.get("success"):
+            regressions.append({"id": task["id"], "metric": "success", "baseline": True, "current": False})
+        for metric, floor in REGRESSION_FLOORS.items():
+            old, new = base.get(metric), task.get(metric)
+            if old is None or new is None:
+                continue
+            if new - old > max(floor, old * tolerance):
+                regressions.append({"id": task["id"], "metric": metric, "baseline": old, "current": new,
+                                    "change": f"+{(new - old) / old:.0%}" if old else "new"})
+    return regressions
+
+
+def print_results(results: Dict[str, Any], regressions: Optional[List[Dict[str, Any]]] = None,
+                  console: Optional[Console] = None):
+    console = console or Console()
+    table = Table(title=f"Benchmark ({results['mode']}, {results['backend']} backend)")
+    for column in ("Task", "OK", "Wall s", "LLM calls", "Prompt tok", "Compl tok", "Tools", "Tool s", "Retries", "RSS MB"):
+        table.add_column(column, justify="left" if column == "Task" else "right")
+    for r in results["tasks"]:
+        table.add_row(r["id"], "✅" if r.get("success") else "❌", *(str(r.get(name, "-")) for name in (
+            "wall_seconds", "llm_calls", "prompt_tokens", "completion_tokens", "tool_calls", "tool_seconds",
+            "llm_retries", "peak_rss_mb")))
+    console.print(table)
+    console.print(f"{results['succeeded']}/{len(results['tasks'])} succeeded in {results['elapsed_seconds']:.1f}s; "
+                  f"totals: {results['totals']}")
+    if regressions:
+        console.print(f"[red]❌ {len(regressions)} regression(s) against the baseline:[/red]")
+        for regression in regressions:
+            console.print(f"  {regression['id']} {regression['metric']}: {regression['baseline']} → "
+                          f"{regression['current']} {regression.get('change', '')}")
+    elif regressions is not None:
+        console.print("[green]✅ No regressions against the baseline[/green]")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point; exits 1 when the run regressed against the baseline"""
+    parser = argparse.ArgumentParser(description="Run the benchmark/ task suite and record per-task metrics")
+    parser.add_argument("--root", default="benchmark", help="Directory with the task categories")
+    parser.add_argument("--category", action="append", help="Category prefix, e.g. 01 or 02-bug-fixing (repeatable)")
+    parser.add_argument("--task", action="append", help="Task id, e.g. 02/task-006 or task-006 (repeatable)")
+    parser.add_argument("--limit", type=int)
+    parser.add_argument("--mode", choices=["client", "planner"], default="client",
+                        help="client: BuddyClient.process_request; planner: DynamicTaskExecutor")
+    parser.add_argument("--mock", action="store_true", help="Use a local mock model server instead of [model]")
+    parser.add_argument("--mock-script", help="JSON list of scripted mock responses")
+    parser.add_argument("--ttft", type=float, default=0.05, help="Mock time to first token")
+    parser.add_argument("--tps", type=float, default=200.0, help="Mock tokens per second")
+    parser.add_argument("--parallel", type=int, default=1)
+    parser.add_argument("--timeout", type=float, default=900.0, help="Seconds per task")
+    parser.add_argument("--cache", action="store_true", help="Keep the response cache on")
+    parser.add_argument("--keep", action="store_true", help="Keep task sandboxes")
+    parser.add_argument("--output", help="Results file (default <root>/results/<timestamp>.json)")
+    parser.add_argument("--baseline", help="Baseline to compare against (default <root>/results/baseline.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="Also store the results as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        _worker(args)
+        return 0
+
+    console = Console()
+    tasks = load_tasks(args.root, args.category, args.task, args.limit)
+    if not tasks:
+        console.print(f"[red]No benchmark tasks found under {args.root}[/red]")
+        return 2
+    runner = BenchmarkRunner(args.mode, args.mock, args.mock_script, args.ttft, args.tps, args.parallel,
+                             args.timeout, args.cache, args.keep, console)
+    results = runner.run(tasks)
+
+    results_dir = Path(args.root) / "results"
+    output = Path(args.output or results_dir / f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(results, indent=2))
+    baseline_path = Path(args.baseline or results_dir / "baseline.json")
+    regressions = None
+    if baseline_path.exists():
+        regressions = compare(results, json.loads(baseline_path.read_text()), args.tolerance)
+    print_results(results, regressions, console)
+    console.print(f"Results saved to {output}")
+    if args.save_baseline:
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(results, indent=2))
+        console.print(f"Baseline saved to {baseline_path}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+
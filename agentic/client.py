@@ -15,6 +15,7 @@ from rich.panel import Panel
 from .tools.manager import ToolManager
 from .core.agent import Agent, AgentConfig
 from .configs.loader import get_model_config, get_settings_config, get_tools_config, get_reasoning_config
+from .router import RequestRouter, Route
 
 
 class RequestComplexity(Enum):
@@ -98,6 +99,9 @@ class BuddyClient:
         # Initialize console
         self.console = Console()
         
+        # Local routing tier - obvious requests skip the LLM round-trip
+        self.router = RequestRouter()
+        
         # Settings - force streaming to true
         self.auto_approve = self.settings_config.get('auto_approve', False)
         self.stream = True  # Always enable streaming
@@ -250,6 +254,14 @@ class BuddyClient:
             border_style="blue"
         ))
         
+        route = self.router.route(request)
+        # Local routes skip the agent, so its input guardrails are checked here; blocked requests go to the agent, which refuses them
+        if route.target != "agent" and route.confidence >= self.router.threshold and self.agent.passes_guardrails(request):
+            result = self._dispatch_route(request, route)
+            if result.get("success"):
+                return result
+            self.console.print("[dim]Local route failed, handing the request to the agent[/dim]")
+        
         try:
             # Single step execution - Agent decides routing internally
             result = self.agent.run(
@@ -257,6 +269,7 @@ class BuddyClient:
                 stream=self.stream,
                 max_iterations=5
             )
+            self.router.record(request, self.router.label_from_tool_calls(result.get("tool_calls", [])))
             
             return {
                 "success": True,
@@ -271,6 +284,100 @@ class BuddyClient:
             return {"success": False, "error": error_msg}
     
 
+    def _dispatch_route(self, request: str, route: Route) -> Dict[str, Any]:
+        """Run a locally routed request without an LLM round-trip"""
+        self.console.print(f"[dim]⚡ Routed to {route.target} locally ({route.source}, confidence {route.confidence:.2f})[/dim]")
+        
+        if route.target == "planner":
+            return self._execute_planning_phase(request)
+        if route.target == "debate":
+            return self._execute_debate_phase(request)
+        
+        try:
+            result = self.agent.tool_manager.execute_tool(route.target, route.arguments)
+        except Exception as e:
+            return {"success": False, "error": str(e), "execution_type": "routed"}
+        if not result.get("success", False):
+            return {"success": False, "error": result.get("message") or result.get("error"), "execution_type": "routed"}
+        
+        data = result.get("data")
+        if isinstance(data, dict) and "stdout" in data:
+            output = (data.get("stdout") or "") + (data.get("stderr") or "")
+        elif isinstance(data, list):
+            output = "\n\n".join(f"{item['file']}\n{item['snippet']}" if isinstance(item, dict) and "snippet" in item else str(item) for item in data)
+        else:
+            output = str(data if data is not None else result.get("message", ""))
+        self.console.print(output.rstrip() or "[dim](no output)[/dim]", markup=False, highlight=False)
+        
+        return {
+            "success": True,
+            "result": output,
+            "tool_calls": [{"function": {"name": route.target, "arguments": json.dumps(route.arguments)}, "result": result}],
+            "execution_type": "routed"
+        }
+
+    def show_plugin_report(self):
+        """Display discovered plugin tools with discovery/import timings"""
+        from rich.table import Table
+        
+        report = self.agent.tool_manager.get_plugin_report()
+        if not report:
+            self.console.print("[dim]No tool plugins installed (entry-point group 'agentic.tools')[/dim]")
+            return
+        
+        table = Table(title="🔌 Tool Plugins", header_style="bold magenta")
+        table.add_column("Tool", style="cyan")
+        table.add_column("Distribution", style="bright_white")
+        table.add_column("Metadata", style="yellow")
+        table.add_column("Discovery", justify="right")
+        table.add_column("Import", justify="right")
+        table.add_column("Status")
+        
+        for row in report:
+            import_time = f"{row['import_time'] * 1000:.1f} ms" if row['import_time'] is not None else "[dim]not loaded[/dim]"
+            status = f"[red]{row['error']}[/red]" if row['error'] else ("[green]loaded[/green]" if row['loaded'] else "[dim]lazy[/dim]")
+            table.add_row(
+                row['name'],
+                row['distribution'] or "-",
+                row['metadata_source'],
+                f"{row['discovery_time'] * 1000:.1f} ms",
+                import_time,
+                status
+            )
+        
+        self.console.print(table)
+
+    def manage_decisions(self, args: str = ""):
+        """Show the decision cache, or `clear [topic]` to invalidate entries"""
+        from agentic.agent.decisions import DecisionCache
+        
+        cache = DecisionCache()
+        if args.startswith("clear"):
+            topic = args[len("clear"):].strip() or None
+            removed = cache.invalidate(topic=topic)
+            self.console.print(f"[yellow]🧹 Removed {removed} cached decision(s){f' for {topic!r}' if topic else ''}[/yellow]")
+            return
+        stats = cache.stats()
+        if not stats["enabled"]:
+            self.console.print("[dim]Decision cache disabled ([decision_cache] enabled = false)[/dim]")
+            return
+        self.console.print(f"🗃️ {stats['entries']} cached decisions, {stats['hits']} reuses ({stats['path']})")
+
+    def manage_response_cache(self, args: str = ""):
+        """Show the LLM response cache, or `clear` to empty it"""
+        from agentic.llms.response_cache import get_response_cache
+        
+        cache = get_response_cache()
+        if args.startswith("clear"):
+            self.console.print(f"[yellow]🧹 Removed {cache.clear()} cached response(s)[/yellow]")
+            return
+        stats = cache.stats()
+        if not stats["enabled"]:
+            self.console.print("[dim]Response cache disabled ([response_cache] mode = \"off\")[/dim]")
+            return
+        self.console.print(f"🗃️ {stats['entries']} cached responses ({stats['bytes'] / 1024:.0f} KB, {stats['mode']} mode), "
+                           f"{stats['hits']} reuses ({stats['path']})")
+
     def interactive_session(self):
         """
         Start an interactive chat session with Buddy AI.
@@ -282,6 +389,9 @@ class BuddyClient:
             "[bold yellow]✨ Available Commands:[/bold yellow]\n\n"
             "  [bold red]➤ /quit[/bold red]     [dim]- Exit the session[/dim]\n"
             "  [bold magenta]➤ /clear[/bold magenta]    [dim]- Clear the chat history[/dim]\n"
+            "  [bold cyan]➤ /plugins[/bold cyan]  [dim]- Show plugin tools and their import cost[/dim]\n"
+            "  [bold cyan]➤ /decisions [clear [topic]][/bold cyan]  [dim]- Show or invalidate cached debate decisions[/dim]\n"
+            "  [bold cyan]➤ /cache [clear][/bold cyan]  [dim]- Show or empty the LLM response cache[/dim]\n"
         )
 
         # Center-align the content inside the panel
@@ -309,6 +419,15 @@ class BuddyClient:
                 elif user_input.lower() in ['/clear', 'clear']:
                     self.console.clear()
                     continue
+                elif user_input.lower() == '/plugins':
+                    self.show_plugin_report()
+                    continue
+                elif user_input.lower().startswith('/decisions'):
+                    self.manage_decisions(user_input[len('/decisions'):].strip())
+                    continue
+                elif user_input.lower().startswith('/cache'):
+                    self.manage_response_cache(user_input[len('/cache'):].strip())
+                    continue
                 
                 # Process the request
                 result = self.process_request(user_input)
@@ -1,7 +1,9 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/configs/loader.ipynb.
 
 # %% auto 0
-__all__ = ['get_model_config', 'get_settings_config', 'get_tools_config', 'get_reasoning_config', 'get_system_prompt']
+__all__ = ['get_model_config', 'get_settings_config', 'get_tools_config', 'get_reasoning_config', 'get_planner_config',
+           'get_decision_cache_config', 'get_router_config', 'get_rate_limits_config', 'get_resilience_config',
+           'get_endpoints_config', 'get_response_cache_config', 'get_system_prompt']
 
 # %% ../../nbs/buddy/configs/loader.ipynb 1
 from typing import Dict, Any
@@ -30,8 +32,44 @@ def get_reasoning_config() -> Dict[str, Any]:
     return get_config_manager().get_reasoning_config()
 
 
+def get_planner_config() -> Dict[str, Any]:
+    """Get planner configuration"""
+    return get_config_manager().get_planner_config()
+
+
+def get_decision_cache_config() -> Dict[str, Any]:
+    """Get decision_cache configuration"""
+    return get_config_manager().get_decision_cache_config()
+
+
+def get_router_config() -> Dict[str, Any]:
+    """Get router configuration"""
+    return get_config_manager().get_router_config()
+
+
+def get_rate_limits_config() -> Dict[str, Any]:
+    """Get rate_limits configuration"""
+    return get_config_manager().get_rate_limits_config()
+
+
+def get_resilience_config() -> Dict[str, Any]:
+    """Get resilience configuration"""
+    return get_config_manager().get_resilience_config()
+
+
+def get_endpoints_config() -> Dict[str, Any]:
+    """Get endpoints configuration"""
+    return get_config_manager().get_endpoints_config()
+
+
+def get_response_cache_config() -> Dict[str, Any]:
+    """Get response_cache configuration"""
+    return get_config_manager().get_response_cache_config()
+
+
 def get_system_prompt() -> str:
     """Get system prompt"""
+    from agentic.configs.prompt_manager import get_system_prompt as get_system_prompt_new
     return get_system_prompt_new()
 
 
@@ -1,8 +1,9 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/configs/manager.ipynb.
 
 # %% auto 0
-__all__ = ['ModelConfig', 'SettingsConfig', 'ToolsConfig', 'ReasoningConfig', 'AgenticConfig', 'ConfigManager',
-           'get_config_manager']
+__all__ = ['ModelConfig', 'SettingsConfig', 'ToolsConfig', 'ReasoningConfig', 'PlannerConfig', 'DecisionCacheConfig',
+           'RouterConfig', 'RateLimitsConfig', 'ResilienceConfig', 'EndpointsConfig', 'ResponseCacheConfig',
+           'AgenticConfig', 'ConfigManager', 'get_config_manager']
 
 # %% ../../nbs/buddy/configs/manager.ipynb 1
 import os
@@ -21,6 +22,8 @@ class ModelConfig:
     temperature: float = 0.7
     max_tokens: Optional[int] = None
     timeout: int = 60
+    structured_output: str = "auto"  # "auto", "json_schema" (response_format) or "local" (streaming validator)
+    structured_retries: int = 2
 
 
 @dataclass
@@ -45,6 +48,9 @@ class ToolsConfig:
     require_approval: list = field(default_factory=lambda: [
         "execute_bash", "fs_write", "code_interpreter"
     ])
+    load_plugins: bool = True
+    disabled_plugins: list = field(default_factory=list)
+    selection_top_k: int = 3  # 0 sends every tool schema
 
 
 @dataclass
@@ -57,6 +63,80 @@ class ReasoningConfig:
     max_reasoning_steps: int = 10
 
 
+@dataclass
+class PlannerConfig:
+    """Planner execution configuration"""
+    max_workers: int = 1  # Tasks (and parallel actions) run concurrently
+    speculative_generation: bool = False  # Generate the next task while the current one executes
+    introspection_mode: str = "batched"  # "batched": cheap checks first, one LLM call per batch; "per_step": LLM after every step
+    introspection_batch_size: int = 5  # Steps evaluated per batched LLM call
+
+
+@dataclass
+class DecisionCacheConfig:
+    """Cached debate and framework-selection decisions"""
+    enabled: bool = True  # Reuse verdicts of near-duplicate debates and framework selections
+    path: str = ""  # SQLite file; empty uses ~/.agentic/decisions.sqlite
+    ttl_hours: float = 720.0  # Cached decisions older than this are ignored
+    similarity_threshold: float = 0.8  # Minimum estimated context similarity for a cache hit
+
+
+@dataclass
+class RouterConfig:
+    """Local request routing"""
+    enabled: bool = True  # Dispatch obvious requests locally without an LLM round-trip
+    confidence_threshold: float = 0.75  # Below this the request goes to the LLM agent
+    log_path: str = ""  # Routed requests used to train the classifier; empty uses ~/.agentic/routes.jsonl
+    max_examples: int = 2000  # Most recent logged requests kept for training
+
+
+@dataclass
+class RateLimitsConfig:
+    """Shared request and token budgets"""
+    enabled: bool = True  # Wait for quota before LLM requests and tool calls
+    requests_per_minute: float = 0.0  # Per model, shared by every agent in the process; 0 means unlimited
+    tokens_per_minute: float = 0.0  # Per model, prompt plus completion tokens from usage data; 0 means unlimited
+    tool_calls_per_minute: float = 0.0  # Per tool; 0 means unlimited
+    max_wait_seconds: float = 120.0  # A call that would wait longer fails instead
+    overrides: Dict[str, Dict[str, float]] = field(default_factory=dict)  # "model:<name>", "endpoint:<url>" or "tool:<name>" -> limits
+
+
+@dataclass
+class ResilienceConfig:
+    """Retries, deadlines and hedged requests"""
+    max_attempts: int = 3  # Tries per completion; only timeouts, connection errors, 408/409/429 and 5xx are retried
+    backoff_base_seconds: float = 0.5  # Retry n waits a random time up to base * 2**n
+    backoff_max_seconds: float = 8.0  # Upper bound of one backoff wait
+    deadline_seconds: float = 300.0  # Per completion, across every attempt, until the first token or response
+    hedge: bool = False  # Send a second request to a replica when the first is slow to produce a token
+    hedge_percentile: float = 95.0  # Time-to-first-token percentile after which the hedge is sent
+    hedge_delay_seconds: float = 2.0  # Hedge delay until enough first-token times have been seen
+
+
+@dataclass
+class EndpointsConfig:
+    """Model server replicas"""
+    urls: list = field(default_factory=list)  # Replicas of [model] url serving the same models
+    strategy: str = "least_outstanding"  # Or "ewma": lowest latency * (requests in flight + 1)
+    sticky: bool = True  # Keep each conversation on one replica so its prompt prefix stays cached
+    eject_after_failures: int = 3  # Consecutive failures that take a replica out of rotation
+    eject_seconds: float = 30.0  # How long an ejected replica gets no traffic
+    health_check_seconds: float = 0.0  # Probe ejected replicas' /models this often to readmit them early; 0 disables
+
+
+@dataclass
+class ResponseCacheConfig:
+    """LLM response cache"""
+    mode: str = "exact"  # "exact", "semantic" (also reuse near-identical prompts) or "off"
+    path: str = ""  # SQLite file; empty uses ~/.agentic/responses.sqlite
+    max_entries: int = 5000  # Least recently used responses are evicted beyond this
+    max_mb: float = 200.0  # ... or beyond this much stored response data
+    ttl_hours: float = 24.0  # Cached responses older than this are ignored
+    max_temperature: float = 0.0  # Only requests that set a temperature at most this are cached
+    similarity_threshold: float = 0.95  # Semantic mode: minimum cosine similarity of the prompts
+    embedding_model: str = ""  # Semantic mode: embedding model on the [model] server; empty uses local hashed word vectors
+
+
 @dataclass
 class AgenticConfig:
     """Complete agentic configuration"""
@@ -64,6 +144,13 @@ class AgenticConfig:
     settings: SettingsConfig = field(default_factory=SettingsConfig)
     tools: ToolsConfig = field(default_factory=ToolsConfig)
     reasoning: ReasoningConfig = field(default_factory=ReasoningConfig)
+    planner: PlannerConfig = field(default_factory=PlannerConfig)
+    decision_cache: DecisionCacheConfig = field(default_factory=DecisionCacheConfig)
+    router: RouterConfig = field(default_factory=RouterConfig)
+    rate_limits: RateLimitsConfig = field(default_factory=RateLimitsConfig)
+    resilience: ResilienceConfig = field(default_factory=ResilienceConfig)
+    endpoints: EndpointsConfig = field(default_factory=EndpointsConfig)
+    response_cache: ResponseCacheConfig = field(default_factory=ResponseCacheConfig)
 
 
 class ConfigManager:
@@ -89,7 +176,14 @@ class ConfigManager:
                     model=ModelConfig(**config_data.get('model', {})),
                     settings=SettingsConfig(**config_data.get('settings', {})),
                     tools=ToolsConfig(**config_data.get('tools', {})),
-                    reasoning=ReasoningConfig(**config_data.get('reasoning', {}))
+                    reasoning=ReasoningConfig(**config_data.get('reasoning', {})),
+                    planner=PlannerConfig(**config_data.get('planner', {})),
+                    decision_cache=DecisionCacheConfig(**config_data.get('decision_cache', {})),
+                    router=RouterConfig(**config_data.get('router', {})),
+                    rate_limits=RateLimitsConfig(**config_data.get('rate_limits', {})),
+                    resilience=ResilienceConfig(**config_data.get('resilience', {})),
+                    endpoints=EndpointsConfig(**config_data.get('endpoints', {})),
+                    response_cache=ResponseCacheConfig(**config_data.get('response_cache', {}))
                 )
             else:
                 # Create default config file
@@ -111,7 +205,9 @@ class ConfigManager:
                     'api_key': config.model.api_key,
                     'temperature': config.model.temperature,
                     'max_tokens': config.model.max_tokens,
-                    'timeout': config.model.timeout
+                    'timeout': config.model.timeout,
+                    'structured_output': config.model.structured_output,
+                    'structured_retries': config.model.structured_retries
                 },
                 'settings': {
                     'auto_approve': config.settings.auto_approve,
@@ -123,7 +219,10 @@ class ConfigManager:
                 'tools': {
                     'default_tools': config.tools.default_tools,
                     'dangerous_tools': config.tools.dangerous_tools,
-                    'require_approval': config.tools.require_approval
+                    'require_approval': config.tools.require_approval,
+                    'load_plugins': config.tools.load_plugins,
+                    'disabled_plugins': config.tools.disabled_plugins,
+                    'selection_top_k': config.tools.selection_top_k
                 },
                 'reasoning': {
                     'show_thinking': config.reasoning.show_thinking,
@@ -131,6 +230,59 @@ class ConfigManager:
                     'save_thinking': config.reasoning.save_thinking,
                     'retry_count': config.reasoning.retry_count,
                     'max_reasoning_steps': config.reasoning.max_reasoning_steps
+                },
+                'planner': {
+                    'max_workers': config.planner.max_workers,
+                    'speculative_generation': config.planner.speculative_generation,
+                    'introspection_mode': config.planner.introspection_mode,
+                    'introspection_batch_size': config.planner.introspection_batch_size
+                },
+                'decision_cache': {
+                    'enabled': config.decision_cache.enabled,
+                    'path': config.decision_cache.path,
+                    'ttl_hours': config.decision_cache.ttl_hours,
+                    'similarity_threshold': config.decision_cache.similarity_threshold
+                },
+                'router': {
+                    'enabled': config.router.enabled,
+                    'confidence_threshold': config.router.confidence_threshold,
+                    'log_path': config.router.log_path,
+                    'max_examples': config.router.max_examples
+                },
+                'rate_limits': {
+                    'enabled': config.rate_limits.enabled,
+                    'requests_per_minute': config.rate_limits.requests_per_minute,
+                    'tokens_per_minute': config.rate_limits.tokens_per_minute,
+                    'tool_calls_per_minute': config.rate_limits.tool_calls_per_minute,
+                    'max_wait_seconds': config.rate_limits.max_wait_seconds,
+                    'overrides': config.rate_limits.overrides
+                },
+                'resilience': {
+                    'max_attempts': config.resilience.max_attempts,
+                    'backoff_base_seconds': config.resilience.backoff_base_seconds,
+                    'backoff_max_seconds': config.resilience.backoff_max_seconds,
+                    'deadline_seconds': config.resilience.deadline_seconds,
+                    'hedge': config.resilience.hedge,
+                    'hedge_percentile': config.resilience.hedge_percentile,
+                    'hedge_delay_seconds': config.resilience.hedge_delay_seconds
+                },
+                'endpoints': {
+                    'urls': config.endpoints.urls,
+                    'strategy': config.endpoints.strategy,
+                    'sticky': config.endpoints.sticky,
+                    'eject_after_failures': config.endpoints.eject_after_failures,
+                    'eject_seconds': config.endpoints.eject_seconds,
+                    'health_check_seconds': config.endpoints.health_check_seconds
+                },
+                'response_cache': {
+                    'mode': config.response_cache.mode,
+                    'path': config.response_cache.path,
+                    'max_entries': config.response_cache.max_entries,
+                    'max_mb': config.response_cache.max_mb,
+                    'ttl_hours': config.response_cache.ttl_hours,
+                    'max_temperature': config.response_cache.max_temperature,
+                    'similarity_threshold': config.response_cache.similarity_threshold,
+                    'embedding_model': config.response_cache.embedding_model
                 }
             }
             
@@ -151,7 +303,9 @@ class ConfigManager:
             'api_key': self.config.model.api_key,
             'temperature': self.config.model.temperature,
             'max_tokens': self.config.model.max_tokens,
-            'timeout': self.config.model.timeout
+            'timeout': self.config.model.timeout,
+            'structured_output': self.config.model.structured_output,
+            'structured_retries': self.config.model.structured_retries
         }
     
     def get_settings_config(self) -> Dict[str, Any]:
@@ -169,7 +323,10 @@ class ConfigManager:
         return {
             'default_tools': self.config.tools.default_tools,
             'dangerous_tools': self.config.tools.dangerous_tools,
-            'require_approval': self.config.tools.require_approval
+            'require_approval': self.config.tools.require_approval,
+            'load_plugins': self.config.tools.load_plugins,
+            'disabled_plugins': self.config.tools.disabled_plugins,
+            'selection_top_k': self.config.tools.selection_top_k
         }
     
     def get_reasoning_config(self) -> Dict[str, Any]:
@@ -182,6 +339,80 @@ class ConfigManager:
             'max_reasoning_steps': self.config.reasoning.max_reasoning_steps
         }
     
+    def get_planner_config(self) -> Dict[str, Any]:
+        """Get planner configuration as dict"""
+        return {
+            'max_workers': self.config.planner.max_workers,
+            'speculative_generation': self.config.planner.speculative_generation,
+            'introspection_mode': self.config.planner.introspection_mode,
+            'introspection_batch_size': self.config.planner.introspection_batch_size
+        }
+    
+    def get_decision_cache_config(self) -> Dict[str, Any]:
+        """Get decision_cache configuration as dict"""
+        return {
+            'enabled': self.config.decision_cache.enabled,
+            'path': self.config.decision_cache.path,
+            'ttl_hours': self.config.decision_cache.ttl_hours,
+            'similarity_threshold': self.config.decision_cache.similarity_threshold
+        }
+    
+    def get_router_config(self) -> Dict[str, Any]:
+        """Get router configuration as dict"""
+        return {
+            'enabled': self.config.router.enabled,
+            'confidence_threshold': self.config.router.confidence_threshold,
+            'log_path': self.config.router.log_path,
+            'max_examples': self.config.router.max_examples
+        }
+    
+    def get_rate_limits_config(self) -> Dict[str, Any]:
+        """Get rate_limits configuration as dict"""
+        return {
+            'enabled': self.config.rate_limits.enabled,
+            'requests_per_minute': self.config.rate_limits.requests_per_minute,
+            'tokens_per_minute': self.config.rate_limits.tokens_per_minute,
+            'tool_calls_per_minute': self.config.rate_limits.tool_calls_per_minute,
+            'max_wait_seconds': self.config.rate_limits.max_wait_seconds,
+            'overrides': self.config.rate_limits.overrides
+        }
+    
+    def get_resilience_config(self) -> Dict[str, Any]:
+        """Get resilience configuration as dict"""
+        return {
+            'max_attempts': self.config.resilience.max_attempts,
+            'backoff_base_seconds': self.config.resilience.backoff_base_seconds,
+            'backoff_max_seconds': self.config.resilience.backoff_max_seconds,
+            'deadline_seconds': self.config.resilience.deadline_seconds,
+            'hedge': self.config.resilience.hedge,
+            'hedge_percentile': self.config.resilience.hedge_percentile,
+            'hedge_delay_seconds': self.config.resilience.hedge_delay_seconds
+        }
+    
+    def get_endpoints_config(self) -> Dict[str, Any]:
+        """Get endpoints configuration as dict"""
+        return {
+            'urls': self.config.endpoints.urls,
+            'strategy': self.config.endpoints.strategy,
+            'sticky': self.config.endpoints.sticky,
+            'eject_after_failures': self.config.endpoints.eject_after_failures,
+            'eject_seconds': self.config.endpoints.eject_seconds,
+            'health_check_seconds': self.config.endpoints.health_check_seconds
+        }
+    
+    def get_response_cache_config(self) -> Dict[str, Any]:
+        """Get response_cache configuration as dict"""
+        return {
+            'mode': self.config.response_cache.mode,
+            'path': self.config.response_cache.path,
+            'max_entries': self.config.response_cache.max_entries,
+            'max_mb': self.config.response_cache.max_mb,
+            'ttl_hours': self.config.response_cache.ttl_hours,
+            'max_temperature': self.config.response_cache.max_temperature,
+            'similarity_threshold': self.config.response_cache.similarity_threshold,
+            'embedding_model': self.config.response_cache.embedding_model
+        }
+    
     def update_config(self, section: str, updates: Dict[str, Any]):
         """Update configuration section"""
         if section == 'model':
@@ -200,6 +431,34 @@ class ConfigManager:
             for key, value in updates.items():
                 if hasattr(self.config.reasoning, key):
                     setattr(self.config.reasoning, key, value)
+        elif section == 'planner':
+            for key, value in updates.items():
+                if hasattr(self.config.planner, key):
+                    setattr(self.config.planner, key, value)
+        elif section == 'decision_cache':
+            for key, value in updates.items():
+                if hasattr(self.config.decision_cache, key):
+                    setattr(self.config.decision_cache, key, value)
+        elif section == 'router':
+            for key, value in updates.items():
+                if hasattr(self.config.router, key):
+                    setattr(self.config.router, key, value)
+        elif section == 'rate_limits':
+            for key, value in updates.items():
+                if hasattr(self.config.rate_limits, key):
+                    setattr(self.config.rate_limits, key, value)
+        elif section == 'resilience':
+            for key, value in updates.items():
+                if hasattr(self.config.resilience, key):
+                    setattr(self.config.resilience, key, value)
+        elif section == 'endpoints':
+            for key, value in updates.items():
+                if hasattr(self.config.endpoints, key):
+                    setattr(self.config.endpoints, key, value)
+        elif section == 'response_cache':
+            for key, value in updates.items():
+                if hasattr(self.config.response_cache, key):
+                    setattr(self.config.response_cache, key, value)
         
         # Save updated config
         self._save_config(self.config)
@@ -9,6 +9,8 @@ from pathlib import Path
 import json
 import platform
 
+from ..llms.prompt_layout import PromptLayout
+
 # %% ../../nbs/buddy/configs/prompts_manager.ipynb 2
 class PromptsManager:
     """Enhanced prompts management system"""
@@ -52,10 +54,10 @@ class PromptsManager:
     
     def _get_default_system_prompt(self) -> str:
         """Get the default system prompt"""
-        system_context = get_system_context()
+        system_context = self.get_system_context()
         project_types = [k.replace('_project', '') for k, v in system_context['project_context'].items() if v]
         project_context_str = f"Detected: {', '.join(project_types)}" if project_types else "Generic project"
-        return f"""You are Buddy, an autonomous AI assistant for software development, running under the `buddy chat` CLI command.
+        instructions = """You are Buddy, an autonomous AI assistant for software development, running under the `buddy chat` CLI command.
 
         ## Role & Goal
         - Deliver correct, efficient, and safe solutions for software development tasks.
@@ -99,13 +101,17 @@ class PromptsManager:
         - Keep responses terminal-friendly and compatible with `rich` rendering.
         - Justify routing choices (e.g., direct execution vs. planning).
         - Summarize plans with ✅/❌ markers before execution.
-        
-        ## System Context
+        """
+        # Environment details go last so the instructions stay a cacheable prefix
+        return PromptLayout().static(instructions).context(f"""## System Context
         - **OS:** {system_context['os']} {system_context['architecture']}
         - **Python:** {system_context['python_version']}
         - **Directory:** {system_context['current_directory']}
-        - **Project:** {project_context_str}
-        """
+        - **Project:** {project_context_str}""").render()
+
+    def get_system_prompt(self) -> str:
+        """Custom system prompt if one was set, otherwise the default"""
+        return self.custom_prompts.get("system") or self.prompts["system"]
 
 
 # %% ../../nbs/buddy/configs/prompts_manager.ipynb 3
@@ -5,11 +5,14 @@ __all__ = ['logger', 'Message', 'AgentConfig', 'Agent']
 
 # %% ../../nbs/buddy/backend/core/agent.ipynb 1
 from typing import List, Dict, Any, Optional, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 import json
+import uuid
 from ..llms.client import LLMClient
-from ..configs.loader import get_model_config
+from ..llms.json_extractor import JsonExtractionError
+from ..configs.loader import get_model_config, get_tools_config
 from ..tools.manager import ToolManager
+from .guardrails import GuardrailManager
 import logging
 
 logging.basicConfig(level=logging.INFO)
@@ -35,7 +38,7 @@ class AgentConfig:
 class Agent:
     """Core Agent class with tool execution and conversation management"""
 
-    def __init__(self, config: AgentConfig, llm_client: Optional[LLMClient] = None):
+    def __init__(self, config: AgentConfig, llm_client: Optional[LLMClient] = None, tool_manager: Optional[ToolManager] = None):
         self.config = config
         self.system_prompt = config.instructions
         self.llm_client = llm_client or self._create_default_llm_client()
@@ -43,7 +46,13 @@ class Agent:
         self.conversation_history: List[Message] = [Message(role="system", content=self.system_prompt)]
         self.tools_registry: Dict[str, Callable] = {}
         self.guardrails: List[Callable] = []
-        self.tool_manager = ToolManager()
+        self.output_guardrails: Optional[GuardrailManager] = None
+        self.tool_manager = tool_manager or ToolManager()
+        self.tool_top_k = get_tools_config().get('selection_top_k', 0)
+        self._tool_query = ""
+        self._offered_tools: Optional[set] = None  # Tools selected for the current request; None means the full catalog
+        # Keeps this conversation on one model replica, whose prefix cache holds its history
+        self.session_id = f"{config.name}-{uuid.uuid4().hex[:8]}"
 
     def _create_default_llm_client(self) -> LLMClient:
         """Create default LLM client from config."""
@@ -67,13 +76,93 @@ class Agent:
         """Add a guardrail function."""
         self.guardrails.append(guardrail_func)
 
-    def run(self, message: str, **kwargs) -> Dict[str, Any]:
-        """Execute agent with message and return response."""
-        # Apply guardrails
+    def passes_guardrails(self, message: str) -> bool:
+        """Whether every input guardrail accepts the message"""
         for guardrail in self.guardrails:
             result = guardrail(message)
             if not isinstance(result, bool) or not result:
-                return {"content": "Request blocked by guardrails", "blocked": True}
+                return False
+        return True
+
+    def set_output_guardrails(self, manager: Optional[GuardrailManager]) -> None:
+        """Filter streamed answers through a GuardrailManager's pattern rules (None turns it off)."""
+        self.output_guardrails = manager
+
+    def _output_filter(self):
+        return self.output_guardrails.stream_output() if self.output_guardrails else None
+
+    def _filter_output(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Non-streamed counterpart of _output_filter: redact the complete answer"""
+        if self.output_guardrails and result.get("content"):
+            result["content"] = self.output_guardrails.evaluate_output(result["content"])["modified_content"]
+        return result
+
+    def fork(self, name: Optional[str] = None, instructions: Optional[str] = None, own_client: bool = False) -> "Agent":
+        """New agent with an empty history, sharing this agent's LLM client, tools and guardrails.
+        With `own_client` it gets a clone of the client instead, for running on another thread."""
+        config = replace(
+            self.config,
+            name=name or self.config.name,
+            instructions=self.config.instructions if instructions is None else instructions,
+            tools=list(self.config.tools)
+        )
+        llm_client = self.llm_client.clone() if own_client else self.llm_client
+        forked = Agent(config, llm_client=llm_client, tool_manager=self.tool_manager)
+        forked.tools_registry = dict(self.tools_registry)
+        forked.guardrails = list(self.guardrails)
+        forked.output_guardrails = self.output_guardrails
+        return forked
+
+    def complete(self, message: str, system_prompt: Optional[str] = None, **kwargs) -> Dict[str, Any]:
+        """One-shot completion: system prompt plus message, no tools, nothing kept in history.
+
+        With `response_model` (a pydantic model or type) the answer is requested
+        as structured output and returned validated under "parsed".
+        """
+        if not self.passes_guardrails(message):
+            return {"content": "Request blocked by guardrails", "blocked": True}
+
+        system_prompt = self.system_prompt if system_prompt is None else system_prompt
+        messages = [{"role": "system", "content": system_prompt}] if system_prompt else []
+        messages.append({"role": "user", "content": message})
+
+        stream = kwargs.get('stream', True)
+        stop_when = kwargs.get('stop_when')
+        response_model = kwargs.get('response_model')
+        console = kwargs.get('console')
+        llm_kwargs = {k: v for k, v in kwargs.items() if k not in ['max_iterations', 'stop_when', 'response_model', 'console']}
+        llm_kwargs['stream'] = stream
+        llm_kwargs.setdefault('session', self.session_id)
+
+        if response_model is not None:
+            try:
+                result = self.llm_client.create_structured_completion(messages, response_model, **llm_kwargs)
+            except JsonExtractionError as e:
+                return {"content": e.content, "tool_calls": [], "blocked": False, "parsed": None, "error": str(e)}
+            except Exception as e:
+                logger.error(f"Structured completion failed: {str(e)}")
+                return {"content": f"Error: {str(e)}", "blocked": True}
+            return {"content": result.get("content", ""), "tool_calls": [], "blocked": False,
+                    "parsed": result.get("parsed"), "usage": result.get("usage")}
+
+        try:
+            response = self.llm_client.create_completion(messages=messages, **llm_kwargs)
+            if stream:
+                result = self.llm_client.handle_streaming_response(response, console, stop_when=stop_when,
+                                                                   output_filter=self._output_filter())
+            else:
+                result = self._filter_output(self.llm_client.process_response(response))
+        except Exception as e:
+            logger.error(f"One-shot completion failed: {str(e)}")
+            return {"content": f"Error: {str(e)}", "blocked": True}
+
+        return {"content": result.get("content", ""), "tool_calls": [], "blocked": False, "usage": result.get("usage")}
+
+    def run(self, message: str, **kwargs) -> Dict[str, Any]:
+        """Execute agent with message and return response."""
+        # Apply guardrails
+        if not self.passes_guardrails(message):
+            return {"content": "Request blocked by guardrails", "blocked": True}
 
         # Add user message
         self.conversation_history.append(Message(role="user", content=message))
@@ -85,8 +174,8 @@ class Agent:
         tool_calls = result.get("tool_calls", [])
         finish_reason = result.get("finish_reason")
         
-        # 1. Explicit completion signals
-        if finish_reason in ["stop", "length", "content_filter"]:
+        # 1. Explicit completion signals; a stream halted by a guardrail or stop_when ends the turn too
+        if finish_reason in ["stop", "length", "content_filter", "guardrail", "stop_when"]:
             return True
             
         # 2. Tool calls present - continue to execute them
@@ -120,18 +209,19 @@ class Agent:
     def run(self, message: str, **kwargs) -> Dict[str, Any]:
         """Execute agent with message and return response."""
         # Apply guardrails
-        for guardrail in self.guardrails:
-            result = guardrail(message)
-            if not isinstance(result, bool) or not result:
-                return {"content": "Request blocked by guardrails", "blocked": True}
+        if not self.passes_guardrails(message):
+            return {"content": "Request blocked by guardrails", "blocked": True}
 
         # Add user message
         self.conversation_history.append(Message(role="user", content=message))
+        self._tool_query = message
+        self._offered_tools = set() if self.tool_top_k and not self.config.tools else None
 
         # Initialize result and failed attempts tracking
         final_result = {"content": "", "tool_calls": [], "blocked": False}
         iteration_count = 0
         failed_attempts = []  # Track failed tool calls: [(function_name, args, error), ...]
+        executed_calls = []  # Every tool call run for this message, with its result
 
 
         while True:
@@ -149,6 +239,7 @@ class Agent:
             llm_kwargs = {k: v for k, v in kwargs.items() 
                          if k not in ['max_iterations']}
             llm_kwargs['stream'] = stream  
+            llm_kwargs.setdefault('session', self.session_id)
             
             try:
                 response = self.llm_client.create_completion(
@@ -165,13 +256,13 @@ class Agent:
                 if not hasattr(response, '__iter__'):
                     raise ValueError("Streaming response expected but non-iterable response received")
                 try:
-                    result = self.llm_client.handle_streaming_response(response)
+                    result = self.llm_client.handle_streaming_response(response, output_filter=self._output_filter())
                 except Exception as e:
                     logger.error(f"Error processing streaming response: {str(e)}")
                     return {"content": f"Streaming error: {str(e)}", "blocked": True}
             else:
                 try:
-                    result = self.llm_client.process_response(response)
+                    result = self._filter_output(self.llm_client.process_response(response))
                 except Exception as e:
                     logger.error(f"Error processing response: {str(e)}")
                     return {"content": f"Response error: {str(e)}", "blocked": True}
@@ -194,8 +285,8 @@ class Agent:
             # Handle tool calls if present
             if result.get("tool_calls"):
                 logger.debug(f"Executing {len(result['tool_calls'])} tool calls")
-                executed_calls = self._execute_tool_calls(result["tool_calls"], failed_attempts)
-                final_result["tool_calls"] = executed_calls
+                executed_calls += self._execute_tool_calls(result["tool_calls"], failed_attempts)
+                final_result["tool_calls"] = list(executed_calls)
                 continue  # Continue loop to process tool results
                 
         # Optional : Clean tool call details from the history
@@ -217,6 +308,11 @@ class Agent:
             function_name = tool_call["function"]["name"]
             tool_call_id = tool_call.get("id")
             raw_arguments = tool_call["function"]["arguments"]
+
+            if self._offered_tools is not None and function_name not in self._offered_tools:
+                # The model wants a tool we didn't send - offer the full catalog for the rest of this request
+                logger.debug(f"Tool '{function_name}' was not in the selected subset, sending all tools")
+                self._offered_tools = None
             
             try:
                 arguments = json.loads(raw_arguments)
@@ -289,6 +385,12 @@ class Agent:
         """Get OpenAI-formatted tools for the configured tool names."""
         if self.config.tools:
             return self.tool_manager.get_tools(self.config.tools)
+        if self.tool_top_k and self._offered_tools is not None:
+            # Send only the tools relevant to the current request, sorted by name so that requests
+            # selecting the same tools share the prompt prefix the server has cached
+            selected = self.tool_manager.select_tools(self._tool_query, self.tool_top_k)
+            self._offered_tools.update(selected)
+            return self.tool_manager.get_tools(sorted(self._offered_tools))
         return self.tool_manager.get_tools()
 
     def _format_messages_for_llm(self) -> List[Dict]:
@@ -1,17 +1,24 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/backend/core/guardrails.ipynb.
 
 # %% auto 0
-__all__ = ['GuardrailType', 'GuardrailAction', 'GuardrailResult', 'Guardrail', 'ContentSafetyGuardrail',
-           'ToolRestrictionGuardrail', 'InputValidationGuardrail', 'OutputFilteringGuardrail', 'RateLimitingGuardrail',
-           'GuardrailManager', 'create_default_guardrails']
+__all__ = ['GuardrailType', 'GuardrailAction', 'PatternRule', 'RuleHit', 'PatternScanner', 'redact', 'StreamingOutputFilter',
+           'GuardrailResult', 'Guardrail', 'ContentSafetyGuardrail', 'ToolRestrictionGuardrail',
+           'InputValidationGuardrail', 'OutputFilteringGuardrail', 'RateLimitingGuardrail', 'GuardrailManager',
+           'create_default_guardrails']
 
 # %% ../../nbs/buddy/backend/core/guardrails.ipynb 1
-from typing import Dict, Any, List, Optional, Callable, Union
+from typing import Dict, Any, List, Optional, Callable, Union, Tuple
 from dataclasses import dataclass
 from enum import Enum
 import re
+try:
+    from re import _parser as sre_parse  # Private; only used to speed up scans
+except ImportError:
+    sre_parse = None
 import json
 
+from ..llms.rate_limiter import TokenBucket
+
 
 class GuardrailType(Enum):
     INPUT_VALIDATION = "input_validation"
@@ -28,6 +35,235 @@ class GuardrailAction(Enum):
     WARN = "warn"
 
 
+@dataclass(frozen=True)
+class PatternRule:
+    """One block/warn/redact pattern; MODIFY rules are redacted"""
+    name: str
+    pattern: str
+    action: GuardrailAction
+    guardrail: str
+    ignore_case: bool = False
+
+
+@dataclass
+class RuleHit:
+    rule: PatternRule
+    start: int
+    end: int
+
+
+def _required_literals(items, ignore_case: bool) -> Tuple[str, ...]:
+    """Literals one of which every match must contain (the longest such choice); () when there are none"""
+    candidates, run = [], ""
+    for op, av in list(items) + [(None, None)]:
+        if op is sre_parse.LITERAL:
+            run += chr(av)
+            continue
+        if run:
+            candidates.append((run,))
+            run = ""
+        if op is sre_parse.SUBPATTERN:
+            inner = _required_literals(av[-1], ignore_case)
+        elif op is sre_parse.BRANCH:
+            alternatives = [_required_literals(branch, ignore_case) for branch in av[1]]
+            inner = tuple(l for alt in alternatives for l in alt) if all(alternatives) else ()
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+            inner = _required_literals(av[2], ignore_case)
+        else:
+            inner = ()
+        if inner:
+            candidates.append(inner)
+    if not candidates:
+        return ()
+    best = max(candidates, key=lambda literals: min(len(l) for l in literals))
+    return tuple(l.lower() for l in best) if ignore_case else best
+
+
+_CATEGORY_CLASSES = ({sre_parse.CATEGORY_DIGIT: r"\d", sre_parse.CATEGORY_WORD: r"\w", sre_parse.CATEGORY_SPACE: r"\s"}
+                     if sre_parse else {})
+
+def _first_chars(items) -> Optional[str]:
+    """Character class body covering how a match can start; None when it can't be told"""
+    for op, av in items:
+        if op is sre_parse.AT:
+            continue
+        if op is sre_parse.LITERAL:
+            return re.escape(chr(av))
+        if op is sre_parse.IN:
+            parts = []
+            for member, value in av:
+                if member is sre_parse.LITERAL:
+                    parts.append(re.escape(chr(value)))
+                elif member is sre_parse.RANGE:
+                    parts.append(f"{re.escape(chr(value[0]))}-{re.escape(chr(value[1]))}")
+                elif member is sre_parse.CATEGORY and value in _CATEGORY_CLASSES:
+                    parts.append(_CATEGORY_CLASSES[value])
+                else:
+                    return None
+            return "".join(parts)
+        if op is sre_parse.SUBPATTERN:
+            return _first_chars(av[-1])
+        if op is sre_parse.BRANCH:
+            alternatives = [_first_chars(branch) for branch in av[1]]
+            return None if None in alternatives else "".join(alternatives)
+        if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+            return _first_chars(av[2])
+        return None
+    return None
+
+
+class PatternScanner:
+    """Rules compiled into one alternation per guardrail and action, with a named group per rule.
+
+    Python's regex engine tries every alternative at every position, so two
+    cheap filters keep the alternation small: a rule whose required literals
+    (e.g. "sudo", "@") are absent from the text is left out of the scan, and
+    the alternation sits behind a lookahead on the characters a match can
+    start with. Compiled alternations are cached per set of active rules.
+
+    Reports non-overlapping leftmost matches of each guardrail's block, warn
+    and redact rules, ordered by position; hits of different alternations may
+    overlap, so a warn hit never hides a block hit. Without the (private) regex
+    parser the filters are skipped and every rule is scanned on its own.
+    Patterns may use unnamed groups but not named groups or numeric backreferences.
+    """
+    
+    def __init__(self, rules: List[PatternRule]):
+        self.rules = tuple(rules)
+        self._literals, self._first = [], []
+        for rule in self.rules:
+            if sre_parse is None:
+                self._literals.append(((), rule.ignore_case))
+                self._first.append(None)
+                continue
+            parsed = sre_parse.parse(rule.pattern, re.IGNORECASE if rule.ignore_case else 0)
+            ignore_case = bool(parsed.state.flags & re.IGNORECASE)
+            self._literals.append((_required_literals(parsed, ignore_case), ignore_case))
+            self._first.append(_first_chars(parsed))
+        self._compiled: Dict[Tuple[int, ...], re.Pattern] = {}
+    
+    def _regex(self, active: Tuple[int, ...]) -> re.Pattern:
+        regex = self._compiled.get(active)
+        if regex is None:
+            alternatives = "|".join(
+                f"(?P<r{i}>(?{'i' if self.rules[i].ignore_case else ''}:{self.rules[i].pattern}))" for i in active)
+            first = [self._first[i] for i in active]
+            if None not in first:
+                case = "i" if any(self.rules[i].ignore_case for i in active) else ""
+                alternatives = f"(?{case}:(?=[{''.join(first)}]))(?:{alternatives})"
+            if len(self._compiled) >= 64:
+                self._compiled.clear()
+            regex = self._compiled[active] = re.compile(alternatives)
+        return regex
+    
+    def scan(self, content: str) -> List[RuleHit]:
+        lowered = None
+        active = []
+        for i, (literals, ignore_case) in enumerate(self._literals):
+            if literals:
+                if ignore_case and lowered is None:
+                    lowered = content.lower()
+                haystack = lowered if ignore_case else content
+                if not any(literal in haystack for literal in literals):
+                    continue
+            active.append(i)
+        if not active:
+            return []
+        groups: Dict[Any, List[int]] = {}
+        for i in active:
+            rule = self.rules[i]
+            groups.setdefault(i if sre_parse is None else (rule.guardrail, rule.action), []).append(i)
+        hits = [RuleHit(self.rules[int(m.lastgroup[1:])], m.start(), m.end())
+                for group in groups.values() for m in self._regex(tuple(group)).finditer(content)]
+        if len(groups) > 1:
+            hits.sort(key=lambda hit: hit.start)
+        return hits
+
+
+def redact(content: str, hits: List[RuleHit], replacement: str = "[REDACTED]") -> str:
+    """Replace the spans of MODIFY hits"""
+    parts, last = [], 0
+    for hit in sorted(hits, key=lambda h: h.start):
+        if hit.rule.action != GuardrailAction.MODIFY:
+            continue
+        if hit.start < last:
+            # Overlaps the previous redaction (another guardrail's hit): extend it
+            last = max(last, hit.end)
+            continue
+        parts.append(content[last:hit.start])
+        parts.append(replacement)
+        last = hit.end
+    parts.append(content[last:])
+    return "".join(parts)
+
+
+class StreamingOutputFilter:
+    """Applies pattern guardrails to a token stream while it is being printed.
+
+    Text is released at line ends (the streaming handler renders whole lines
+    anyway) or once more than `lookback` characters are pending, so filtering
+    adds no visible delay. Each scan covers the pending text plus the last
+    `lookback` released characters, so a pattern split across chunks still
+    matches. MODIFY hits are redacted before release, and a hit still open at
+    the release point is held back until it completes. A BLOCK hit halts the
+    stream: only the text before it is released and `halted` is set.
+    """
+    
+    def __init__(self, scanner: PatternScanner, lookback: int = 256, replacement: str = "[REDACTED]"):
+        self.scanner = scanner
+        self.lookback = lookback
+        self.replacement = replacement
+        self.halted = False
+        self.rules_fired: set = set()
+        self._pending = ""
+        self._released_tail = ""  # Original text, kept only as matching context
+    
+    def feed(self, delta: str) -> str:
+        """Add streamed text; returns the part that is safe to show now"""
+        if self.halted or not delta:
+            return ""
+        self._pending += delta
+        release = max(self._pending.rfind("\n") + 1, len(self._pending) - self.lookback)
+        return self._release(release) if release > 0 else ""
+    
+    def flush(self) -> str:
+        """End of stream: release whatever is left"""
+        return "" if self.halted else self._release(len(self._pending))
+    
+    def _release(self, release: int) -> str:
+        offset = len(self._released_tail)
+        redactions = []
+        for hit in self.scanner.scan(self._released_tail + self._pending):
+            if hit.end <= offset:
+                continue  # Handled when that text was released
+            start, end = max(hit.start - offset, 0), hit.end - offset
+            if start >= release:
+                break
+            self.rules_fired.add(hit.rule.name)
+            if hit.rule.action == GuardrailAction.BLOCK:
+                self.halted = True
+                release = start
+                break
+            if hit.rule.action == GuardrailAction.MODIFY:
+                if end > release:
+                    release = start
+                    break
+                if redactions and start < redactions[-1][1]:
+                    # Overlaps a redaction of another guardrail
+                    redactions[-1] = (redactions[-1][0], max(end, redactions[-1][1]))
+                else:
+                    redactions.append((start, end))
+        
+        released, self._pending = self._pending[:release], self._pending[release:]
+        self._released_tail = (self._released_tail + released)[-self.lookback:]
+        parts, last = [], 0
+        for start, end in redactions:
+            parts += [released[last:start], self.replacement]
+            last = end
+        parts.append(released[last:])
+        return "".join(parts)
+
+
 @dataclass
 class GuardrailResult:
     """Result of guardrail evaluation"""
@@ -45,11 +281,23 @@ class Guardrail:
         self.name = name
         self.type = guardrail_type
         self.enabled = True
+        self._scanner: Optional[PatternScanner] = None
     
     def evaluate(self, content: str, context: Optional[Dict[str, Any]] = None) -> GuardrailResult:
         """Evaluate content against this guardrail"""
         raise NotImplementedError
     
+    def rules(self) -> List[PatternRule]:
+        """Patterns this guardrail matches; GuardrailManager scans all guardrails' rules in one pass"""
+        return []
+    
+    def _scan(self, content: str) -> List[RuleHit]:
+        """Hits of this guardrail's own rules, for standalone evaluation"""
+        rules = tuple(self.rules())
+        if self._scanner is None or self._scanner.rules != rules:
+            self._scanner = PatternScanner(rules)
+        return self._scanner.scan(content)
+    
     def enable(self):
         """Enable this guardrail"""
         self.enabled = True
@@ -77,27 +325,37 @@ class ContentSafetyGuardrail(Guardrail):
             r'\bdd\s+if=',
         ]
     
-    def evaluate(self, content: str, context: Optional[Dict[str, Any]] = None) -> GuardrailResult:
+    def rules(self) -> List[PatternRule]:
+        return ([PatternRule(f"{self.name}.block.{i}", p, GuardrailAction.BLOCK, self.name, True)
+                 for i, p in enumerate(self.blocked_patterns)] +
+                [PatternRule(f"{self.name}.warn.{i}", p, GuardrailAction.WARN, self.name, True)
+                 for i, p in enumerate(self.warning_patterns)])
+    
+    def evaluate(self, content: str, context: Optional[Dict[str, Any]] = None,
+                 hits: Optional[List[RuleHit]] = None) -> GuardrailResult:
         if not self.enabled:
             return GuardrailResult(GuardrailAction.ALLOW, True)
         
+        hits = self._scan(content) if hits is None else hits
+        fired = {"rules": sorted({hit.rule.name for hit in hits})}
+        
         # Check for blocked patterns
-        for pattern in self.blocked_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return GuardrailResult(
-                    GuardrailAction.BLOCK,
-                    False,
-                    f"Content blocked: Contains sensitive information or dangerous command"
-                )
+        if any(hit.rule.action == GuardrailAction.BLOCK for hit in hits):
+            return GuardrailResult(
+                GuardrailAction.BLOCK,
+                False,
+                f"Content blocked: Contains sensitive information or dangerous command",
+                metadata=fired
+            )
         
         # Check for warning patterns
-        for pattern in self.warning_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return GuardrailResult(
-                    GuardrailAction.WARN,
-                    True,
-                    f"Warning: Content contains potentially dangerous command"
-                )
+        if hits:
+            return GuardrailResult(
+                GuardrailAction.WARN,
+                True,
+                f"Warning: Content contains potentially dangerous command",
+                metadata=fired
+            )
         
         return GuardrailResult(GuardrailAction.ALLOW, True)
 
@@ -146,7 +404,12 @@ class InputValidationGuardrail(Guardrail):
         self.min_length = min_length
         self.blocked_keywords = ["hack", "exploit", "bypass", "jailbreak"]
     
-    def evaluate(self, content: str, context: Optional[Dict[str, Any]] = None) -> GuardrailResult:
+    def rules(self) -> List[PatternRule]:
+        return [PatternRule(f"{self.name}.keyword.{keyword}", re.escape(keyword), GuardrailAction.WARN, self.name, True)
+                for keyword in self.blocked_keywords]
+    
+    def evaluate(self, content: str, context: Optional[Dict[str, Any]] = None,
+                 hits: Optional[List[RuleHit]] = None) -> GuardrailResult:
         if not self.enabled:
             return GuardrailResult(GuardrailAction.ALLOW, True)
         
@@ -166,14 +429,15 @@ class InputValidationGuardrail(Guardrail):
             )
         
         # Keyword validation
-        content_lower = content.lower()
-        for keyword in self.blocked_keywords:
-            if keyword in content_lower:
-                return GuardrailResult(
-                    GuardrailAction.WARN,
-                    True,
-                    f"Warning: Input contains potentially problematic keyword: {keyword}"
-                )
+        hits = self._scan(content) if hits is None else hits
+        if hits:
+            keyword = content[hits[0].start:hits[0].end].lower()
+            return GuardrailResult(
+                GuardrailAction.WARN,
+                True,
+                f"Warning: Input contains potentially problematic keyword: {keyword}",
+                metadata={"rules": sorted({hit.rule.name for hit in hits})}
+            )
         
         return GuardrailResult(GuardrailAction.ALLOW, True)
 
@@ -189,71 +453,61 @@ class OutputFilteringGuardrail(Guardrail):
             r'\b(?:\d{1,3}\.){3}\d{1,3}\b',  # IP address
         ]
     
-    def evaluate(self, content: str, context: Optional[Dict[str, Any]] = None) -> GuardrailResult:
+    def rules(self) -> List[PatternRule]:
+        return [PatternRule(f"{self.name}.redact.{i}", p, GuardrailAction.MODIFY, self.name)
+                for i, p in enumerate(self.sensitive_patterns)]
+    
+    def evaluate(self, content: str, context: Optional[Dict[str, Any]] = None,
+                 hits: Optional[List[RuleHit]] = None) -> GuardrailResult:
         if not self.enabled:
             return GuardrailResult(GuardrailAction.ALLOW, True)
         
-        modified_content = content
-        modifications_made = False
-        
-        for pattern in self.sensitive_patterns:
-            matches = re.findall(pattern, content)
-            if matches:
-                for match in matches:
-                    # Replace with redacted version
-                    redacted = "[REDACTED]"
-                    modified_content = modified_content.replace(match, redacted)
-                    modifications_made = True
-        
-        if modifications_made:
+        hits = self._scan(content) if hits is None else hits
+        if hits:
             return GuardrailResult(
                 GuardrailAction.MODIFY,
                 True,
                 "Output modified: Sensitive information redacted",
-                modified_content
+                redact(content, hits),
+                metadata={"rules": sorted({hit.rule.name for hit in hits})}
             )
         
         return GuardrailResult(GuardrailAction.ALLOW, True)
 
 
 class RateLimitingGuardrail(Guardrail):
-    """Guardrail for rate limiting"""
+    """Guardrail for rate limiting (a token bucket, so checks are O(1))"""
     
     def __init__(self, max_requests_per_minute: int = 60):
         super().__init__("rate_limiting", GuardrailType.RATE_LIMITING)
         self.max_requests_per_minute = max_requests_per_minute
-        self.request_history: List[float] = []
+        self.bucket = TokenBucket(max_requests_per_minute)
     
     def evaluate(self, content: str, context: Optional[Dict[str, Any]] = None) -> GuardrailResult:
         if not self.enabled:
             return GuardrailResult(GuardrailAction.ALLOW, True)
         
-        import time
-        current_time = time.time()
-        
-        # Clean old requests (older than 1 minute)
-        self.request_history = [t for t in self.request_history if current_time - t < 60]
-        
-        # Check rate limit
-        if len(self.request_history) >= self.max_requests_per_minute:
+        if not self.bucket.try_acquire():
             return GuardrailResult(
                 GuardrailAction.BLOCK,
                 False,
-                f"Rate limit exceeded: {len(self.request_history)} requests in last minute"
+                f"Rate limit exceeded: {self.max_requests_per_minute} requests per minute, "
+                f"retry in {self.bucket.wait_time(1):.1f}s"
             )
         
-        # Add current request
-        self.request_history.append(current_time)
-        
         return GuardrailResult(GuardrailAction.ALLOW, True)
 
 
 class GuardrailManager:
     """Manages multiple guardrails"""
     
+    INPUT_TYPES = (GuardrailType.INPUT_VALIDATION, GuardrailType.CONTENT_SAFETY)
+    OUTPUT_TYPES = (GuardrailType.OUTPUT_FILTERING,)
+    
     def __init__(self):
         self.guardrails: List[Guardrail] = []
         self.enforcement_mode = "strict"  # strict, permissive, logging_only
+        self._scanners: Dict[tuple, PatternScanner] = {}
     
     def add_guardrail(self, guardrail: Guardrail):
         """Add a guardrail"""
@@ -263,15 +517,44 @@ class GuardrailManager:
         """Remove a guardrail by name"""
         self.guardrails = [g for g in self.guardrails if g.name != name]
     
+    def scan(self, content: str, types: tuple) -> Dict[str, List[RuleHit]]:
+        """One pass of every enabled guardrail's rules for these types; hits keyed by guardrail name"""
+        hits: Dict[str, List[RuleHit]] = {}
+        for hit in self._scanner(types).scan(content):
+            hits.setdefault(hit.rule.guardrail, []).append(hit)
+        return hits
+    
+    def _scanner(self, types: tuple) -> PatternScanner:
+        rules = tuple(rule for g in self.guardrails if g.enabled and g.type in types for rule in g.rules())
+        scanner = self._scanners.get(types)
+        if scanner is None or scanner.rules != rules:
+            scanner = self._scanners[types] = PatternScanner(rules)
+        return scanner
+    
+    def stream_output(self, types: tuple = OUTPUT_TYPES, lookback: int = 256) -> StreamingOutputFilter:
+        """Filter for one streamed response; pass CONTENT_SAFETY in `types` to halt on its block rules.
+
+        Only pattern rules apply mid-stream; guardrails without rules need the
+        full text and are left to evaluate_output.
+        """
+        return StreamingOutputFilter(self._scanner(tuple(types)), lookback)
+    
+    def _evaluate(self, guardrail: Guardrail, content: str, context: Optional[Dict[str, Any]],
+                  hits: Dict[str, List[RuleHit]]) -> GuardrailResult:
+        if guardrail.enabled and guardrail.rules():
+            return guardrail.evaluate(content, context, hits=hits.get(guardrail.name, []))
+        return guardrail.evaluate(content, context)
+    
     def evaluate_input(self, content: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Evaluate input against all guardrails"""
         results = []
         overall_passed = True
         final_action = GuardrailAction.ALLOW
+        hits = self.scan(content, self.INPUT_TYPES)
         
         for guardrail in self.guardrails:
-            if guardrail.type in [GuardrailType.INPUT_VALIDATION, GuardrailType.CONTENT_SAFETY]:
-                result = guardrail.evaluate(content, context)
+            if guardrail.type in self.INPUT_TYPES:
+                result = self._evaluate(guardrail, content, context, hits)
                 results.append({
                     "guardrail": guardrail.name,
                     "result": result
@@ -287,29 +570,35 @@ class GuardrailManager:
             "passed": overall_passed,
             "action": final_action,
             "results": results,
+            "rules_fired": sorted({hit.rule.name for group in hits.values() for hit in group}),
             "enforcement_mode": self.enforcement_mode
         }
     
     def evaluate_output(self, content: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Evaluate output against all guardrails"""
         results = []
-        modified_content = content
+        # Pattern guardrails share one scan of the original text and their redactions are applied together
+        hits = self.scan(content, self.OUTPUT_TYPES)
+        modified_content = redact(content, [hit for group in hits.values() for hit in group])
         
         for guardrail in self.guardrails:
-            if guardrail.type == GuardrailType.OUTPUT_FILTERING:
-                result = guardrail.evaluate(modified_content, context)
+            if guardrail.type in self.OUTPUT_TYPES:
+                if guardrail.enabled and guardrail.rules():
+                    result = guardrail.evaluate(content, context, hits=hits.get(guardrail.name, []))
+                else:
+                    result = guardrail.evaluate(modified_content, context)
+                    if result.modified_content:
+                        modified_content = result.modified_content
                 results.append({
                     "guardrail": guardrail.name,
                     "result": result
                 })
-                
-                if result.modified_content:
-                    modified_content = result.modified_content
         
         return {
             "original_content": content,
             "modified_content": modified_content,
-            "results": results
+            "results": results,
+            "rules_fired": sorted({hit.rule.name for group in hits.values() for hit in group})
         }
     
     def set_enforcement_mode(self, mode: str):
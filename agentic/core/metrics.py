@@ -0,0 +1,57 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/backend/core/metrics.ipynb.
+
+# %% auto 0
+__all__ = ['Metrics', 'get_metrics']
+
+# %% ../../nbs/buddy/backend/core/metrics.ipynb 1
+import time
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, Union
+
+
+# %% ../../nbs/buddy/backend/core/metrics.ipynb 2
+class Metrics:
+    """Process-wide counters of the work agents do: LLM calls and tokens, retries, tool calls and time.
+
+    LLMClient, ResilientCaller and ToolManager report here, so a run's cost
+    can be read off in one place (e.g. by the benchmark runner) without
+    threading a collector through every agent. Thread-safe.
+    """
+
+    def __init__(self):
+        self.counters: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, name: str, amount: Union[int, float] = 1):
+        with self._lock:
+            self.counters[name] += amount
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Count one `name` and add its duration to `name`_seconds"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.counters[name] += 1
+                self.counters[f"{name}_seconds"] += time.perf_counter() - started
+
+    def snapshot(self) -> Dict[str, Union[int, float]]:
+        with self._lock:
+            return {name: round(value, 4) if isinstance(value, float) else value for name, value in self.counters.items()}
+
+    def reset(self):
+        with self._lock:
+            self.counters.clear()
+
+
+_metrics = Metrics()
+
+
+def get_metrics() -> Metrics:
+    """The process-wide metrics"""
+    return _metrics
+
@@ -1,21 +1,62 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/backend/llms/client.ipynb.
 
 # %% auto 0
-__all__ = ['LLMClient']
+__all__ = ['Completion', 'LLMClient']
 
 # %% ../../nbs/buddy/backend/llms/client.ipynb 1
 import os
-from typing import Dict, Any, List, Optional, Iterator
+import re
+import json
+import time
+from typing import Dict, Any, List, Optional, Iterator, Callable
 from openai import OpenAI
 from rich.console import Console
 from rich.markdown import Markdown
 
 # %% ../../nbs/buddy/backend/llms/client.ipynb 2
-from ..configs.loader import get_model_config, get_settings_config
+from ..configs.loader import get_model_config, get_settings_config, get_endpoints_config, get_response_cache_config
 from .response_processor import ResponseProcessor
 from .streaming_handler import StreamingHandler
+from .json_extractor import JsonStreamExtractor, JsonExtractionError, response_format_for
+from .rate_limiter import estimate_tokens, get_rate_limiter
+from .resilience import ResilientCaller, is_retryable, retry_after
+from .endpoints import get_endpoint_pool
+from .response_cache import get_response_cache, hashed_embedding, replay_response, replay_stream
+from .prompt_layout import get_prefix_tracker, serialize_request
+from ..core.metrics import get_metrics
 
 # %% ../../nbs/buddy/backend/llms/client.ipynb 3
+class Completion:
+    """A response plus the bookkeeping of the call that produced it, settled when it is processed.
+
+    Kept with the response rather than on the client, so threads sharing one
+    client settle their own cache entry, endpoint and token reservation.
+    """
+
+    def __init__(self, response: Any, cached: bool = False, cache_request: Optional[Dict[str, Any]] = None,
+                 url: Optional[str] = None, rate_keys: Optional[List] = None, reserved_tokens: int = 0,
+                 prefix: Optional[Dict[str, Any]] = None):
+        self.response = response
+        self.cached = cached
+        self.cache_request = cache_request
+        self.url = url
+        self.rate_keys = rate_keys or []
+        self.reserved_tokens = reserved_tokens
+        self.prefix = prefix
+        self.settled = False
+
+    def __iter__(self):
+        return iter(self.response)
+
+    def close(self):
+        close = getattr(self.response, "close", None)
+        if close:
+            close()
+
+    def __getattr__(self, name):
+        return getattr(self.response, name)
+
+
 class LLMClient:
     """Enhanced LLM client"""
     
@@ -29,11 +70,28 @@ class LLMClient:
         self.model = model or model_config.get('name', 'qwen3:8b')
         self.base_url = base_url or model_config.get('url', 'http://localhost:11434/v1')
         self.api_key = api_key or model_config.get('api_key', 'ollama')
-
+        self.structured_output = model_config.get('structured_output', 'auto')
+        self.structured_retries = model_config.get('structured_retries', 2)
+        # None until a structured request shows whether the server accepts response_format
+        self.response_format_supported: Optional[bool] = None
+        # Shared with every other client, so concurrent agents split the backend's quota
+        self.rate_limiter = get_rate_limiter()
+        # Retries, deadlines and hedging; the SDK's own retries are off so attempts don't multiply
+        self.resilience = ResilientCaller()
+        # Replicas of the configured server share one pool; any other url is used on its own
+        urls = [self.base_url]
+        if self.base_url == model_config.get('url'):
+            urls += get_endpoints_config().get('urls', [])
+        self.pool = get_endpoint_pool(urls, self.api_key)
+        self.session: Optional[str] = None  # Default conversation key for sticky routing
+        self._replicas: Dict[str, OpenAI] = {}
+        self.embedding_model = get_response_cache_config().get('embedding_model', '')
+        self.response_cache = get_response_cache(embed=self._embed if self.embedding_model else None)
         
         # Initialize OpenAI client
         self.client = OpenAI(base_url=self.base_url, 
-                             api_key=self.api_key)
+                             api_key=self.api_key,
+                             max_retries=0)
         
         # Initialize processors
         self.response_processor = ResponseProcessor()
@@ -59,8 +117,17 @@ class LLMClient:
     
     def create_completion(self, messages: List[Dict[str, Any]], 
                          tools: Optional[List[Dict]] = None,
-                         stream: bool = True, **kwargs) -> Any:
-        """Create chat completion with optional tools"""
+                         stream: bool = True, session: Optional[str] = None, cache: bool = True, **kwargs) -> Any:
+        """Create chat completion with optional tools.
+
+        A request seen before is replayed from the response cache (as chunks
+        when streaming) unless `cache` is False. Otherwise it picks a replica from the endpoint pool (the same one for every call
+        with the same `session`), waits for rate-limit quota, retries transient
+        failures and may hedge to another replica (see ResilientCaller); a
+        stream is returned once its first chunk has arrived. The response comes
+        wrapped in a Completion; pass it to process_response or
+        handle_streaming_response to settle its quota, endpoint and cache entry.
+        """
         completion_params = {
             "model": self.model,
             "messages": messages,
@@ -72,6 +139,18 @@ class LLMClient:
             completion_params["tools"] = tools
             completion_params["tool_choice"] = "auto"
         
+        cache_request = None
+        if cache and self.response_cache.cacheable(completion_params):
+            cached = self.response_cache.lookup(completion_params)
+            if cached is not None:
+                get_metrics().add("llm_cache_hits")
+                return Completion(replay_stream(cached) if stream else replay_response(cached), cached=True)
+            cache_request = completion_params
+        if stream and self.rate_limiter.limits_tokens([("model", self.model)] + [("endpoint", url) for url in self.pool.urls]):
+            # Token budgets are settled from usage, which streams only report when asked
+            completion_params.setdefault("stream_options", {"include_usage": True})
+        
+        reserved = estimate_tokens(messages, tools)
         try:
             
             # import mlflow
@@ -83,18 +162,151 @@ class LLMClient:
             # mlflow.set_tracking_uri("http://localhost:5000")
             # mlflow.set_experiment("tool_test")
             # with mlflow.start_run():
-            return self.client.chat.completions.create(**completion_params)
+            response, url = self.resilience.call(
+                lambda url, timeout: self._send(url, completion_params, timeout, reserved),
+                self.pool.order(session or self.session), stream,
+                discard=self.pool.finish
+            )
         except Exception as e:
-            raise RuntimeError(f"LLM completion failed: {e}")
+            get_metrics().add("llm_errors")
+            raise RuntimeError(f"LLM completion failed: {e}") from e
+        get_metrics().add("llm_calls")
+        return Completion(response, cache_request=cache_request, url=url,
+                          rate_keys=[("model", self.model), ("endpoint", url)], reserved_tokens=reserved,
+                          prefix=get_prefix_tracker(self.model, url).observe(serialize_request(messages, tools)))
+    
+    def _embed(self, text: str) -> List[float]:
+        """Embedding for semantic cache lookups from the model server, local hashed vectors if it fails"""
+        try:
+            return self.client.embeddings.create(model=self.embedding_model, input=text).data[0].embedding
+        except Exception:
+            return hashed_embedding(text)
+    
+    def _client_for(self, url: str) -> OpenAI:
+        if url == self.base_url:
+            return self.client
+        if url not in self._replicas:
+            self._replicas[url] = OpenAI(base_url=url, api_key=self.api_key, max_retries=0)
+        return self._replicas[url]
+    
+    def _send(self, url: str, completion_params: Dict[str, Any], timeout: float, reserved: int = 0) -> Any:
+        """One attempt against one endpoint, within its rate limits; `reserved` is the token estimate"""
+        keys = [("model", self.model), ("endpoint", url)]
+        self.rate_limiter.acquire(keys, tokens=reserved)
+        self.pool.start(url)
+        started = time.monotonic()
+        try:
+            response = self._client_for(url).chat.completions.create(**{"timeout": timeout, **completion_params})
+        except Exception as e:
+            # Only server trouble counts towards ejecting the replica, not a bad request
+            self.pool.finish(url, ok=not is_retryable(e))
+            self.rate_limiter.record_usage(keys, 0, reserved=reserved)
+            if getattr(e, "status_code", None) == 429:
+                # Hold back every client of this model and endpoint, not just this attempt
+                self.rate_limiter.backoff(keys, retry_after(e) or 1.0)
+            raise
+        self.pool.answered(url, time.monotonic() - started)
+        return response
+    
+    def _settle_usage(self, result: Dict[str, Any], completion: Any) -> Dict[str, Any]:
+        """Charge token budgets what the completion actually used (estimated when the server reports no usage)
+        and release its endpoint; cache the result or mark it as replayed. Adds the shared-prefix report
+        under "prefix", with the server's cached prompt tokens when it reports them"""
+        if not isinstance(completion, Completion) or completion.settled:
+            return result
+        completion.settled = True
+        if completion.cached:
+            return {**result, "cached": True}
+        if completion.cache_request is not None:
+            self.response_cache.store(completion.cache_request, result)
+        usage = result.get("usage")
+        if completion.prefix is not None:
+            details = getattr(usage, "prompt_tokens_details", None)
+            cached_tokens = getattr(details, "cached_tokens", None)
+            result = {**result, "prefix": completion.prefix if cached_tokens is None else {**completion.prefix, "cached_tokens": cached_tokens}}
+        used = getattr(usage, "total_tokens", None) if usage is not None else None
+        if used is None:
+            generated = result.get("content", "") + json.dumps(result.get("tool_calls") or [])
+            used = completion.reserved_tokens + len(generated) // 4
+            get_metrics().add("prompt_tokens", completion.reserved_tokens)
+            get_metrics().add("completion_tokens", len(generated) // 4)
+        else:
+            get_metrics().add("prompt_tokens", getattr(usage, "prompt_tokens", None) or 0)
+            get_metrics().add("completion_tokens", getattr(usage, "completion_tokens", None) or 0)
+        self.rate_limiter.record_usage(completion.rate_keys, used, reserved=completion.reserved_tokens)
+        if completion.url is not None:
+            self.pool.finish(completion.url, ok="error" not in result)
+        return result
     
     def process_response(self, response: Any, console: Optional[Console] = None) -> Dict[str, Any]:
         """Process non-streaming response"""
-        return self.response_processor.process_response(response, console)
+        return self._settle_usage(self.response_processor.process_response(response, console), response)
     
-    def handle_streaming_response(self, response: Iterator, console: Optional[Console] = None) -> Dict[str, Any]:
-        """Handle streaming response"""
-        return self.streaming_handler.handle_streaming_response(response, console)
+    def handle_streaming_response(self, response: Iterator, console: Optional[Console] = None,
+                                  stop_when: Optional[Callable[[str], bool]] = None,
+                                  output_filter: Optional[Any] = None) -> Dict[str, Any]:
+        """Handle streaming response, optionally ending it early or filtering it (see StreamingHandler)"""
+        return self._settle_usage(self.streaming_handler.handle_streaming_response(response, console, stop_when, output_filter),
+                                  response)
     
+    def create_structured_completion(self, messages: List[Dict[str, Any]], schema: Any,
+                                     console: Optional[Console] = None, stream: bool = True,
+                                     max_attempts: Optional[int] = None, **kwargs) -> Dict[str, Any]:
+        """Completion whose content must validate against `schema` (a pydantic model or type).
+
+        The schema goes out as `response_format` so the server constrains
+        decoding; a server that rejects it (or structured_output = "local")
+        gets a local streaming validator instead, which ends the stream at the
+        first value that breaks the schema and re-prompts with the error.
+        Returns the usual result dict plus "parsed"; raises JsonExtractionError
+        when every attempt failed.
+        """
+        messages = list(messages)
+        attempts = max_attempts or self.structured_retries + 1
+        content, error = "", None
+        attempt = 0
+        while attempt < attempts:
+            use_format = self.structured_output != "local" and self.response_format_supported is not False
+            params = {**kwargs, "response_format": response_format_for(schema)} if use_format else kwargs
+            try:
+                response = self.create_completion(messages, stream=stream, **params)
+            except RuntimeError as e:
+                # Only a rejection of the format itself; other 400s (context length, bad params) are real errors
+                if use_format and self.structured_output == "auto" and re.search(r"response_format|json_schema|json schema|guided_json", str(e), re.I):
+                    self.response_format_supported = False
+                    continue  # Same attempt, validated locally
+                raise
+            if use_format:
+                self.response_format_supported = True
+            attempt += 1
+
+            extractor = JsonStreamExtractor(schema, fail_fast=True)
+            if stream:
+                result = self.handle_streaming_response(response, console, stop_when=extractor.feed)
+            else:
+                result = self.process_response(response, console)
+                extractor.feed(result.get("content", ""))
+            content = result.get("content", "")
+            if extractor.finish():
+                return {**result, "parsed": extractor.value}
+
+            error = extractor.error or "no JSON value in the response"
+            # Show the model the reply it is correcting
+            messages.append({"role": "assistant", "content": content})
+            messages.append({"role": "user", "content": (
+                f"Your answer did not match the required JSON schema ({error}). "
+                f"Reply again with only JSON matching this schema:\n{json.dumps(response_format_for(schema)['json_schema']['schema'])}"
+            )})
+        raise JsonExtractionError(f"structured output failed after {attempts} attempts: {error}", content)
+    
+    def clone(self) -> "LLMClient":
+        """Client for the same model and server, for use on another thread.
+        The endpoint pool, rate limiter and response cache stay process-wide."""
+        clone = LLMClient(model=self.model, base_url=self.base_url, api_key=self.api_key)
+        clone.response_format_supported = self.response_format_supported
+        clone.session = self.session
+        return clone
+
     def get_model_info(self) -> Dict[str, Any]:
         """Get information about the current model"""
         return {
@@ -0,0 +1,172 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/backend/llms/endpoints.ipynb.
+
+# %% auto 0
+__all__ = ['Endpoint', 'EndpointPool', 'get_endpoint_pool']
+
+# %% ../../nbs/buddy/backend/llms/endpoints.ipynb 1
+import time
+import random
+import hashlib
+import threading
+import urllib.request
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..configs.loader import get_endpoints_config
+
+
+# %% ../../nbs/buddy/backend/llms/endpoints.ipynb 2
+@dataclass
+class Endpoint:
+    url: str
+    outstanding: int = 0  # Requests sent and not yet finished
+    latency: Optional[float] = None  # EWMA of seconds until the server answered
+    failures: int = 0  # Consecutive failures
+    ejected_until: float = 0.0
+    requests: int = 0
+    errors: int = 0
+
+    def healthy(self, now: float) -> bool:
+        return self.ejected_until <= now
+
+
+def _affinity(session: str, url: str) -> int:
+    return int.from_bytes(hashlib.blake2b(f"{session}|{url}".encode(), digest_size=8).digest(), "big")
+
+
+class EndpointPool:
+    """Replicas of one model server, shared by every client in the process.
+
+    `order(session)` ranks the healthy endpoints best first; clients send to
+    the first and keep the rest for retries and hedges. Without a session the
+    ranking balances load: "least_outstanding" prefers the fewest requests in
+    flight (ties go to the lower latency), "ewma" prefers the lowest
+    latency * (outstanding + 1). With a session the first choice is fixed by
+    rendezvous hashing, so a conversation keeps hitting the server that holds
+    its prompt prefix in cache, and moves only if that server is ejected.
+
+    `eject_after` consecutive failures eject an endpoint for `eject_seconds`;
+    afterwards it gets traffic again and one more failure ejects it anew. With
+    `health_check_seconds` a background thread also probes ejected endpoints'
+    /models and readmits those that answer.
+    """
+
+    def __init__(self, urls: List[str], strategy: Optional[str] = None, sticky: Optional[bool] = None,
+                 eject_after: Optional[int] = None, eject_seconds: Optional[float] = None,
+                 health_check_seconds: Optional[float] = None, api_key: str = "", alpha: float = 0.3):
+        config = get_endpoints_config()
+        self.endpoints: Dict[str, Endpoint] = {url: Endpoint(url) for url in dict.fromkeys(urls)}
+        self.strategy = strategy or config.get('strategy', 'least_outstanding')
+        self.sticky = config.get('sticky', True) if sticky is None else sticky
+        self.eject_after = eject_after or config.get('eject_after_failures', 3)
+        self.eject_seconds = eject_seconds if eject_seconds is not None else config.get('eject_seconds', 30.0)
+        self.health_check_seconds = (health_check_seconds if health_check_seconds is not None
+                                     else config.get('health_check_seconds', 0.0))
+        self.api_key = api_key
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._checker: Optional[threading.Thread] = None
+        if self.health_check_seconds > 0 and len(self.endpoints) > 1:
+            self._checker = threading.Thread(target=self._check_loop, name="endpoint-health", daemon=True)
+            self._checker.start()
+
+    @property
+    def urls(self) -> List[str]:
+        return list(self.endpoints)
+
+    def _load(self, endpoint: Endpoint) -> Tuple:
+        if self.strategy == "ewma":
+            return ((endpoint.latency or 0.0) * (endpoint.outstanding + 1), random.random())
+        return (endpoint.outstanding, endpoint.latency or 0.0, random.random())
+
+    def order(self, session: Optional[str] = None) -> List[str]:
+        """Endpoint urls, best first; ejected ones only if nothing is healthy"""
+        now = time.monotonic()
+        with self._lock:
+            endpoints = list(self.endpoints.values())
+            healthy = [endpoint for endpoint in endpoints if endpoint.healthy(now)]
+            if not healthy:
+                return [endpoint.url for endpoint in sorted(endpoints, key=lambda e: e.ejected_until)]
+            ranked = sorted(healthy, key=self._load)
+            if session and self.sticky:
+                home = max(healthy, key=lambda endpoint: _affinity(session, endpoint.url))
+                ranked.remove(home)
+                ranked.insert(0, home)
+            return [endpoint.url for endpoint in ranked]
+
+    def start(self, url: str):
+        """A request was sent to `url`"""
+        with self._lock:
+            endpoint = self.endpoints.get(url)
+            if endpoint:
+                endpoint.outstanding += 1
+                endpoint.requests += 1
+
+    def answered(self, url: str, seconds: float):
+        """The server answered (headers or full response) after `seconds`"""
+        with self._lock:
+            endpoint = self.endpoints.get(url)
+            if endpoint:
+                endpoint.latency = seconds if endpoint.latency is None else \
+                    self.alpha * seconds + (1 - self.alpha) * endpoint.latency
+                endpoint.failures = 0
+                endpoint.ejected_until = 0.0
+
+    def finish(self, url: str, ok: bool = True):
+        """A request to `url` is over; failures count towards ejection"""
+        with self._lock:
+            endpoint = self.endpoints.get(url)
+            if not endpoint:
+                return
+            endpoint.outstanding = max(0, endpoint.outstanding - 1)
+            if ok:
+                return
+            endpoint.errors += 1
+            endpoint.failures += 1
+            # A readmitted endpoint is ejected again by its first failure
+            if endpoint.failures >= self.eject_after or endpoint.ejected_until:
+                endpoint.ejected_until = time.monotonic() + self.eject_seconds
+
+    def probe(self, url: str, timeout: float = 2.0) -> bool:
+        """GET {url}/models; readmits the endpoint when it answers"""
+        request = urllib.request.Request(url.rstrip("/") + "/models", headers={"Authorization": f"Bearer {self.api_key}"})
+        try:
+            with urllib.request.urlopen(request, timeout=timeout) as response:
+                ok = response.status < 500
+        except Exception:
+            ok = False
+        if ok:
+            with self._lock:
+                endpoint = self.endpoints[url]
+                endpoint.ejected_until = 0.0
+                endpoint.failures = 0
+        return ok
+
+    def _check_loop(self):
+        while True:
+            time.sleep(self.health_check_seconds)
+            now = time.monotonic()
+            for endpoint in list(self.endpoints.values()):
+                if not endpoint.healthy(now):
+                    self.probe(endpoint.url)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        with self._lock:
+            return [{"url": e.url, "healthy": e.healthy(now), "outstanding": e.outstanding, "requests": e.requests,
+                     "errors": e.errors, "latency_ms": round(e.latency * 1000, 1) if e.latency is not None else None}
+                    for e in self.endpoints.values()]
+
+
+_pools: Dict[Tuple[str, ...], EndpointPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_endpoint_pool(urls: List[str], api_key: str = "") -> EndpointPool:
+    """Process-wide pool for a set of urls, so every client sees the same load"""
+    key = tuple(dict.fromkeys(urls))
+    with _pools_lock:
+        if key not in _pools:
+            _pools[key] = EndpointPool(list(key), api_key=api_key)
+        return _pools[key]
+
@@ -0,0 +1,330 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/backend/llms/json_extractor.ipynb.
+
+# %% auto 0
+__all__ = ['THINK_OPEN', 'THINK_CLOSE', 'FENCE', 'CLOSERS', 'JSON_FENCE_LANGS', 'JsonExtractionError', 'strip_think',
+           'schema_name', 'response_format_for', 'repair_json', 'JsonStreamExtractor', 'extract_json', 'complete_json']
+
+# %% ../../nbs/buddy/backend/llms/json_extractor.ipynb 1
+import re
+import json
+from typing import Any, Optional, Tuple
+from pydantic import TypeAdapter, ValidationError
+
+
+# %% ../../nbs/buddy/backend/llms/json_extractor.ipynb 2
+THINK_OPEN, THINK_CLOSE = "<think>", "</think>"
+FENCE = "```"
+CLOSERS = {"{": "}", "[": "]"}
+JSON_FENCE_LANGS = {"", "json", "jsonc", "json5"}
+
+_TRAILING_COMMA = re.compile(r",\s*$")
+_DANGLING_KEY = re.compile(r'[{,]\s*"(?:[^"\\]|\\.)*"\s*$')
+_PARTIAL_LITERAL = re.compile(r"(?<=[:\[,])\s*(?:t|tr|tru|f|fa|fal|fals|n|nu|nul)$")
+
+
+class JsonExtractionError(ValueError):
+    """No valid JSON value in an LLM response; `content` keeps the raw text for fallbacks"""
+
+    def __init__(self, message: str, content: str = ""):
+        super().__init__(message)
+        self.content = content
+
+
+def strip_think(text: str) -> str:
+    """Drop <think> blocks, including an unterminated one at the end"""
+    return re.sub(r"<think>.*?(?:</think>|$)", "", text, flags=re.S)
+
+
+def schema_name(schema: Any) -> str:
+    """Readable name of a model or type, e.g. "Task" for Optional[Task]"""
+    name = getattr(schema, "__name__", None)
+    if name is None:
+        args = [a for a in getattr(schema, "__args__", ()) if a is not type(None)]
+        name = schema_name(args[0]) if len(args) == 1 else "response"
+    return re.sub(r"\W+", "_", name)
+
+
+def response_format_for(schema: Any) -> dict:
+    """OpenAI-style `response_format` constraining decoding to the JSON schema of a pydantic model or type"""
+    return {"type": "json_schema",
+            "json_schema": {"name": schema_name(schema), "schema": TypeAdapter(schema).json_schema()}}
+
+
+def _open_paths(data: Any, depth: int) -> set:
+    """Locations of the `depth` containers still open in a repaired prefix (its rightmost path)"""
+    paths, path, node = [()], (), data
+    while len(paths) < depth and isinstance(node, (dict, list)) and node:
+        key = next(reversed(node)) if isinstance(node, dict) else len(node) - 1
+        path, node = path + (key,), node[key]
+        paths.append(path)
+    return set(paths)
+
+
+def repair_json(text: str) -> str:
+    """Fix the usual LLM JSON defects: trailing commas and a truncated tail (open string, key or closers)"""
+    out, stack = [], []
+    in_string = escape = False
+    for char in text:
+        if in_string:
+            out.append(char)
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+            continue
+        if char in "}]":
+            while out and out[-1].isspace():
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            if stack and CLOSERS[stack[-1]] == char:
+                stack.pop()
+        elif char in CLOSERS:
+            stack.append(char)
+        elif char == '"':
+            in_string = True
+        out.append(char)
+
+    repaired = "".join(out)
+    if in_string:
+        repaired = (repaired[:-1] if escape else repaired) + '"'
+    repaired = _PARTIAL_LITERAL.sub(" null", repaired.rstrip())
+    repaired = _TRAILING_COMMA.sub("", repaired)
+    if repaired.endswith(":"):
+        repaired += " null"
+    elif stack and stack[-1] == "{" and _DANGLING_KEY.search(repaired):
+        repaired += ": null"
+    return repaired + "".join(CLOSERS[opener] for opener in reversed(stack))
+
+
+class JsonStreamExtractor:
+    """Pulls the first valid JSON value out of LLM text as it streams in.
+
+    `feed` scans only the new characters: it skips <think> blocks and non-JSON
+    code fences, tracks bracket depth (string and escape aware) from the first
+    `{`/`[`, and parses the candidate as soon as its brackets balance. A
+    candidate that fails to parse (after `repair_json`) or to validate against
+    `schema` is dropped and scanning resumes just after its opening bracket, so
+    prose like "use {braces}" or an example object does not end the search.
+    `feed` returns True once a value is accepted, which is the caller's cue to
+    stop the stream; `finish` repairs and parses a candidate left open when the
+    stream ended.
+
+    `schema` is a pydantic model or any type pydantic can validate
+    (e.g. `List[Task]`); `value` is then the validated object. `root` limits
+    the accepted outer brackets, e.g. "[" for an array.
+
+    With `fail_fast` the output is expected to be the schema's JSON: the prefix
+    is validated each time a value inside the candidate completes (missing
+    fields of still-open objects are allowed), and the first wrong type, enum
+    value or closed object missing a field sets `failed` and stops the stream.
+    """
+
+    def __init__(self, schema: Any = None, root: Optional[str] = None, fail_fast: bool = False):
+        self.schema = schema
+        self.roots = root or "{["
+        self.fail_fast = fail_fast and schema is not None
+        self._adapter = TypeAdapter(schema) if schema is not None else None
+        self.text = ""
+        self.value: Any = None
+        self.error: Optional[str] = None
+        self.done = False
+        self.failed = False
+        self._pos = 0
+        self._start: Optional[int] = None
+        self._stack = []
+        self._in_string = False
+        self._escape = False
+        self._in_think = False
+
+    def feed(self, chunk: str) -> bool:
+        """Add streamed text; True once a valid value has been found (or, with fail_fast, the output diverged)"""
+        if chunk and not self.done and not self.failed:
+            self.text += chunk
+            self._scan()
+        return self.done or self.failed
+
+    def finish(self) -> bool:
+        """End of stream: try to repair a candidate that never closed, or accept a bare null the schema allows"""
+        if self.done or self.failed:
+            return self.done
+        if self._start is not None:
+            self._accept(repair_json(self.text[self._start:]))
+        elif self._adapter is not None and strip_think(self.text).strip().strip("`").strip().lower() == "null":
+            try:
+                self.value, self.done = self._adapter.validate_python(None), True
+            except ValidationError:
+                pass
+        return self.done
+
+    def result(self) -> Any:
+        if not self.done:
+            raise JsonExtractionError(self.error or "no JSON value found in response", self.text)
+        return self.value
+
+    def _reset(self, resume_at: int):
+        self._pos = resume_at
+        self._start = None
+        self._stack = []
+        self._in_string = self._escape = False
+
+    def _scan(self):
+        text = self.text
+        while self._pos < len(text) and not self.done and not self.failed:
+            if self._start is None:
+                if not self._skip_noise(text):
+                    return
+                continue
+            char = text[self._pos]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in CLOSERS:
+                self._stack.append(char)
+            elif char == "," and self.fail_fast:
+                self._check_prefix(text[self._start:self._pos])
+            elif char in "}]":
+                if CLOSERS[self._stack[-1]] != char:
+                    self._reset(self._start + 1)
+                    continue
+                self._stack.pop()
+                if not self._stack:
+                    start = self._start
+                    if not self._accept(text[start:self._pos + 1]) and not self.failed:
+                        self._reset(start + 1)
+                    continue
+                if self.fail_fast:
+                    self._check_prefix(text[self._start:self._pos + 1])
+            self._pos += 1
+
+    def _skip_noise(self, text: str) -> bool:
+        """Advance over text outside a candidate; False when more input is needed to decide"""
+        pos = self._pos
+        if self._in_think:
+            end = text.find(THINK_CLOSE, pos)
+            if end == -1:
+                self._pos = max(pos, len(text) - len(THINK_CLOSE) + 1)
+                return False
+            self._in_think = False
+            self._pos = end + len(THINK_CLOSE)
+            return True
+        char = text[pos]
+        if char == "<" or char == "`":
+            marker = THINK_OPEN if char == "<" else FENCE
+            rest = text[pos:pos + len(marker)]
+            if rest != marker:
+                if marker.startswith(rest) and pos + len(rest) == len(text):
+                    return False  # Partial marker at the end of the stream so far
+            elif char == "<":
+                self._in_think = True
+                self._pos = pos + len(marker)
+                return True
+            else:
+                return self._skip_fence(text, pos + len(marker))
+        elif char in self.roots:
+            self._start = pos
+            self._stack = [char]
+        self._pos = pos + 1
+        return True
+
+    def _skip_fence(self, text: str, after: int) -> bool:
+        """Enter a json fence, or jump over a fence in another language"""
+        newline = text.find("\n", after)
+        if newline == -1:
+            return False
+        if text[after:newline].strip().lower() in JSON_FENCE_LANGS:
+            self._pos = newline + 1
+            return True
+        end = text.find(FENCE, newline)
+        if end == -1:
+            return False
+        self._pos = end + len(FENCE)
+        return True
+
+    def _diverged(self, error: ValidationError, open_paths: set = frozenset()):
+        """Record the first schema violation that more input can't fix"""
+        for detail in error.errors():
+            if detail["type"] == "missing" and tuple(detail["loc"][:-1]) in open_paths:
+                continue
+            location = ".".join(str(part) for part in detail["loc"]) or "root"
+            self.error = f"JSON does not match {schema_name(self.schema)} at {location}: {detail['msg']}"
+            self.failed = True
+            return
+
+    def _check_prefix(self, prefix: str):
+        """fail_fast: validate the candidate so far, closed off by repair_json"""
+        try:
+            data = json.loads(repair_json(prefix))
+        except json.JSONDecodeError:
+            return  # Not JSON yet - maybe prose in braces
+        try:
+            self._adapter.validate_python(data)
+        except ValidationError as e:
+            self._diverged(e, _open_paths(data, len(self._stack)))
+
+    def _accept(self, candidate: str) -> bool:
+        try:
+            data = json.loads(candidate)
+        except json.JSONDecodeError:
+            try:
+                data = json.loads(repair_json(candidate))
+            except json.JSONDecodeError as e:
+                self.error = f"invalid JSON: {e}"
+                return False
+        if self._adapter is not None:
+            try:
+                data = self._adapter.validate_python(data)
+            except ValidationError as e:
+                self.error = f"JSON does not match {schema_name(self.schema)}: {e.error_count()} errors"
+                if self.fail_fast:
+                    self._diverged(e)
+                return False
+        self.value = data
+        self.done = True
+        return True
+
+
+def extract_json(text: str, schema: Any = None, root: Optional[str] = None) -> Any:
+    """First valid JSON value in a complete response; raises JsonExtractionError"""
+    extractor = JsonStreamExtractor(schema, root)
+    extractor.feed(text)
+    extractor.finish()
+    return extractor.result()
+
+
+def complete_json(agent, prompt: str, schema: Any = None, root: Optional[str] = None, **kwargs) -> Tuple[Any, str]:
+    """Run `agent.complete`, stopping the stream as soon as a valid value has arrived.
+
+    With a `schema` the completion runs in structured-output mode (see
+    `LLMClient.create_structured_completion`). Returns the value and the
+    response text received; raises JsonExtractionError (carrying the text)
+    when no valid value was found. A `stop_when` of the caller's own can end
+    the stream early too, e.g. to abandon a request that is no longer needed.
+    """
+    if schema is not None:
+        response = agent.complete(prompt, response_model=schema, **kwargs)
+        content = response.get("content", "")
+        if response.get("blocked") or response.get("error"):
+            raise JsonExtractionError(response.get("error") or content or "completion blocked", content)
+        return response.get("parsed"), content
+
+    extractor = JsonStreamExtractor(schema, root)
+    stop_when = kwargs.pop("stop_when", None)
+    feed = extractor.feed if stop_when is None else (lambda text: extractor.feed(text) or stop_when(text))
+    response = agent.complete(prompt, stop_when=feed, **kwargs)
+    content = response.get("content", "")
+    if response.get("blocked"):
+        raise JsonExtractionError(content or "completion blocked", content)
+    if not extractor.text:
+        extractor.feed(content)  # Non-streamed completion
+    extractor.finish()
+    return extractor.result(), content
+
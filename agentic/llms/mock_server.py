@@ -0,0 +1,326 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/backend/llms/mock_server.ipynb.
+
+# %% auto 0
+__all__ = ['REASONS', 'ScriptedResponse', 'MockLLMServer', 'load_script', 'main']
+
+# %% ../../nbs/buddy/backend/llms/mock_server.ipynb 1
+import re
+import json
+import time
+import uuid
+import random
+import asyncio
+import argparse
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .response_cache import hashed_embedding
+
+
+# %% ../../nbs/buddy/backend/llms/mock_server.ipynb 2
+@dataclass
+class ScriptedResponse:
+    """One scripted answer. `match` is a regex searched in the last message as "role: content";
+    None matches every request. `times` caps how often it is served (None: no limit)."""
+    content: str = ""
+    think: str = ""  # Streamed inside <think> tags before the content, like qwen3 on Ollama
+    tool_calls: List[Dict[str, Any]] = field(default_factory=list)  # {"name": ..., "arguments": dict or JSON string}
+    error: Optional[int] = None  # Answer with this HTTP status instead
+    match: Optional[str] = None
+    times: Optional[int] = None
+
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 408: "Request Timeout", 429: "Too Many Requests",
+           500: "Internal Server Error", 502: "Bad Gateway", 503: "Service Unavailable", 504: "Gateway Timeout"}
+
+
+def _tokens(text: str) -> List[str]:
+    """Split text into the pieces streamed one per chunk: words with their whitespace"""
+    return re.findall(r"\s*\S+\s*|\s+", text)
+
+
+def _message_text(message: Dict[str, Any]) -> str:
+    content = message.get("content") or ""
+    if isinstance(content, list):  # Multimodal content parts
+        content = " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return f"{message.get('role')}: {content}"
+
+
+class MockLLMServer:
+    """OpenAI-compatible chat server that replays scripted responses with controlled timing.
+
+    Serves POST /v1/chat/completions (streamed as SSE or whole), GET /v1/models
+    and POST /v1/embeddings (local hashed vectors) over plain asyncio streams, with
+    keep-alive and chunked transfer so clients reuse connections like they do
+    against vLLM or Ollama. Every answer waits `ttft` seconds for its first token
+    and then produces `tokens_per_second` word tokens; `error_rate` of the requests
+    (seeded, so runs repeat) fail with `error_status` before any token. Requests
+    with no matching script entry get "Mock response to: <last message>".
+
+    Run it in a background thread with `with MockLLMServer(...) as server:` and
+    point a client at `server.base_url`, or from the shell with
+    `python -m agentic.llms.mock_server`.
+    """
+
+    def __init__(self, responses: Optional[List[ScriptedResponse]] = None, ttft: float = 0.05,
+                 tokens_per_second: float = 200.0, error_rate: float = 0.0, error_status: int = 503,
+                 retry_after: Optional[float] = None, model: str = "mock", host: str = "127.0.0.1",
+                 port: int = 0, seed: int = 0):
+        self.responses = list(responses or [])
+        self.ttft = ttft
+        self.tokens_per_second = tokens_per_second
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.retry_after = retry_after
+        self.model = model
+        self.host = host
+        self.port = port
+        self.random = random.Random(seed)
+        self.stats = {"requests": 0, "errors": 0, "streams": 0, "active": 0, "peak_active": 0,
+                      "prompt_tokens": 0, "completion_tokens": 0}
+        self._lock = threading.Lock()
+        self._server: Optional[asyncio.Server] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    def pick(self, messages: List[Dict[str, Any]]) -> ScriptedResponse:
+        """First script entry that matches the last message and has uses left"""
+        last = _message_text(messages[-1]) if messages else ""
+        with self._lock:
+            for response in self.responses:
+                if response.times is not None and response.times <= 0:
+                    continue
+                if response.match is None or re.search(response.match, last, re.S):
+                    if response.times is not None:
+                        response.times -= 1
+                    return response
+        return ScriptedResponse(content=f"Mock response to: {last[:80]}")
+
+    # HTTP plumbing
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:  # Keep-alive: one connection serves requests until the client closes it
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, path, body = request
+                await self._route(method, path.split("?")[0], body, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, bytes]]:
+        line = await reader.readline()
+        if not line:
+            return None
+        method, path, _ = line.decode().split(" ", 2)
+        headers = {}
+        while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+            name, _, value = line.decode().partition(":")
+            headers[name.strip().lower()] = value.strip()
+        body = await reader.readexactly(int(headers.get("content-length", 0)))
+        return method, path, body
+
+    async def _send(self, writer: asyncio.StreamWriter, status: int, payload: Any, headers: Optional[Dict[str, str]] = None):
+        data = json.dumps(payload).encode()
+        head = [f"HTTP/1.1 {status} {REASONS.get(status, 'Error')}", "Content-Type: application/json",
+                f"Content-Length: {len(data)}"] + [f"{k}: {v}" for k, v in (headers or {}).items()]
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + data)
+        await writer.drain()
+
+    async def _send_event(self, writer: asyncio.StreamWriter, data: str):
+        event = f"data: {data}\n\n".encode()
+        writer.write(f"{len(event):x}\r\n".encode() + event + b"\r\n")
+        await writer.drain()
+
+    async def _route(self, method: str, path: str, body: bytes, writer: asyncio.StreamWriter):
+        if method == "GET" and path.endswith("/models"):
+            await self._send(writer, 200, {"object": "list", "data": [{"id": self.model, "object": "model", "owned_by": "mock"}]})
+        elif method == "POST" and path.endswith("/embeddings"):
+            inputs = json.loads(body or b"{}").get("input", "")
+            inputs = [inputs] if isinstance(inputs, str) else inputs
+            await self._send(writer, 200, {"object": "list", "model": self.model, "data": [
+                {"object": "embedding", "index": i, "embedding": hashed_embedding(text)} for i, text in enumerate(inputs)]})
+        elif method == "POST" and path.endswith("/chat/completions"):
+            await self._completion(json.loads(body or b"{}"), writer)
+        else:
+            await self._send(writer, 404, {"error": {"message": f"No route for {method} {path}", "type": "not_found"}})
+
+    # Completions
+
+    def _deltas(self, response: ScriptedResponse) -> List[Dict[str, Any]]:
+        """The stream as delta dicts, one per token"""
+        deltas = []
+        if response.think:
+            deltas += [{"content": token} for token in ["<think>", *_tokens(response.think), "</think>\n"]]
+        deltas += [{"content": token} for token in _tokens(response.content)]
+        for index, call in enumerate(response.tool_calls):
+            arguments = call.get("arguments", {})
+            arguments = arguments if isinstance(arguments, str) else json.dumps(arguments)
+            deltas.append({"tool_calls": [{"index": index, "id": call.get("id") or f"call_{uuid.uuid4().hex[:12]}",
+                                           "type": "function", "function": {"name": call["name"], "arguments": ""}}]})
+            deltas += [{"tool_calls": [{"index": index, "function": {"arguments": piece}}]}
+                       for piece in re.findall(r".{1,16}", arguments, re.S)]
+        return deltas
+
+    async def _completion(self, request: Dict[str, Any], writer: asyncio.StreamWriter):
+        messages = request.get("messages", [])
+        response = self.pick(messages)
+        with self._lock:
+            self.stats["requests"] += 1
+            failed = response.error or (self.error_status if self.random.random() < self.error_rate else None)
+            if failed:
+                self.stats["errors"] += 1
+        await asyncio.sleep(self.ttft if failed else 0)
+        if failed:
+            headers = {"Retry-After": f"{self.retry_after:g}"} if self.retry_after is not None else {}
+            await self._send(writer, failed, {"error": {"message": f"Injected error {failed}", "type": "mock_error",
+                                                        "code": failed}}, headers)
+            return
+
+        deltas = self._deltas(response)
+        prompt_tokens = sum(len(_message_text(m)) for m in messages) // 4
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": len(deltas),
+                 "total_tokens": prompt_tokens + len(deltas)}
+        finish_reason = "tool_calls" if response.tool_calls else "stop"
+        completion_id = f"chatcmpl-{uuid.uuid4().hex[:12]}"
+        with self._lock:
+            self.stats["active"] += 1
+            self.stats["peak_active"] = max(self.stats["peak_active"], self.stats["active"])
+            self.stats["prompt_tokens"] += prompt_tokens
+            self.stats["completion_tokens"] += len(deltas)
+        try:
+            if request.get("stream"):
+                await self._stream(writer, completion_id, deltas, finish_reason, usage,
+                                   (request.get("stream_options") or {}).get("include_usage", False))
+            else:
+                await asyncio.sleep(self.ttft + max(len(deltas) - 1, 0) / self.tokens_per_second)
+                await self._send(writer, 200, self._whole(completion_id, response, finish_reason, usage))
+        finally:
+            with self._lock:
+                self.stats["active"] -= 1
+
+    async def _stream(self, writer: asyncio.StreamWriter, completion_id: str, deltas: List[Dict[str, Any]],
+                      finish_reason: str, usage: Dict[str, int], include_usage: bool):
+        with self._lock:
+            self.stats["streams"] += 1
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                     b"Transfer-Encoding: chunked\r\n\r\n")
+        await writer.drain()  # Headers go out at once, tokens follow on the schedule
+
+        def chunk(delta, finish=None, **extra):
+            return json.dumps({"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                               "model": self.model, "choices": [{"index": 0, "delta": delta, "finish_reason": finish}],
+                               **extra})
+
+        start = time.monotonic()
+        for i, delta in enumerate([{"role": "assistant", "content": ""}] + deltas):
+            # Scheduled from the start rather than slept per token, so timing does not drift under load
+            due = start + (self.ttft + (i - 1) / self.tokens_per_second if i else 0)
+            await asyncio.sleep(max(0.0, due - time.monotonic()))
+            await self._send_event(writer, chunk(delta))
+        await self._send_event(writer, chunk({}, finish_reason))
+        if include_usage:
+            await self._send_event(writer, json.dumps({"id": completion_id, "object": "chat.completion.chunk",
+                                                       "created": int(time.time()), "model": self.model,
+                                                       "choices": [], "usage": usage}))
+        await self._send_event(writer, "[DONE]")
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    def _whole(self, completion_id: str, response: ScriptedResponse, finish_reason: str, usage: Dict[str, int]) -> Dict[str, Any]:
+        content = (f"<think>{response.think}</think>\n" if response.think else "") + response.content
+        tool_calls = [{"id": call.get("id") or f"call_{uuid.uuid4().hex[:12]}", "type": "function",
+                       "function": {"name": call["name"], "arguments": call.get("arguments", {}) if isinstance(call.get("arguments"), str)
+                                    else json.dumps(call.get("arguments", {}))}} for call in response.tool_calls]
+        message = {"role": "assistant", "content": content or None, **({"tool_calls": tool_calls} if tool_calls else {})}
+        return {"id": completion_id, "object": "chat.completion", "created": int(time.time()), "model": self.model,
+                "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}], "usage": usage}
+
+    # Background thread
+
+    def run_in_thread(self) -> "MockLLMServer":
+        """Serve from a daemon thread with its own event loop; returns once the port is bound"""
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.start())
+            ready.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="mock-llm-server", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self
+
+    async def _shutdown(self):
+        """Stop listening and cancel the connections still open"""
+        self._server.close()
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self):
+        if self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(timeout=5)
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
+            self._loop.close()
+            self._loop = None
+
+    def __enter__(self) -> "MockLLMServer":
+        return self.run_in_thread()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def load_script(path: str) -> List[ScriptedResponse]:
+    """Script file: a JSON list of ScriptedResponse fields"""
+    with open(path) as f:
+        return [ScriptedResponse(**entry) for entry in json.load(f)]
+
+
+def main():
+    """Command line entry point: serve until interrupted"""
+    parser = argparse.ArgumentParser(description="Mock OpenAI-compatible LLM server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--script", help="JSON list of scripted responses")
+    parser.add_argument("--ttft", type=float, default=0.05, help="Seconds to the first token")
+    parser.add_argument("--tps", type=float, default=200.0, help="Tokens per second after the first")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error-status", type=int, default=503)
+    parser.add_argument("--model", default="mock")
+    args = parser.parse_args()
+    server = MockLLMServer(load_script(args.script) if args.script else None, ttft=args.ttft,
+                           tokens_per_second=args.tps, error_rate=args.error_rate, error_status=args.error_status,
+                           model=args.model, host=args.host, port=args.port)
+    print(f"Mock LLM server on http://{args.host}:{args.port}/v1")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print(json.dumps(server.stats))
+
+
+if __name__ == "__main__":
+    main()
+
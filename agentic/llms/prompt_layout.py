@@ -0,0 +1,135 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/backend/llms/prompt_layout.ipynb.
+
+# %% auto 0
+__all__ = ['Stability', 'Segment', 'PromptLayout', 'serialize_request', 'shared_prefix', 'PrefixTracker', 'get_prefix_tracker']
+
+# %% ../../nbs/buddy/backend/llms/prompt_layout.ipynb 1
+import json
+import threading
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Dict, List, Optional
+
+
+# %% ../../nbs/buddy/backend/llms/prompt_layout.ipynb 2
+class Stability(IntEnum):
+    """How often a prompt segment changes; prompts are laid out most stable first"""
+    STATIC = 0  # Instructions, response formats, guidelines
+    TOOLS = 1  # Tool schemas and tool descriptions
+    CONTEXT = 2  # Changes slowly: environment, project specification, original request
+    VOLATILE = 3  # Changes every request: progress, results, ids, the question itself
+
+
+@dataclass
+class Segment:
+    text: str
+    stability: Stability
+    name: str = ""
+
+
+class PromptLayout:
+    """Builds a prompt from segments ordered by stability, not by insertion.
+
+    Model servers (vLLM, llama.cpp, Ollama) reuse the KV cache of the longest
+    prompt prefix they have seen, so everything before the first changed byte
+    is free. Putting static instructions first, then tool descriptions, then
+    slowly changing context and the volatile data last keeps that prefix
+    byte-identical across turns, tasks and agents. Segments of the same
+    stability keep their insertion order; empty ones are dropped.
+    """
+
+    def __init__(self, separator: str = "\n\n"):
+        self.separator = separator
+        self.segments: List[Segment] = []
+
+    def add(self, text: str, stability: Stability = Stability.STATIC, name: str = "") -> "PromptLayout":
+        if text and text.strip():
+            self.segments.append(Segment(text.strip(), stability, name))
+        return self
+
+    def static(self, text: str, name: str = "") -> "PromptLayout":
+        return self.add(text, Stability.STATIC, name)
+
+    def tools(self, text: str, name: str = "") -> "PromptLayout":
+        return self.add(text, Stability.TOOLS, name)
+
+    def context(self, text: str, name: str = "") -> "PromptLayout":
+        return self.add(text, Stability.CONTEXT, name)
+
+    def volatile(self, text: str, name: str = "") -> "PromptLayout":
+        return self.add(text, Stability.VOLATILE, name)
+
+    def render(self, upto: Optional[Stability] = None) -> str:
+        """The prompt; with `upto`, only the segments at most that volatile"""
+        segments = sorted(self.segments, key=lambda segment: segment.stability)
+        return self.separator.join(s.text for s in segments if upto is None or s.stability <= upto)
+
+    def __str__(self) -> str:
+        return self.render()
+
+
+def serialize_request(messages: List[Dict[str, Any]], tools: Optional[List[Dict]] = None) -> str:
+    """Approximation of the prompt a chat template renders: system messages, tool schemas, then the conversation"""
+    def render(message):
+        text = f"<{message.get('role')}>{message.get('content') or ''}"
+        if message.get("tool_calls"):
+            text += json.dumps(message["tool_calls"], sort_keys=True)
+        return text
+
+    system = [render(m) for m in messages if m.get("role") == "system"]
+    rest = [render(m) for m in messages if m.get("role") != "system"]
+    return "".join(system) + (json.dumps(tools, sort_keys=True) if tools else "") + "".join(rest)
+
+
+def shared_prefix(a: str, b: str) -> int:
+    """Length of the common prefix, by binary search over slice comparisons (C speed)"""
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+class PrefixTracker:
+    """Longest prefix each request shares with the recent requests to the same server.
+
+    A rough view of what the server's prefix cache can reuse: the characters
+    up to the first difference from the closest of the last `history`
+    prompts. Thread-safe.
+    """
+
+    def __init__(self, history: int = 32):
+        self.recent: deque = deque(maxlen=history)
+        self.requests = 0
+        self.prompt_chars = 0
+        self.shared_chars = 0
+        self._lock = threading.Lock()
+
+    def observe(self, prompt: str) -> Dict[str, Any]:
+        with self._lock:
+            shared = max((shared_prefix(prompt, earlier) for earlier in self.recent), default=0)
+            self.recent.append(prompt)
+            self.requests += 1
+            self.prompt_chars += len(prompt)
+            self.shared_chars += shared
+        return {"prompt_chars": len(prompt), "shared_prefix_chars": shared,
+                "shared_ratio": round(shared / len(prompt), 3) if prompt else 0.0}
+
+    def stats(self) -> Dict[str, Any]:
+        return {"requests": self.requests, "prompt_chars": self.prompt_chars, "shared_prefix_chars": self.shared_chars,
+                "shared_ratio": round(self.shared_chars / self.prompt_chars, 3) if self.prompt_chars else 0.0}
+
+
+_trackers: Dict[tuple, PrefixTracker] = {}
+_trackers_lock = threading.Lock()
+
+
+def get_prefix_tracker(model: str, url: str) -> PrefixTracker:
+    """Process-wide tracker per model and server, whose prefix caches are separate"""
+    with _trackers_lock:
+        return _trackers.setdefault((model, url), PrefixTracker())
+
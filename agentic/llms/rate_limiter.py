@@ -0,0 +1,249 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/backend/llms/rate_limiter.ipynb.
+
+# %% auto 0
+__all__ = ['Key', 'RateLimitExceeded', 'TokenBucket', 'estimate_tokens', 'RateLimiter', 'get_rate_limiter']
+
+# %% ../../nbs/buddy/backend/llms/rate_limiter.ipynb 1
+import json
+import time
+import asyncio
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..configs.loader import get_rate_limits_config
+
+
+# %% ../../nbs/buddy/backend/llms/rate_limiter.ipynb 2
+Key = Tuple[str, str]  # (scope, name), e.g. ("model", "qwen3:8b"), ("endpoint", url), ("tool", "execute_bash")
+
+
+class RateLimitExceeded(RuntimeError):
+    """Quota would not free up within the allowed wait"""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Refills at `per_minute / 60` units a second up to `burst` (default a full minute).
+
+    The level is updated lazily from the elapsed time, so every call is O(1).
+    `reserve` takes the units at once, going into debt if needed, and returns
+    how long the caller must wait before using them (GCRA-style scheduling):
+    concurrent callers queue up behind each other instead of all retrying when
+    capacity frees.
+    """
+
+    def __init__(self, per_minute: float, burst: Optional[float] = None):
+        self.per_minute = per_minute
+        self.rate = per_minute / 60.0
+        self.capacity = burst if burst is not None else per_minute
+        self._level = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> float:
+        now = time.monotonic()
+        self._level = min(self.capacity, self._level + (now - self._updated) * self.rate)
+        self._updated = now
+        return self._level
+
+    @property
+    def level(self) -> float:
+        with self._lock:
+            return self._refill()
+
+    def wait_time(self, amount: float = 0.0) -> float:
+        """Seconds until `amount` units are available (0 waits out any debt)"""
+        with self._lock:
+            return max(0.0, (amount - self._refill()) / self.rate)
+
+    def reserve(self, amount: float = 1.0, max_wait: Optional[float] = None) -> Optional[float]:
+        """Take `amount` units; seconds to wait before using them, or None (nothing taken) past `max_wait`"""
+        with self._lock:
+            wait = max(0.0, (amount - self._refill()) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._level -= amount
+            return wait
+
+    def try_acquire(self, amount: float = 1.0) -> bool:
+        """Take `amount` units only if they are available now"""
+        return self.reserve(amount, max_wait=0.0) is not None
+
+    def adjust(self, amount: float):
+        """Debit (positive) or refund (negative) units without waiting, e.g. to settle an estimate"""
+        with self._lock:
+            self._level = min(self.capacity, self._refill() - amount)
+
+    def pause(self, seconds: float):
+        """Hold every caller back for `seconds`, e.g. after the server answered 429"""
+        with self._lock:
+            self._level = min(self._refill(), -seconds * self.rate)
+
+
+def estimate_tokens(messages: List[Dict[str, Any]], tools: Optional[List[Dict]] = None) -> int:
+    """Rough prompt size (4 characters a token) for reserving budget before usage data exists"""
+    chars = sum(len(str(message.get("content") or "")) + len(json.dumps(message.get("tool_calls", ""))) for message in messages)
+    if tools:
+        chars += len(json.dumps(tools))
+    return chars // 4 + 4 * len(messages)
+
+
+class RateLimiter:
+    """Request and token budgets shared by every agent in the process.
+
+    Limits are looked up per key: an override for the exact key
+    ("model:gpt-4o", "endpoint:http://host/v1", "tool:execute_bash") wins,
+    otherwise models get `requests_per_minute`/`tokens_per_minute` and tools
+    `tool_calls_per_minute` from [rate_limits]; 0 means unlimited. Buckets are
+    created on first use. Token budgets are charged an estimate up front and
+    settled with the `usage` the server reports (`record_usage`).
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        config = config if config is not None else get_rate_limits_config()
+        self.enabled = config.get('enabled', True)
+        self.max_wait = config.get('max_wait_seconds', 120.0)
+        self.defaults = {
+            "model": {"requests_per_minute": config.get('requests_per_minute', 0.0),
+                      "tokens_per_minute": config.get('tokens_per_minute', 0.0)},
+            "tool": {"requests_per_minute": config.get('tool_calls_per_minute', 0.0)},
+        }
+        self.overrides: Dict[str, Dict[str, float]] = dict(config.get('overrides') or {})
+        self._buckets: Dict[Tuple[str, str, str], Optional[TokenBucket]] = {}
+        self._paused_until: Dict[Key, float] = {}  # Backoff of keys without a request bucket
+        self._lock = threading.Lock()
+        self.waited = 0.0  # Total seconds callers spent waiting
+
+    def set_limit(self, scope: str, name: str, requests_per_minute: float = 0.0, tokens_per_minute: float = 0.0):
+        """Override the limits of one key"""
+        with self._lock:
+            self.overrides[f"{scope}:{name}"] = {"requests_per_minute": requests_per_minute,
+                                                 "tokens_per_minute": tokens_per_minute}
+            for kind in ("requests", "tokens"):
+                self._buckets.pop((kind, scope, name), None)
+
+    def _bucket(self, kind: str, key: Key) -> Optional[TokenBucket]:
+        """Bucket for "requests" or "tokens" of a key; None when unlimited"""
+        slot = (kind, *key)
+        bucket = self._buckets.get(slot)
+        if bucket is None and slot not in self._buckets:
+            with self._lock:
+                if slot not in self._buckets:
+                    scope, name = key
+                    limits = self.overrides.get(f"{scope}:{name}", self.defaults.get(scope, {}))
+                    per_minute = limits.get(f"{kind}_per_minute", 0.0)
+                    self._buckets[slot] = TokenBucket(per_minute) if per_minute and per_minute > 0 else None
+                bucket = self._buckets[slot]
+        return bucket
+
+    def _pause_wait(self, keys: List[Key]) -> float:
+        """Seconds left on the backoff of unlimited keys"""
+        if not self._paused_until:
+            return 0.0
+        now, wait = time.monotonic(), 0.0
+        with self._lock:
+            for key in keys:
+                until = self._paused_until.get(key)
+                if until is not None and until <= now:
+                    del self._paused_until[key]
+                elif until is not None:
+                    wait = max(wait, until - now)
+        return wait
+
+    def limits_tokens(self, keys: Iterable[Key]) -> bool:
+        """Whether any of the keys has a token budget"""
+        return self.enabled and any(self._bucket("tokens", key) for key in keys)
+
+    def _reserve(self, keys: List[Key], tokens: float, timeout: Optional[float]) -> float:
+        """Reserve on every bucket of the keys; the wait is that of the slowest one"""
+        max_wait = self.max_wait if timeout is None else timeout
+        taken, wait = [], self._pause_wait(keys)
+        if wait > max_wait:
+            raise RateLimitExceeded(f"Backing off for {wait:.1f}s after a rate-limit response, more than {max_wait:g}s", wait)
+        for key in keys:
+            for kind, amount in (("requests", 1.0), ("tokens", tokens)):
+                bucket = self._bucket(kind, key)
+                if bucket is None or (kind == "tokens" and not amount):
+                    continue
+                # A request bigger than the whole budget would never fit; it waits out the debt instead
+                needed = bucket.reserve(min(amount, bucket.capacity), max_wait)
+                if needed is None:
+                    retry_after = bucket.wait_time(min(amount, bucket.capacity))
+                    for done, done_amount in taken:
+                        done.adjust(-done_amount)
+                    raise RateLimitExceeded(
+                        f"Rate limit for {key[0]} '{key[1]}' ({bucket.per_minute:g} {kind}/min) "
+                        f"needs a {retry_after:.1f}s wait, more than {max_wait:g}s", retry_after)
+                bucket.adjust(amount - min(amount, bucket.capacity))
+                taken.append((bucket, amount))
+                wait = max(wait, needed)
+        self.waited += wait
+        return wait
+
+    def acquire(self, keys: Iterable[Key], tokens: float = 0, timeout: Optional[float] = None) -> float:
+        """Block until one request (and `tokens` of budget) is free for every key; returns seconds waited"""
+        if not self.enabled:
+            return 0.0
+        wait = self._reserve(list(keys), tokens, timeout)
+        if wait:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, keys: Iterable[Key], tokens: float = 0, timeout: Optional[float] = None) -> float:
+        """`acquire` for coroutines: sleeps without blocking the event loop"""
+        if not self.enabled:
+            return 0.0
+        wait = self._reserve(list(keys), tokens, timeout)
+        if wait:
+            await asyncio.sleep(wait)
+        return wait
+
+    def record_usage(self, keys: Iterable[Key], tokens: float, reserved: float = 0):
+        """Settle token budgets with the tokens actually used, given what `acquire` reserved"""
+        if not self.enabled or tokens == reserved:
+            return
+        for key in keys:
+            bucket = self._bucket("tokens", key)
+            if bucket is not None:
+                bucket.adjust(tokens - reserved)
+
+    def backoff(self, keys: Iterable[Key], seconds: float):
+        """The server rejected a request (429): hold every caller of these keys back for `seconds`"""
+        for key in keys:
+            for kind in ("requests", "tokens"):
+                bucket = self._bucket(kind, key)
+                if bucket is not None:
+                    bucket.pause(seconds)
+            # Unlimited keys have no bucket to pause; a deadline stands in for one
+            if self._bucket("requests", key) is None:
+                with self._lock:
+                    self._paused_until[key] = max(self._paused_until.get(key, 0.0), time.monotonic() + seconds)
+
+    def stats(self) -> Dict[str, Any]:
+        """Remaining capacity of every limited key"""
+        return {
+            "enabled": self.enabled,
+            "waited_seconds": round(self.waited, 3),
+            "paused": {f"{scope}:{name}": round(until - time.monotonic(), 1)
+                       for (scope, name), until in list(self._paused_until.items()) if until > time.monotonic()},
+            "buckets": {f"{scope}:{name} {kind}": {"per_minute": bucket.per_minute, "available": round(bucket.level, 1)}
+                        for (kind, scope, name), bucket in list(self._buckets.items()) if bucket is not None},
+        }
+
+
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide limiter built from [rate_limits]"""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = RateLimiter()
+    return _rate_limiter
+
@@ -0,0 +1,197 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/backend/llms/resilience.ipynb.
+
+# %% auto 0
+__all__ = ['RETRYABLE_STATUS', 'is_retryable', 'retry_after', 'PrimedStream', 'ResilientCaller']
+
+# %% ../../nbs/buddy/backend/llms/resilience.ipynb 1
+import time
+import random
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import openai
+
+from ..configs.loader import get_resilience_config
+from .rate_limiter import RateLimitExceeded
+from ..core.metrics import get_metrics
+
+
+# %% ../../nbs/buddy/backend/llms/resilience.ipynb 2
+RETRYABLE_STATUS = {408, 409, 425, 429, 500, 502, 503, 504}
+
+
+def is_retryable(error: Exception) -> bool:
+    """Transient failures worth another attempt: timeouts, dropped connections, 408/409/429 and 5xx"""
+    if isinstance(error, RateLimitExceeded):
+        return False  # Our own limiter already decided the wait is too long
+    status = getattr(error, "status_code", None)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    if isinstance(error, (openai.APIConnectionError, TimeoutError, ConnectionError)):
+        return True
+    # Transport errors raised while reading a stream (httpx is only a dependency of the SDK)
+    return any(cls.__name__ in ("TransportError", "TimeoutException") for cls in type(error).__mro__)
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """Seconds the server asked us to wait, if it said"""
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class PrimedStream:
+    """A stream whose first chunk has already been read; iterates it, then the rest"""
+
+    def __init__(self, response: Any, first: Any, rest: Iterator):
+        self.response = response
+        self.first = first
+        self._rest = rest
+
+    def __iter__(self):
+        if self.first is not None:
+            yield self.first
+        yield from self._rest
+
+    def close(self):
+        close = getattr(self.response, "close", None)
+        if close:
+            close()
+
+    def __getattr__(self, name):
+        return getattr(self.response, name)
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _hedge_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="llm-hedge")
+    return _executor
+
+
+class ResilientCaller:
+    """Retries, deadlines and hedging around one completion request.
+
+    `call(send, targets, stream)` sends through `send(target, timeout)` and
+    returns `(response, target)` once the first token (or the whole non-streamed
+    response) has arrived; failures after that belong to the caller. Failures
+    before it are classified by `is_retryable`: transient ones are retried with
+    full-jitter exponential backoff (or the server's Retry-After), anything else
+    is raised at once, and no attempt starts past the request deadline.
+
+    With hedging on and a second target, an attempt that has produced nothing
+    after the `hedge_percentile` of recent time-to-first-token (or
+    `hedge_delay_seconds` until there are enough samples) races a copy of the
+    request on the next target; the loser is closed and handed to `discard`.
+    """
+
+    MIN_SAMPLES = 20
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        config = config if config is not None else get_resilience_config()
+        self.max_attempts = max(1, config.get('max_attempts', 3))
+        self.backoff_base = config.get('backoff_base_seconds', 0.5)
+        self.backoff_max = config.get('backoff_max_seconds', 8.0)
+        self.deadline = config.get('deadline_seconds', 300.0)
+        self.hedge = config.get('hedge', False)
+        self.hedge_percentile = config.get('hedge_percentile', 95.0)
+        self.hedge_delay_seconds = config.get('hedge_delay_seconds', 2.0)
+        self.first_token_times: deque = deque(maxlen=200)
+        self.stats = Counter()
+
+    def backoff(self, attempt: int, error: Exception) -> float:
+        """Wait before retry `attempt` (1-based)"""
+        asked = retry_after(error)
+        if asked is not None:
+            return min(asked, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    def hedge_delay(self) -> float:
+        """Time to wait for a first token before hedging"""
+        if len(self.first_token_times) < self.MIN_SAMPLES:
+            return self.hedge_delay_seconds
+        times = sorted(self.first_token_times)
+        return times[min(len(times) - 1, int(len(times) * self.hedge_percentile / 100))]
+
+    def call(self, send: Callable[[Any, float], Any], targets: List[Any], stream: bool,
+             discard: Optional[Callable[[Any], None]] = None) -> Tuple[Any, Any]:
+        deadline = time.monotonic() + self.deadline
+        attempt = 0
+        while True:
+            attempt += 1
+            self.stats["attempts"] += 1
+            # Rotate so a retry starts on another replica when there is one
+            order = targets[(attempt - 1) % len(targets):] + targets[:(attempt - 1) % len(targets)]
+            try:
+                return self._attempt(send, order, stream, deadline, discard)
+            except Exception as e:
+                if not is_retryable(e) or attempt >= self.max_attempts:
+                    raise
+                delay = self.backoff(attempt, e)
+                if time.monotonic() + delay >= deadline:
+                    raise
+                self.stats["retries"] += 1
+                get_metrics().add("llm_retries")
+                time.sleep(delay)
+
+    def _first(self, send: Callable[[Any, float], Any], target: Any, stream: bool, deadline: float) -> Tuple[Any, Any]:
+        """Send one request and wait for its first chunk"""
+        started = time.monotonic()
+        timeout = max(deadline - started, 0.001)
+        response = send(target, timeout)
+        if stream:
+            chunks = iter(response)
+            response = PrimedStream(response, next(chunks, None), chunks)
+        self.first_token_times.append(time.monotonic() - started)
+        return response, target
+
+    def _attempt(self, send: Callable[[Any, float], Any], targets: List[Any], stream: bool, deadline: float,
+                 discard: Optional[Callable[[Any], None]] = None) -> Tuple[Any, Any]:
+        if not self.hedge or len(targets) < 2:
+            return self._first(send, targets[0], stream, deadline)
+
+        executor = _hedge_executor()
+        pending = {executor.submit(self._first, send, targets[0], stream, deadline)}
+        done, pending = wait(pending, timeout=min(self.hedge_delay(), max(deadline - time.monotonic(), 0)))
+        if not done:
+            self.stats["hedges"] += 1
+            get_metrics().add("llm_hedges")
+            pending.add(executor.submit(self._first, send, targets[1], stream, deadline))
+        winner, error = None, None
+        while winner is None and (done or pending):
+            if not done:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            future = done.pop()
+            if future.exception() is not None:
+                error = future.exception()
+            else:
+                winner = future.result()
+        for future in done | pending:
+            future.add_done_callback(lambda future: _close_loser(future, discard))
+        if winner is None:
+            raise error
+        if winner[1] is not targets[0]:
+            self.stats["hedge_wins"] += 1
+        return winner
+
+
+def _close_loser(future, discard: Optional[Callable[[Any], None]] = None):
+    """Release the connection of a hedged request that lost the race"""
+    if future.exception() is None:
+        response, target = future.result()
+        close = getattr(response, "close", None)
+        if close:
+            close()
+        # A failed attempt was already released by its sender
+        if discard:
+            discard(target)
+
@@ -0,0 +1,241 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/backend/llms/response_cache.ipynb.
+
+# %% auto 0
+__all__ = ['VOLATILE_PARAMS', 'HASH_DIMS', 'request_keys', 'prompt_text', 'hashed_embedding', 'replay_response', 'replay_stream',
+           'ResponseCache', 'get_response_cache']
+
+# %% ../../nbs/buddy/backend/llms/response_cache.ipynb 1
+import os
+import re
+import json
+import math
+import time
+import sqlite3
+import hashlib
+from array import array
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..configs.loader import get_response_cache_config
+
+
+# %% ../../nbs/buddy/backend/llms/response_cache.ipynb 2
+# Transport and delivery options that do not change the answer
+VOLATILE_PARAMS = {"stream", "stream_options", "timeout", "extra_headers"}
+HASH_DIMS = 512
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def request_keys(params: Dict[str, Any]) -> Tuple[str, str]:
+    """(exact key, scope): hash of the whole request, and of everything but the messages"""
+    stable = {k: v for k, v in params.items() if k not in VOLATILE_PARAMS}
+    scope = {k: v for k, v in stable.items() if k != "messages"}
+    return (hashlib.sha256(_canonical(stable).encode()).hexdigest(),
+            hashlib.sha256(_canonical(scope).encode()).hexdigest())
+
+
+def prompt_text(messages: List[Dict[str, Any]]) -> str:
+    """The text semantic lookups compare: every message, role first"""
+    return "\n".join(f"{m.get('role')}: {m.get('content') or ''}" for m in messages)
+
+
+def hashed_embedding(text: str, dims: int = HASH_DIMS) -> List[float]:
+    """Local bag-of-words vector (unigrams and bigrams hashed into `dims`), L2-normalized"""
+    words = re.findall(r"\w+", text.lower())
+    vector = [0.0] * dims
+    for token in words + [f"{a} {b}" for a, b in zip(words, words[1:])]:
+        digest = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), "big")
+        vector[digest % dims] += 1.0 if digest >> 63 else -1.0
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def _normalized(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def _usage_dict(usage: Any) -> Optional[Dict[str, int]]:
+    if usage is None:
+        return None
+    if isinstance(usage, dict):
+        return usage
+    return {name: getattr(usage, name, None) for name in ("prompt_tokens", "completion_tokens", "total_tokens")}
+
+
+def replay_response(cached: Dict[str, Any]) -> SimpleNamespace:
+    """A cached result shaped like a non-streamed ChatCompletion"""
+    tool_calls = [SimpleNamespace(id=call.get("id", ""), type=call.get("type", "function"),
+                                  function=SimpleNamespace(**call["function"]))
+                  for call in cached.get("tool_calls") or []]
+    message = SimpleNamespace(role="assistant", content=cached.get("content", ""), tool_calls=tool_calls or None, reasoning=None)
+    usage = cached.get("usage")
+    return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason=cached.get("finish_reason"))],
+                           usage=SimpleNamespace(**usage) if usage else None, model=cached.get("model"))
+
+
+def replay_stream(cached: Dict[str, Any]) -> Iterator[SimpleNamespace]:
+    """A cached result as a synthetic chunk stream, word by word, like a streamed ChatCompletion"""
+    def chunk(content=None, tool_calls=None, finish_reason=None):
+        delta = SimpleNamespace(role="assistant", content=content, tool_calls=tool_calls, reasoning=None)
+        return SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)], usage=None,
+                               model=cached.get("model"))
+
+    for piece in re.findall(r"\s*\S+\s*|\s+", cached.get("content") or ""):
+        yield chunk(content=piece)
+    for index, call in enumerate(cached.get("tool_calls") or []):
+        yield chunk(tool_calls=[SimpleNamespace(index=index, id=call.get("id", ""), type="function",
+                                                function=SimpleNamespace(**call["function"]))])
+    yield chunk(finish_reason=cached.get("finish_reason") or "stop")
+    if cached.get("usage"):
+        yield SimpleNamespace(choices=[], usage=SimpleNamespace(**cached["usage"]), model=cached.get("model"))
+
+
+class ResponseCache:
+    """SQLite cache of completed LLM responses.
+
+    Exact mode keys a response by a hash of the model, messages, tools and
+    sampling parameters (transport options like `stream` and `timeout` are
+    left out), so a streamed and a non-streamed call share entries. Semantic
+    mode additionally reuses the response of the most similar earlier prompt
+    with identical tools and parameters, when the cosine similarity of their
+    embeddings reaches `threshold`; embeddings come from `embed` (e.g. the
+    model server's embedding endpoint) or local hashed word vectors.
+
+    Entries expire after `ttl_seconds`; beyond `max_entries` or `max_bytes`
+    the least recently used are evicted. One connection per call, so it is
+    safe to use from worker threads.
+    """
+
+    def __init__(self, path: Optional[str] = None, mode: Optional[str] = None,
+                 embed: Optional[Callable[[str], List[float]]] = None, config: Optional[Dict[str, Any]] = None):
+        config = config if config is not None else get_response_cache_config()
+        self.mode = mode or config.get('mode', 'exact')
+        self.enabled = self.mode in ("exact", "semantic")
+        self.path = os.path.expanduser(path or config.get('path') or "~/.agentic/responses.sqlite")
+        self.max_entries = config.get('max_entries', 5000)
+        self.max_bytes = int(config.get('max_mb', 200.0) * 1024 * 1024)
+        self.ttl_seconds = config.get('ttl_hours', 24.0) * 3600
+        self.max_temperature = config.get('max_temperature', 0.0)
+        self.threshold = config.get('similarity_threshold', 0.95)
+        self.embed = embed or hashed_embedding
+        self.hits = self.misses = 0
+        if self.enabled:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with self._connect() as db:
+                db.execute("""CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY, scope TEXT, embedding BLOB, response TEXT,
+                    size INTEGER, created REAL, last_used REAL, hits INTEGER DEFAULT 0)""")
+                db.execute("CREATE INDEX IF NOT EXISTS idx_responses_scope ON responses(scope)")
+                db.execute("CREATE INDEX IF NOT EXISTS idx_responses_used ON responses(last_used)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5)
+
+    def cacheable(self, params: Dict[str, Any]) -> bool:
+        """Whether a request may be answered from (and stored in) the cache: only ones that ask for a
+        temperature at most `max_temperature`. Without one the server samples at its default, and
+        callers retrying for a fresh answer must not get the old one back"""
+        temperature = params.get("temperature")
+        return self.enabled and temperature is not None and temperature <= self.max_temperature
+
+    def lookup(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Cached result for a request: exact match first, then (semantic mode) the most similar prompt"""
+        if not self.cacheable(params):
+            return None
+        key, scope = request_keys(params)
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute("SELECT key, response FROM responses WHERE key = ? AND created >= ?",
+                             (key, now - self.ttl_seconds)).fetchone()
+            if row is None and self.mode == "semantic":
+                row = self._nearest(db, scope, params["messages"], now)
+            if row is None:
+                self.misses += 1
+                return None
+            db.execute("UPDATE responses SET hits = hits + 1, last_used = ? WHERE key = ?", (now, row[0]))
+        self.hits += 1
+        return json.loads(row[1])
+
+    def _nearest(self, db: sqlite3.Connection, scope: str, messages: List[Dict[str, Any]], now: float) -> Optional[Tuple[str, str]]:
+        query = _normalized(self.embed(prompt_text(messages)))
+        best, best_score = None, self.threshold
+        for key, blob in db.execute("SELECT key, embedding FROM responses WHERE scope = ? AND created >= ? AND embedding IS NOT NULL",
+                                    (scope, now - self.ttl_seconds)):
+            vector = array("f")
+            vector.frombytes(blob)
+            if len(vector) != len(query):
+                continue
+            score = sum(a * b for a, b in zip(query, vector))
+            if score >= best_score:
+                best, best_score = key, score
+        if best is None:
+            return None
+        return best, db.execute("SELECT response FROM responses WHERE key = ?", (best,)).fetchone()[0]
+
+    def store(self, params: Dict[str, Any], result: Dict[str, Any]):
+        """Keep a completed result; partial, failed or empty ones are skipped"""
+        if not self.cacheable(params) or result.get("error"):
+            return
+        if result.get("finish_reason") not in ("stop", "tool_calls") or not (result.get("content") or result.get("tool_calls")):
+            return
+        key, scope = request_keys(params)
+        response = json.dumps({"content": result.get("content", ""), "tool_calls": result.get("tool_calls") or [],
+                               "finish_reason": result.get("finish_reason"), "model": result.get("model"),
+                               "usage": _usage_dict(result.get("usage"))})
+        embedding = None
+        if self.mode == "semantic":
+            embedding = array("f", _normalized(self.embed(prompt_text(params["messages"])))).tobytes()
+        now = time.time()
+        with self._connect() as db:
+            db.execute("INSERT OR REPLACE INTO responses (key, scope, embedding, response, size, created, last_used) "
+                       "VALUES (?, ?, ?, ?, ?, ?, ?)", (key, scope, embedding, response, len(response), now, now))
+            self._evict(db, now)
+
+    def _evict(self, db: sqlite3.Connection, now: float):
+        """Drop expired entries, then least recently used ones beyond the size bounds"""
+        db.execute("DELETE FROM responses WHERE created < ?", (now - self.ttl_seconds,))
+        count, size = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        excess_rows = max(0, count - self.max_entries)
+        excess_bytes = size - self.max_bytes
+        removed_rows = removed_bytes = 0
+        victims = []
+        for key, entry_size in db.execute("SELECT key, size FROM responses ORDER BY last_used"):
+            if removed_rows >= excess_rows and removed_bytes >= excess_bytes:
+                break
+            victims.append((key,))
+            removed_rows += 1
+            removed_bytes += entry_size
+        db.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+    def clear(self) -> int:
+        """Drop every cached response; returns rows removed"""
+        if not self.enabled:
+            return 0
+        with self._connect() as db:
+            return db.execute("DELETE FROM responses").rowcount
+
+    def stats(self) -> dict:
+        if not self.enabled:
+            return {"mode": self.mode, "enabled": False}
+        with self._connect() as db:
+            count, size, hits = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hits), 0) FROM responses").fetchone()
+        return {"mode": self.mode, "enabled": True, "path": self.path, "entries": count, "bytes": size,
+                "hits": hits, "session_hits": self.hits, "session_misses": self.misses}
+
+
+_response_cache = None
+
+
+def get_response_cache(embed: Optional[Callable[[str], List[float]]] = None) -> ResponseCache:
+    """Process-wide cache built from [response_cache]; `embed` only matters on first use"""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache(embed=embed)
+    return _response_cache
+
@@ -7,7 +7,7 @@ __all__ = ['RESET', 'reasoning_config', 'show_thinking', 'thinking_color', 'colo
 # %% ../../nbs/buddy/backend/llms/streaming_handler.ipynb 1
 import re
 import json
-from typing import Dict, Any, Optional, Iterator
+from typing import Dict, Any, Optional, Iterator, Callable
 from rich.console import Console
 from rich.markdown import Markdown
 from ..configs.loader import get_reasoning_config
@@ -31,15 +31,15 @@ color_codes = {
 
 
 color_code = color_codes.get(thinking_color.lower(), color_codes['green'])   
-def show_thinking_header():
+def show_thinking_header(file=None):
     """Display beautiful thinking header"""
     if show_thinking:
-        print(f"\n{color_code}╭─────────────────────── 🤔 Thinking ───────────────────────╮{RESET}")
+        print(f"\n{color_code}╭─────────────────────── 🤔 Thinking ───────────────────────╮{RESET}", file=file)
 
-def show_thinking_footer():
+def show_thinking_footer(file=None):
     """Display beautiful thinking footer"""
     if show_thinking:
-        print(f"\n{color_code}╰────────────────────────────────────────────────────────────╯{RESET}")
+        print(f"\n{color_code}╰────────────────────────────────────────────────────────────╯{RESET}", file=file)
 
 # %% ../../nbs/buddy/backend/llms/streaming_handler.ipynb 3
 class StreamingHandler:
@@ -48,10 +48,20 @@ class StreamingHandler:
     def __init__(self):
         self.console = Console()
     
-    def handle_streaming_response(self, response: Iterator, console: Optional[Console] = None) -> Dict[str, Any]:
-        """Handle streaming response"""
+    def handle_streaming_response(self, response: Iterator, console: Optional[Console] = None,
+                                  stop_when: Optional[Callable[[str], bool]] = None,
+                                  output_filter: Optional[Any] = None) -> Dict[str, Any]:
+        """Handle streaming response.
+
+        `stop_when` gets each new piece of content and ends the stream by
+        returning True. `output_filter` (a StreamingOutputFilter) sees the
+        answer text before it is printed or kept; it may redact it or halt
+        the stream.
+        """
         if console is None:
             console = self.console
+        # Raw prints follow the console, so a buffered console captures the whole turn
+        out = console.file
         
         
         full_content = ""
@@ -62,17 +72,36 @@ class StreamingHandler:
         markdown_buffer = ""
         markdown_line_buffer = ""
         think_started = False
+        fed = 0
+        stopped = False
+        usage = None
+        finish_reason = None
+        
+        def admit(text):
+            """Answer text cleared by the output filter (held-back text comes out later)"""
+            return output_filter.feed(text) if output_filter is not None else text
+        
+        def should_stop():
+            """Feed content received since the last call to stop_when"""
+            nonlocal fed, stopped
+            if output_filter is not None and output_filter.halted:
+                return True
+            if stop_when is None or len(full_content) == fed:
+                return False
+            new_content, fed = full_content[fed:], len(full_content)
+            stopped = bool(stop_when(new_content))
+            return stopped
         
         def show_thinking_content(content):
             nonlocal think_started
             if show_thinking:
                 if not think_started:
-                    show_thinking_header()
-                    print(f"{color_code}│ ", end="", flush=True)
+                    show_thinking_header(out)
+                    print(f"{color_code}│ ", end="", flush=True, file=out)
                     think_started = True
                 
                 # enhanced_content = render_math_in_thinking(content)
-                print(f"{color_code}{content}{RESET}", end="", flush=True)
+                print(f"{color_code}{content}{RESET}", end="", flush=True, file=out)
             return think_started
     
         def flush_markdown_line():
@@ -82,10 +111,14 @@ class StreamingHandler:
                 try:
                     console.print(Markdown(markdown_line_buffer.strip()))
                 except:
-                    print(markdown_line_buffer.strip())
+                    print(markdown_line_buffer.strip(), file=out)
                 markdown_line_buffer = ""
         try:
             for chunk in response:
+                # With stream_options include_usage the last chunk carries usage and no choices
+                usage = getattr(chunk, 'usage', None) or usage
+                if chunk.choices:
+                    finish_reason = chunk.choices[0].finish_reason or finish_reason
                 if chunk.choices and chunk.choices[0].delta:
                     delta = chunk.choices[0].delta
         
@@ -101,12 +134,15 @@ class StreamingHandler:
                             in_think_tag = True
                             parts = content.split('<think>')
                             if parts[0]:
-                                markdown_line_buffer += parts[0]
-                                full_content += parts[0]
+                                text = admit(parts[0])
+                                markdown_line_buffer += text
+                                full_content += text
                             flush_markdown_line()
                             think_buffer = parts[1] if len(parts) > 1 else ""
                             if think_buffer:
                                 think_started = show_thinking_content(think_buffer)
+                            if should_stop():
+                                break
                             continue
         
                         if '</think>' in content:
@@ -116,14 +152,17 @@ class StreamingHandler:
                                 think_buffer += parts[0]
                                 think_started = show_thinking_content(parts[0])
                             if think_started:
-                                print(f"{color_code} │{RESET}")
-                                show_thinking_footer()
+                                print(f"{color_code} │{RESET}", file=out)
+                                show_thinking_footer(out)
                                 think_started = False
                             think_buffer = ""
                             if len(parts) > 1:
-                                markdown_line_buffer += parts[1]
-                                full_content += parts[1]
+                                text = admit(parts[1])
+                                markdown_line_buffer += text
+                                full_content += text
                                 flush_markdown_line()
+                            if should_stop():
+                                break
                             continue
                         
         
@@ -133,9 +172,12 @@ class StreamingHandler:
                             
                         else:
                             
-                            markdown_line_buffer += content
-                            full_content += content
+                            text = admit(content)
+                            markdown_line_buffer += text
+                            full_content += text
                             flush_markdown_line()
+                            if should_stop():
+                                break
         
                         if first_token:
                             first_token = False
@@ -160,17 +202,31 @@ class StreamingHandler:
                                     if tool_call_delta.function.arguments:
                                         current_tool_call["function"]["arguments"] += tool_call_delta.function.arguments
         
+            halted = output_filter is not None and output_filter.halted
+            if stopped or halted:
+                # Nothing more is needed - release the connection instead of draining it
+                close = getattr(response, 'close', None)
+                if close:
+                    close()
+            if output_filter is not None and not halted:
+                text = output_filter.flush()
+                markdown_line_buffer += text
+                full_content += text
+        
             # Flush any remaining markdown
             if markdown_line_buffer.strip():
                 try:
                     console.print(Markdown(markdown_line_buffer.strip()))
                 except:
-                    print(markdown_line_buffer.strip())
+                    print(markdown_line_buffer.strip(), file=out)
+            if halted:
+                console.print(f"[red]⛔ Output halted by guardrails ({', '.join(sorted(output_filter.rules_fired))})[/red]")
         
             return {"content": full_content,
                     "tool_calls": tool_calls, 
-                    "finish_reason":chunk.choices[0].finish_reason,
-                    "usage": getattr(response, 'usage', None),
+                    "finish_reason": "guardrail" if halted else "stop_when" if stopped else finish_reason,
+                    "guardrail_rules": sorted(output_filter.rules_fired) if output_filter is not None else [],
+                    "usage": usage or getattr(response, 'usage', None),
                     "model": getattr(response, 'model', None)}
         except Exception as e:
             console.print(f"[red]Error processing response: {e}[/red]")
@@ -0,0 +1,214 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/buddy/frontend/router.ipynb.
+
+# %% auto 0
+__all__ = ['CLASSIFIER_LABELS', 'SEED_EXAMPLES', 'Route', 'RequestRouter']
+
+# %% ../nbs/buddy/frontend/router.ipynb 1
+import os
+import re
+import json
+import math
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .configs.loader import get_router_config
+
+
+# %% ../nbs/buddy/frontend/router.ipynb 2
+@dataclass
+class Route:
+    target: str  # "fs_read", "execute_bash", "planner", "debate" or "agent" (full LLM loop)
+    confidence: float
+    source: str  # "rule", "classifier" or "default"
+    arguments: Dict[str, Any] = field(default_factory=dict)
+
+
+# Labels the classifier can predict; tool routes need arguments, so only rules produce them
+CLASSIFIER_LABELS = ("planner", "debate", "agent")
+
+SEED_EXAMPLES = [
+    ("build a todo web app with user login", "planner"),
+    ("create a REST API for an inventory service", "planner"),
+    ("develop a data pipeline that ingests csv files into postgres", "planner"),
+    ("implement a CLI tool to sync two folders", "planner"),
+    ("design and build a dashboard for sales metrics", "planner"),
+    ("scaffold a fastapi project with tests and docker", "planner"),
+    ("compare fastapi and flask for a new service", "debate"),
+    ("which is better for analytics, postgres or mongodb", "debate"),
+    ("pros and cons of microservices versus a monolith", "debate"),
+    ("should we use kafka or rabbitmq for events", "debate"),
+    ("trade-offs between rust and go for a cli", "debate"),
+    ("explain what this error means", "agent"),
+    ("what does the client module do", "agent"),
+    ("fix the failing test in utils", "agent"),
+    ("write a haiku about python", "agent"),
+    ("how do I reverse a list in python", "agent"),
+    ("summarize the readme", "agent"),
+]
+
+
+# Rule building blocks: a short noun phrase, and one that may not swallow a preposition
+# or a follow-up instruction ("compare a and b then fix it" is an edit, not a debate)
+_WORD = r"(?!(?:and|then|to|fix|add|update|change|remove|delete|write|run|make)\b)[\w.+#/-]+"
+_TERM = rf"{_WORD}(?:\s+{_WORD}){{0,2}}"
+_NOUN = r"(?!(?:for|in|of|on|to|the|that|with|from|into)\b)[\w.+#/-]+"
+_PURPOSE = r"(?:\s+for\s+[\w\s.,-]{1,40}?)?\s*[?.!]?"
+_PROJECT = r"(?:app|application|service|api|system|platform|website|pipeline|project|dashboard|bot)"
+
+
+def _existing_path(path: Optional[str]) -> Optional[str]:
+    path = os.path.expanduser(path or ".")
+    return path if os.path.exists(path) else None
+
+
+def _tokens(text: str) -> List[str]:
+    words = re.findall(r"[a-z0-9]+", text.lower())
+    return words + [f"{a}_{b}" for a, b in zip(words, words[1:])]
+
+
+class RequestRouter:
+    """Routes requests locally when the answer is obvious, without an LLM call.
+
+    Two tiers, cheapest first:
+    - compiled rules for unambiguous shapes ("$ cmd", "list files in src",
+      "compare X and Y", "build a ... app"); tool rules only fire when the
+      referenced path exists
+    - a TF-IDF nearest-neighbour classifier over seed examples plus logged
+      requests, choosing between planner, debate and the general agent
+
+    `route` returns target "agent" when nothing is confident; callers compare
+    `confidence` against `threshold` and fall back to the LLM below it.
+    Requests answered by the LLM are logged with the path it took (`record`),
+    which becomes training data for the classifier.
+    """
+
+    def __init__(self, threshold: Optional[float] = None, log_path: Optional[str] = None,
+                 max_examples: Optional[int] = None, k: int = 5):
+        config = get_router_config()
+        self.enabled = config.get('enabled', True)
+        self.threshold = threshold if threshold is not None else config.get('confidence_threshold', 0.75)
+        self.log_path = os.path.expanduser(log_path or config.get('log_path') or "~/.agentic/routes.jsonl")
+        self.max_examples = max_examples or config.get('max_examples', 2000)
+        self.k = k
+        self.rules: List[Tuple[re.Pattern, str, float, Callable[[re.Match], Optional[Dict[str, Any]]]]] = [
+            (re.compile(r"^\s*[$!]\s*(?P<command>.+)$"), "execute_bash", 1.0,
+             lambda m: {"command": m["command"].strip()}),
+            (re.compile(r"^(?P<command>(?:ls|pwd|whoami|uname|git\s+(?:status|log|diff|branch))\b[^?]*)$"),
+             "execute_bash", 0.9, lambda m: {"command": m["command"].strip()} if len(m["command"].split()) <= 8 else None),
+            (re.compile(r"^(?:please\s+)?(?:list|show)(?:\s+me)?\s+(?:all\s+)?(?:the\s+)?(?:files|contents)"
+                        r"(?:\s+(?:in|under|of)\s+(?P<path>[\w./~-]+))?\s*$", re.I),
+             "fs_read", 0.95, lambda m: self._fs_args("discover", m["path"])),
+            (re.compile(r"^(?:find|search(?:\s+for)?|grep(?:\s+for)?)\s+['\"]?(?P<query>[^'\"]+?)['\"]?\s+in\s+(?P<path>[\w./~-]+)\s*$", re.I),
+             "fs_read", 0.9, lambda m: self._fs_args("extract", m["path"], m["query"])),
+            (re.compile(r"^(?:read|show|open|cat|view|print)\s+(?:me\s+)?(?:the\s+)?(?:file\s+)?(?P<path>[\w./~-]+\.\w+)\s*$", re.I),
+             "fs_read", 0.95, lambda m: self._fs_args("extract", m["path"], ".")),
+            # The whole request must be the comparison: "compare fastapi and flask for a new service"
+            (re.compile(rf"^(?:please\s+)?(?:compare|(?:what are the\s+)?(?:pros and cons|trade-?offs?)\s+(?:of|between))\s+"
+                        rf"{_TERM}\s+(?:and|or|vs\.?|versus|with)\s+{_TERM}{_PURPOSE}$", re.I),
+             "debate", 0.85, lambda m: {}),
+            (re.compile(rf"^(?:{_TERM}\s+(?:vs\.?|versus)\s+{_TERM}|which is better(?:\s+for\s+{_TERM})?[,:]?\s+{_TERM}\s+or\s+{_TERM})"
+                        rf"{_PURPOSE}$", re.I),
+             "debate", 0.85, lambda m: {}),
+            # A new project, not a change to one: "build a todo web app with user login"
+            (re.compile(rf"^(?:please\s+)?(?:(?:design|plan)\s+and\s+)?(?:build|create|develop|implement|design|scaffold)\s+"
+                        rf"(?:me\s+)?(?:a|an)\s+(?:{_NOUN}\s+){{0,3}}{_PROJECT}\b(?:\s+(?:for|that|with|which|to|using|in)\b.*)?$", re.I),
+             "planner", 0.85, lambda m: {}),
+        ]
+        self._examples: List[Tuple[str, str]] = list(SEED_EXAMPLES) + self._load_log()
+        self._index = None
+
+    @staticmethod
+    def _fs_args(mode: str, path: Optional[str], query: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        path = _existing_path(path)
+        if path is None:
+            return None
+        operation = {"mode": mode, "path": path}
+        if query:
+            operation["query"] = query
+        return {"operations": [operation]}
+
+    def route(self, request: str) -> Route:
+        """Best local route for a request"""
+        text = request.strip()
+        if not self.enabled or not text:
+            return Route("agent", 0.0, "default")
+        for pattern, target, confidence, build in self.rules:
+            match = pattern.search(text)
+            if match:
+                arguments = build(match)
+                if arguments is not None:
+                    return Route(target, confidence, "rule", arguments)
+        label, confidence = self.classify(text)
+        return Route(label, confidence, "classifier")
+
+    def _train(self):
+        docs = [Counter(_tokens(text)) for text, _ in self._examples]
+        df = Counter(token for doc in docs for token in doc)
+        n = len(docs)
+        self._idf = {token: math.log((1 + n) / (1 + count)) + 1 for token, count in df.items()}
+        self._index = [(self._vector(doc), label) for doc, (_, label) in zip(docs, self._examples)]
+
+    def _vector(self, counts: Counter) -> Dict[str, float]:
+        vector = {token: count * self._idf.get(token, 0.0) for token, count in counts.items()}
+        norm = math.sqrt(sum(v * v for v in vector.values())) or 1.0
+        return {token: v / norm for token, v in vector.items() if v}
+
+    def classify(self, text: str) -> Tuple[str, float]:
+        """Label and confidence: weighted k-NN vote share scaled by the best similarity"""
+        if self._index is None:
+            self._train()
+        query = self._vector(Counter(_tokens(text)))
+        scored = sorted(
+            ((sum(weight * vector.get(token, 0.0) for token, weight in query.items()), label) for vector, label in self._index),
+            reverse=True
+        )[:self.k]
+        votes = defaultdict(float)
+        for similarity, label in scored:
+            votes[label] += similarity
+        total = sum(votes.values())
+        if not total:
+            return "agent", 0.0
+        label = max(votes, key=votes.get)
+        best = max(similarity for similarity, l in scored if l == label)
+        return label, round(votes[label] / total * min(1.0, best / 0.6), 3)
+
+    def record(self, request: str, target: str):
+        """Log how a request was actually handled, as training data"""
+        if not self.enabled or target not in CLASSIFIER_LABELS:
+            return
+        self._examples.append((request.strip(), target))
+        self._index = None
+        try:
+            os.makedirs(os.path.dirname(self.log_path) or ".", exist_ok=True)
+            with open(self.log_path, "a") as f:
+                f.write(json.dumps({"request": request.strip(), "route": target}) + "\n")
+        except OSError:
+            pass  # Logging is best effort
+
+    def _load_log(self) -> List[Tuple[str, str]]:
+        """Recent logged requests; also accepts backlog-style lines with a "title" or "body" and a "route" """
+        if not os.path.exists(self.log_path):
+            return []
+        examples = []
+        with open(self.log_path) as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                text = entry.get("request") or entry.get("title") or entry.get("body")
+                if text and entry.get("route") in CLASSIFIER_LABELS:
+                    examples.append((text, entry["route"]))
+        return examples[-self.max_examples:]
+
+    @staticmethod
+    def label_from_tool_calls(tool_calls: List[Dict]) -> str:
+        """Route label for a request the LLM handled, from the tools it called"""
+        names = {call.get("function", {}).get("name") for call in tool_calls or []}
+        if names & {"planner", "task_planner"}:
+            return "planner"
+        if names & {"debate", "debate_agent"}:
+            return "debate"
+        return "agent"
+
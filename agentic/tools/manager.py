@@ -8,6 +8,11 @@ from typing import Dict, List, Any, Optional
 
 from .base import BaseTool
 from .registry import ToolRegistry
+from .plugins import ToolPluginLoader
+from .selector import ToolSelector
+from ..configs.loader import get_tools_config
+from ..llms.rate_limiter import RateLimitExceeded, get_rate_limiter
+from ..core.metrics import get_metrics
 from .fs_read import FsReadTool
 from .fs_write import FsWriteTool
 from .execute_bash import ExecuteBashTool
@@ -20,9 +25,17 @@ from .planner import PlannerTool
 class ToolManager:
     """Enhanced tool manager"""
     
-    def __init__(self):
+    def __init__(self, load_plugins: Optional[bool] = None):
+        tools_config = get_tools_config()
         self.registry = ToolRegistry()
+        self.plugin_loader = ToolPluginLoader(disabled=tools_config.get('disabled_plugins', []))
+        self.selector = ToolSelector(self.registry)
         self._register_default_tools()
+        
+        if load_plugins is None:
+            load_plugins = tools_config.get('load_plugins', True)
+        if load_plugins:
+            self._register_plugin_tools()
     
     def _register_default_tools(self):
         """Register all default tools"""
@@ -47,13 +60,42 @@ class ToolManager:
         for tool in default_tools:
             self.registry.register_tool(tool)
     
+    def _register_plugin_tools(self):
+        """Register tools published through the `agentic.tools` entry-point group"""
+        for tool in self.plugin_loader.discover():
+            if tool.name in self.registry.tools:
+                # Built-in tools win over plugins with the same name
+                info = self.plugin_loader.plugins.get(tool.name)
+                if info:
+                    info.error = "name conflicts with a registered tool"
+                continue
+            self.registry.register_tool(tool)
+    
+    def get_plugin_report(self) -> List[Dict[str, Any]]:
+        """Get per-plugin discovery and import timings"""
+        return self.plugin_loader.report()
+    
     def get_tools(self, tool_names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Get OpenAI-formatted tools"""
         return self.registry.get_openai_schemas(tool_names)
     
+    def select_tools(self, query: str, top_k: int) -> List[str]:
+        """Get the names of the tools most relevant to a request"""
+        return self.selector.select(query, top_k)
+    
     def execute_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a tool by name"""
-        return self.registry.execute_tool(tool_name, parameters)
+        """Execute a tool by name, waiting first for its rate-limit quota"""
+        try:
+            get_rate_limiter().acquire([("tool", tool_name)])
+        except RateLimitExceeded as e:
+            return {"error": str(e)}
+        with get_metrics().timer("tool_calls"):
+            result = self.registry.execute_tool(tool_name, parameters)
+        if isinstance(result, dict) and result.get("error"):
+            get_metrics().add("tool_errors")
+        if tool_name in self.registry.tools:
+            self.selector.record_usage(tool_name)
+        return result
     
     def list_tools(self) -> List[str]:
         """List all available tool names"""
@@ -0,0 +1,160 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/backend/tools/core/plugins.ipynb.
+
+# %% auto 0
+__all__ = ['logger', 'TOOL_ENTRY_POINT_GROUP', 'ToolPluginInfo', 'LazyPluginTool', 'ToolPluginLoader']
+
+# %% ../../nbs/buddy/backend/tools/core/plugins.ipynb 1
+from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, asdict
+from importlib import import_module
+from importlib.metadata import entry_points
+import time
+import logging
+from .base import BaseTool, ToolMetadata, ToolCategory
+
+logger = logging.getLogger(__name__)
+
+
+# %% ../../nbs/buddy/backend/tools/core/plugins.ipynb 2
+TOOL_ENTRY_POINT_GROUP = "agentic.tools"
+
+
+@dataclass
+class ToolPluginInfo:
+    """Discovery and import-time record for a plugin tool"""
+    name: str
+    entry_point: str
+    distribution: Optional[str] = None
+    metadata_source: str = "spec"  # spec: read from a lightweight spec, import: tool class loaded eagerly
+    discovery_time: float = 0.0
+    import_time: Optional[float] = None
+    loaded: bool = False
+    error: Optional[str] = None
+
+
+def _resolve(target: str) -> Any:
+    """Resolve a 'module:attr' reference"""
+    module_name, _, attr = target.partition(":")
+    obj = import_module(module_name)
+    for part in filter(None, attr.split(".")):
+        obj = getattr(obj, part)
+    return obj
+
+
+def _to_category(value: Any) -> ToolCategory:
+    """Map a spec category string onto ToolCategory"""
+    if isinstance(value, ToolCategory):
+        return value
+    try:
+        return ToolCategory(str(value).lower())
+    except ValueError:
+        return ToolCategory.CUSTOM
+
+
+class LazyPluginTool(BaseTool):
+    """Plugin tool whose implementation is imported on first use.
+
+    Name, description and parameter schema come from the plugin spec, so the tool
+    can be advertised to the LLM without paying the implementation's import cost.
+    """
+
+    def __init__(self, spec: Dict[str, Any], info: ToolPluginInfo):
+        super().__init__(ToolMetadata(
+            name=spec["name"],
+            description=spec["description"],
+            category=_to_category(spec.get("category", "custom")),
+            version=spec.get("version", "1.0.0"),
+            author=spec.get("author"),
+            requires_approval=spec.get("requires_approval", False),
+            is_dangerous=spec.get("is_dangerous", False)
+        ))
+        self.factory = spec["factory"]
+        self.parameters = spec.get("parameters", {"type": "object", "properties": {}})
+        self.info = info
+        self._tool: Optional[BaseTool] = None
+
+    def _load(self) -> BaseTool:
+        """Import and instantiate the implementation (once)"""
+        if self._tool is None:
+            start = time.perf_counter()
+            try:
+                factory = _resolve(self.factory)
+                self._tool = factory()
+            except Exception as e:
+                self.info.error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                self.info.import_time = time.perf_counter() - start
+            self.info.loaded = True
+            logger.debug(f"Loaded plugin tool '{self.name}' in {self.info.import_time * 1000:.1f}ms")
+        return self._tool
+
+    def get_parameters_schema(self) -> Dict[str, Any]:
+        return self.parameters
+
+    def validate_parameters(self, parameters: Dict[str, Any]) -> bool:
+        return self._load().validate_parameters(parameters)
+
+    def execute(self, **kwargs) -> Dict[str, Any]:
+        return self._load().execute(**kwargs)
+
+
+class ToolPluginLoader:
+    """Discovers tools published under the `agentic.tools` entry-point group.
+
+    An entry point may reference either:
+    - a spec dict (preferred) with `name`, `description`, `parameters` and a
+      `factory` ("module:Class"); only the spec module is imported at startup
+    - a BaseTool subclass, which is imported and instantiated eagerly
+    """
+
+    def __init__(self, group: str = TOOL_ENTRY_POINT_GROUP, disabled: Optional[List[str]] = None):
+        self.group = group
+        self.disabled = set(disabled or [])
+        self.plugins: Dict[str, ToolPluginInfo] = {}
+
+    def discover(self) -> List[BaseTool]:
+        """Build tools for every enabled entry point in the group"""
+        tools = []
+        for ep in entry_points(group=self.group):
+            if ep.name in self.disabled:
+                continue
+            info = ToolPluginInfo(
+                name=ep.name,
+                entry_point=ep.value,
+                distribution=ep.dist.name if getattr(ep, "dist", None) else None
+            )
+            self.plugins[ep.name] = info
+            start = time.perf_counter()
+            try:
+                tools.append(self._build_tool(ep, info))
+            except Exception as e:
+                info.error = f"{type(e).__name__}: {e}"
+                logger.warning(f"Skipping tool plugin '{ep.name}' ({ep.value}): {info.error}")
+            finally:
+                info.discovery_time = time.perf_counter() - start
+        return tools
+
+    def _build_tool(self, ep, info: ToolPluginInfo) -> BaseTool:
+        """Turn an entry point into a (possibly lazy) tool instance"""
+        target = ep.load()
+        if isinstance(target, dict):
+            spec = {"name": ep.name, **target}
+            missing = [key for key in ("description", "factory") if not spec.get(key)]
+            if missing:
+                raise ValueError(f"plugin spec missing {', '.join(missing)}")
+            return LazyPluginTool(spec, info)
+
+        # Eager plugin: the entry point *is* the implementation
+        info.metadata_source = "import"
+        tool = target() if isinstance(target, type) else target
+        if not isinstance(tool, BaseTool):
+            raise TypeError(f"entry point must reference a spec dict or BaseTool, got {type(tool).__name__}")
+        info.loaded = True
+        return tool
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Per-plugin discovery/import timings, slowest first"""
+        rows = [asdict(info) for info in self.plugins.values()]
+        return sorted(rows, key=lambda r: (r["discovery_time"] + (r["import_time"] or 0.0)), reverse=True)
+
@@ -0,0 +1,112 @@
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../../nbs/buddy/backend/tools/core/selector.ipynb.
+
+# %% auto 0
+__all__ = ['ToolSelector']
+
+# %% ../../nbs/buddy/backend/tools/core/selector.ipynb 1
+from typing import Dict, List
+from collections import Counter, deque
+import math
+import re
+from .registry import ToolRegistry
+
+
+# %% ../../nbs/buddy/backend/tools/core/selector.ipynb 2
+class ToolSelector:
+    """Ranks registered tools against a request so only the relevant schemas are sent.
+
+    Scoring is BM25 over each tool's name, description and parameter descriptions,
+    plus a decaying boost for tools used in recent turns.
+    """
+
+    def __init__(self, registry: ToolRegistry, k1: float = 1.5, b: float = 0.75,
+                 usage_weight: float = 1.0, usage_decay: float = 0.8, history_size: int = 20):
+        self.registry = registry
+        self.k1 = k1
+        self.b = b
+        self.usage_weight = usage_weight
+        self.usage_decay = usage_decay
+        self.usage_history: deque = deque(maxlen=history_size)
+
+        # Index state, rebuilt whenever the registered tool set changes
+        self._indexed_tools: frozenset = frozenset()
+        self._term_freqs: Dict[str, Counter] = {}
+        self._doc_lengths: Dict[str, int] = {}
+        self._idf: Dict[str, float] = {}
+        self._avg_doc_length: float = 0.0
+
+    @staticmethod
+    def _tokenize(text: str) -> List[str]:
+        """Lowercase word tokens; snake_case names also yield their parts"""
+        tokens = []
+        for word in re.findall(r"[a-z0-9_]+", text.lower()):
+            tokens.append(word)
+            if "_" in word:
+                tokens.extend(part for part in word.split("_") if part)
+        return tokens
+
+    def _tool_document(self, tool) -> str:
+        """Text indexed for a tool"""
+        parts = [tool.name, tool.description]
+        properties = tool.get_parameters_schema().get("properties", {})
+        for param_name, param in properties.items():
+            parts.append(param_name)
+            if isinstance(param, dict):
+                parts.append(str(param.get("description", "")))
+        return " ".join(parts)
+
+    def _ensure_index(self):
+        """(Re)build the BM25 index if tools were registered or removed"""
+        current = frozenset(self.registry.tools)
+        if current == self._indexed_tools:
+            return
+
+        self._term_freqs = {name: Counter(self._tokenize(self._tool_document(tool)))
+                            for name, tool in self.registry.tools.items()}
+        self._doc_lengths = {name: sum(tf.values()) for name, tf in self._term_freqs.items()}
+        self._avg_doc_length = sum(self._doc_lengths.values()) / max(len(self._doc_lengths), 1)
+
+        doc_freq = Counter(term for tf in self._term_freqs.values() for term in tf)
+        n_docs = len(self._term_freqs)
+        self._idf = {term: math.log(1 + (n_docs - df + 0.5) / (df + 0.5)) for term, df in doc_freq.items()}
+        self._indexed_tools = current
+
+    def score(self, query: str) -> Dict[str, float]:
+        """BM25 relevance of every tool for the query"""
+        self._ensure_index()
+        query_terms = set(self._tokenize(query))
+        scores = {}
+        for name, tf in self._term_freqs.items():
+            norm = self.k1 * (1 - self.b + self.b * self._doc_lengths[name] / max(self._avg_doc_length, 1e-9))
+            scores[name] = sum(
+                self._idf[term] * tf[term] * (self.k1 + 1) / (tf[term] + norm)
+                for term in query_terms if term in tf
+            )
+        return scores
+
+    def _usage_boost(self) -> Dict[str, float]:
+        """Recency-weighted usage counts (most recent use weighs 1.0)"""
+        boost: Dict[str, float] = {}
+        for age, name in enumerate(reversed(self.usage_history)):
+            boost[name] = boost.get(name, 0.0) + self.usage_decay ** age
+        return boost
+
+    def record_usage(self, tool_name: str):
+        """Remember that a tool was used"""
+        self.usage_history.append(tool_name)
+
+    def select(self, query: str, top_k: int) -> List[str]:
+        """Top-k tool names for the query, or every tool when nothing matches"""
+        scores = self.score(query)
+        boost = self._usage_boost()
+        combined = {name: scores[name] + self.usage_weight * boost.get(name, 0.0) for name in scores}
+
+        ranked = [name for name, value in sorted(combined.items(), key=lambda item: item[1], reverse=True) if value > 0]
+        if not ranked:
+            # Nothing to go on - let the model see the full catalog
+            return list(self.registry.tools)
+
+        # Keep registry order so the schema payload stays stable across turns
+        chosen = set(ranked[:top_k])
+        return [name for name in self.registry.tools if name in chosen]
+